@@ -0,0 +1,26 @@
+from config.integrity_checks import check_project_schema
+check_project_schema()
+
+import sys
+import logging
+from config.logger import setup_logger
+import json
+from pathlib import Path
+import os
+from core.batch.orquestador import ejecutar_batch
+
+#Setup de los logs
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+# Cargar configuración
+with open(Path("config/settings.json"), encoding="utf-8") as f:
+    settings = json.load(f)
+base_path = os.path.dirname(os.path.abspath(__file__))
+
+# Uso: python batch.py manifiesto.csv [procesos]
+if __name__ == "__main__":
+    ruta_manifiesto = sys.argv[1] if len(sys.argv) > 1 else input("Manifiesto (csv): ")
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    ejecutar_batch(settings,base_path,ruta_manifiesto,workers)
@@ -0,0 +1,30 @@
+from config.integrity_checks import check_project_schema
+check_project_schema()
+
+import sys
+import logging
+from config.logger import setup_logger
+import json
+from pathlib import Path
+import os
+from core.benchmark.fixtures import paginas_grabadas
+from core.benchmark.medicion import ejecutar_benchmark
+
+#Setup de los logs
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+# Cargar configuración
+with open(Path("config/settings.json"), encoding="utf-8") as f:
+    settings = json.load(f)
+base_path = os.path.dirname(os.path.abspath(__file__))
+
+# Uso: python benchmark.py [rut]
+# Sin rut se usa un estudiante sintético; con rut se reproducen los snapshots
+# grabados de ese estudiante (settings "snapshots")
+if __name__ == "__main__":
+    paginas = None
+    if len(sys.argv) > 1:
+        paginas = paginas_grabadas(os.path.join(base_path, settings["output_dir"], "snapshots"), sys.argv[1])
+    ejecutar_benchmark(settings,base_path,paginas)
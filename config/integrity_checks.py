@@ -7,10 +7,73 @@ def check_project_schema():
             "headless": True,
             "disable_gpu": False,
             "colab_mode": False,
+            "lean_browser": False,
+            "perfil_chrome_dir": "",
+            "grid": {
+                "urls": [],
+                "max_sesiones": 4,
+                "timeout": 300
+                },
+            "reciclaje_navegador": {
+                "max_paginas": 0,
+                "max_rss_mb": 0
+                },
             "output_dir": "data",
             "log_level": "INFO",
             "default_texture": "assets/textures/texture2.jpg",
-            "export_excel": True
+            "export_excel": True,
+            "ucursos_workers": 1,
+            "ucursos_backend": "selenium",
+            "ucursos_prefetch": False,
+            "login_http": False,
+            "ucampus_backend": "selenium",
+            "ub_workers": 1,
+            "ucampus_workers": 1,
+            "pool_pestanas": False,
+            "pipelines_concurrentes": False,
+            "sesiones_persistentes": False,
+            "sesiones_dir": ".sesiones",
+            "timeouts": {
+                "login": 10,
+                "historial": 15,
+                "ub": 10,
+                "recuento": 10,
+                "notas": 10,
+                "actas": 10
+                },
+            "gracia_espera": 0.5,
+            "timeouts_adaptativos": False,
+            "reintentos": {
+                "max_intentos": 3,
+                "espera_base": 1.0,
+                "espera_max": 30.0,
+                "umbral_fallos": 5,
+                "enfriamiento": 30.0,
+                "max_aperturas": 3
+                },
+            "snapshots": False,
+            "ucursos_incremental": False,
+            "ucursos_ventana_periodos": 1,
+            "clasificar_cursos": False,
+            "cache_negativo": False,
+            "cache_negativo_dias": {
+                "abierto": 1,
+                "cerrado": 180,
+                "desconocido": 7
+                },
+            "cache_actas": False,
+            "cache_actas_dir": "cache_actas",
+            "cache_actas_dias": {
+                "abierto": 1,
+                "cerrado": 365,
+                "desconocido": 7
+                },
+            "batch_workers": 2,
+            "batch_credenciales": "config/credenciales.json",
+            "url_ucampus": "https://ucampus.uchile.cl",
+            "url_ucursos": "https://www.u-cursos.cl",
+            "benchmark_backends": ["selenium", "lxml", "http"],
+            "benchmark_latencia": 0.0
             }
         with open("config/settings.json", "w", encoding="utf-8") as f:
             json.dump(settings, f, indent=4)
@@ -0,0 +1,248 @@
+import os
+import re
+import json
+import time
+import pandas as pd
+from pathlib import Path
+from typing import Any, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from core.scrapper.webscrapper import scrapper
+from core.scrapper.excel_exporter import excel_exporter
+from core.cleaner.limpieza_datos import limpiar_datos
+from core.visuals.boleta_acta_milagrosa import create_receipt_with_shadow_and_barcode
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Procesamiento por lotes de estudiantes.
+
+Lee un manifiesto CSV (columnas "rut", "facultad" y opcionalmente "usuario")
+y ejecuta scrapping -> limpieza -> boleta para cada estudiante, varios a la
+vez. Cada estudiante corre en un proceso propio (con su propio ejecutor de un
+solo proceso) y su propio Chrome, de modo que un error, una caída del
+navegador o incluso la muerte del proceso (ej. por falta de memoria) solo
+afecta a ese estudiante.
+
+Las credenciales nunca van en el manifiesto. Se buscan, en orden:
+    1. Variables de entorno UCHILE_USUARIO_<rut> y UCHILE_CLAVE_<rut>, con el
+       rut sin puntos ni guion (ej. UCHILE_CLAVE_123456789).
+    2. Un archivo JSON local (settings "batch_credenciales") con la forma
+       {"<rut>": {"usuario": "...", "clave": "..."}}.
+'''
+
+def _rut_variable(rut: str) -> str:
+    return(re.sub(r"[^0-9kK]", "", rut).upper())
+
+def cargar_manifiesto(ruta: str) -> list[dict[str, str]]:
+    """
+    Read the list of students of a batch.
+
+    Args:
+        ruta (str): Path of a CSV file with the columns "rut", "facultad"
+            (optional, defaults to "fcfm") and "usuario" (optional).
+
+    Returns:
+        list[dict[str, str]]: One dictionary per student, in file order.
+
+    Raises:
+        ValueError: If the file has no "rut" column.
+    """
+    df = pd.read_csv(ruta, dtype=str, keep_default_na=False)
+    df.columns = [columna.strip().lower() for columna in df.columns]
+    if "rut" not in df.columns:
+        raise ValueError(f"El manifiesto {ruta} no tiene columna 'rut'")
+    estudiantes = []
+    for fila in df.to_dict("records"):
+        if not fila["rut"].strip():
+            continue
+        estudiantes.append({
+            "rut": fila["rut"].strip(),
+            "facultad": fila.get("facultad", "").strip() or "fcfm",
+            "usuario": fila.get("usuario", "").strip()
+        })
+    logger.info(f"📂 Manifiesto {ruta}: {len(estudiantes)} estudiantes")
+    return(estudiantes)
+
+def resolver_credenciales(
+    estudiante: dict[str, str],
+    ruta_credenciales: Optional[str] = None
+) -> dict[str, str]:
+    """
+    Build the credentials passed to `scrapper` for a student.
+
+    Environment variables take precedence over the credentials file. The
+    user name of the manifest is used when no other one is found.
+
+    Args:
+        estudiante (dict[str, str]): Entry returned by `cargar_manifiesto`.
+        ruta_credenciales (str, optional): Path of the JSON credentials file.
+
+    Returns:
+        dict[str, str]: The keys "usuario", "clave", "rut" and "facultad".
+
+    Raises:
+        KeyError: If no password is found for the student.
+    """
+    archivo = {}
+    if ruta_credenciales and os.path.exists(ruta_credenciales):
+        with open(ruta_credenciales, encoding="utf-8") as f:
+            archivo = json.load(f).get(estudiante["rut"], {})
+    sufijo = _rut_variable(estudiante["rut"])
+    usuario = os.environ.get(f"UCHILE_USUARIO_{sufijo}") or archivo.get("usuario") or estudiante.get("usuario")
+    clave = os.environ.get(f"UCHILE_CLAVE_{sufijo}") or archivo.get("clave")
+    if not usuario or not clave:
+        raise KeyError(f"No hay credenciales para el rut {estudiante['rut']}")
+    return({
+        "usuario": usuario,
+        "clave": clave,
+        "rut": estudiante["rut"],
+        "facultad": estudiante["facultad"]
+    })
+
+def procesar_estudiante(
+    settings: dict[str, Any],
+    base_path: str,
+    credenciales: dict[str, str]
+) -> dict[str, Any]:
+    """
+    Run scraping, cleaning and the receipt rendering for one student.
+
+    Meant to run inside a worker process. Errors are caught and reported in
+    the result, so a failing student never stops the batch.
+
+    Args:
+        settings (dict[str, Any]): Configuration dictionary.
+        base_path (str): Base path where the output directory resides.
+        credenciales (dict[str, str]): Output of `resolver_credenciales`.
+
+    Returns:
+        dict[str, Any]: Status of the student with the keys "RUT", "Estado"
+        ("ok" or "error"), "Etapa" (last stage reached), "Segundos" (total
+        time), the time of every stage and "Error".
+    """
+    rut = credenciales["rut"]
+    salida = os.path.join(base_path, Path(settings["output_dir"]))
+    resultado = {"RUT": rut, "Estado": "ok", "Etapa": "", "Segundos": 0.0, "Error": ""}
+    inicio = time.perf_counter()
+    etapa_inicio = inicio
+    try:
+        resultado["Etapa"] = "scrapping"
+        scrapper(settings, base_path, credenciales=credenciales)
+        resultado["Segundos scrapping"] = round(time.perf_counter() - etapa_inicio, 1)
+
+        resultado["Etapa"] = "limpieza"
+        etapa_inicio = time.perf_counter()
+        limpiar_datos(settings, base_path, rut)
+        resultado["Segundos limpieza"] = round(time.perf_counter() - etapa_inicio, 1)
+
+        resultado["Etapa"] = "boleta"
+        etapa_inicio = time.perf_counter()
+        df = pd.read_excel(os.path.join(salida, f"clean_data_{rut}.xlsx"), sheet_name="Acta_Milagrosa")
+        create_receipt_with_shadow_and_barcode(
+            df,
+            texture_path=settings.get("default_texture", "assets/textures/texture2.jpg"),
+            barcode_text="Acta Milagrosa",
+            output_path=os.path.join(salida, f"receipt_{rut}.png")
+        )
+        resultado["Segundos boleta"] = round(time.perf_counter() - etapa_inicio, 1)
+    except Exception as e:
+        logger.exception(f"❌ Error procesando rut {rut} en etapa {resultado['Etapa']}")
+        resultado["Estado"] = "error"
+        resultado["Error"] = f"{type(e).__name__}: {e}"
+    resultado["Segundos"] = round(time.perf_counter() - inicio, 1)
+    return(resultado)
+
+def procesar_aislado(
+    settings: dict[str, Any],
+    base_path: str,
+    credenciales: dict[str, str]
+) -> dict[str, Any]:
+    """
+    Run `procesar_estudiante` in a process of its own.
+
+    Every student gets a single-process executor, so if the process dies
+    abruptly (out of memory, native crash) only this executor breaks
+    (`BrokenProcessPool` is raised here) and the other students are not
+    affected.
+
+    Args:
+        settings (dict[str, Any]): Configuration dictionary.
+        base_path (str): Base path where the output directory resides.
+        credenciales (dict[str, str]): Output of `resolver_credenciales`.
+
+    Returns:
+        dict[str, Any]: Result of `procesar_estudiante`.
+    """
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return(executor.submit(procesar_estudiante, settings, base_path, credenciales).result())
+
+def ejecutar_batch(
+    settings: dict[str, Any],
+    base_path: str,
+    ruta_manifiesto: str,
+    workers: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Process every student of a manifest concurrently and export a report.
+
+    Each student runs in its own process (`procesar_aislado`) with a single
+    Chrome instance, `workers` students at a time, so "ucursos_workers" is
+    forced to 1 inside the batch. A student whose process dies is reported
+    as failed at the "proceso" stage; the rest keep running. Students without credentials are reported as errors without
+    being started. The report is written to "reporte_batch.xlsx" in the
+    output directory.
+
+    Args:
+        settings (dict[str, Any]): Configuration dictionary. Uses
+            "batch_workers" and "batch_credenciales".
+        base_path (str): Base path where the output directory resides.
+        ruta_manifiesto (str): Path of the CSV manifest.
+        workers (int, optional): Number of worker processes. Defaults to
+            settings["batch_workers"].
+
+    Returns:
+        pandas.DataFrame: One row per student with status and timings.
+    """
+    workers = workers or settings.get("batch_workers", 2)
+    ruta_credenciales = settings.get("batch_credenciales")
+    if ruta_credenciales:
+        ruta_credenciales = os.path.join(base_path, ruta_credenciales)
+    settings_batch = settings | {"ucursos_workers": 1}
+
+    resultados = []
+    pendientes = []
+    for estudiante in cargar_manifiesto(ruta_manifiesto):
+        try:
+            pendientes.append(resolver_credenciales(estudiante, ruta_credenciales))
+        except KeyError as e:
+            logger.warning(f"⚠️ {e.args[0]}")
+            resultados.append({"RUT": estudiante["rut"], "Estado": "error", "Etapa": "credenciales",
+                               "Segundos": 0.0, "Error": e.args[0]})
+
+    logger.info(f"🚀 Batch de {len(pendientes)} estudiantes con {workers} procesos")
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futuros = {
+            executor.submit(procesar_aislado, settings_batch, base_path, credenciales): credenciales["rut"]
+            for credenciales in pendientes
+        }
+        for futuro in as_completed(futuros):
+            rut = futuros[futuro]
+            try:
+                resultado = futuro.result()
+            except Exception as e:  # El proceso de este estudiante murió (ej. sin memoria)
+                resultado = {"RUT": rut, "Estado": "error", "Etapa": "proceso", "Segundos": 0.0,
+                             "Error": f"{type(e).__name__}: {e}"}
+            resultados.append(resultado)
+            icono = "✅" if resultado["Estado"] == "ok" else "❌"
+            logger.info(f"{icono} {rut}: {resultado['Estado']} ({resultado['Segundos']}s) {resultado['Error']}")
+
+    reporte = pd.DataFrame(resultados)
+    correctos = int((reporte["Estado"] == "ok").sum()) if not reporte.empty else 0
+    logger.info(f"📊 Batch terminado en {time.perf_counter() - inicio:.1f}s: {correctos}/{len(reporte)} estudiantes ok")
+    excel_exporter("reporte_batch", os.path.join(base_path, Path(settings["output_dir"])), {"Reporte": reporte})
+    return(reporte)
@@ -0,0 +1,356 @@
+import time
+import random
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from html import escape
+from urllib.parse import urlsplit, parse_qs
+from core.scrapper.snapshots import AlmacenSnapshots
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Servidor local de fixtures.
+
+Reemplaza a ucampus y u-cursos para poder ejecutar scrapper() sin red ni
+credenciales reales. Cada sitio se sirve en su propio puerto de 127.0.0.1
+(así las rutas absolutas como /m/fcfm_bia/recuento_uds funcionan igual que en
+el sitio real) y tiene su propio formulario de login, que acepta cualquier
+usuario y clave no vacíos.
+
+Las páginas son un diccionario {sitio: {ruta: html}}, con la ruta incluyendo
+el query string. Se pueden generar con paginas_sinteticas o tomarse de los
+snapshots grabados en una corrida real (paginas_grabadas). Los enlaces
+absolutos a los sitios reales se reescriben al servidor local al responder.
+'''
+
+SITIOS = {
+    "ucampus": "https://ucampus.uchile.cl",
+    "ucursos": "https://www.u-cursos.cl"
+}
+
+PAGINA_LOGIN = """<html><body>
+<form method="post" action="/login">
+<input type="hidden" name="next" value="{siguiente}">
+<input type="text" name="username">
+<input type="password" name="password">
+<input type="submit" value="Ingresar">
+</form>
+</body></html>"""
+
+class _ManejadorFixtures(BaseHTTPRequestHandler):
+    server: "_ServidorSitio"
+
+    def log_message(self, *args) -> None:
+        pass  # Los accesos se cuentan, no se registran
+
+    def _responder(self, estado: int, html: str = "", cabeceras: Optional[dict[str, str]] = None) -> None:
+        contenido = html.encode("utf-8")
+        self.send_response(estado)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(contenido)))
+        for nombre, valor in (cabeceras or {}).items():
+            self.send_header(nombre, valor)
+        self.end_headers()
+        self.wfile.write(contenido)
+
+    def do_GET(self) -> None:
+        servidor = self.server
+        if f"{servidor.cookie}=1" not in (self.headers.get("Cookie") or ""):
+            servidor.contar("login")
+            self._responder(200, PAGINA_LOGIN.format(siguiente=escape(self.path)))
+            return
+        html = servidor.buscar(self.path)
+        if html is None:
+            self._responder(404, "<html><body>404</body></html>")
+            return
+        if servidor.latencia:
+            time.sleep(servidor.latencia)
+        servidor.contar("paginas")
+        self._responder(200, servidor.reescribir(html))
+
+    def do_POST(self) -> None:
+        largo = int(self.headers.get("Content-Length", 0))
+        datos = parse_qs(self.rfile.read(largo).decode("utf-8"))
+        if urlsplit(self.path).path != "/login" or not datos.get("username") or not datos.get("password"):
+            self.server.contar("login")
+            self._responder(200, PAGINA_LOGIN.format(siguiente="/"))
+            return
+        siguiente = datos.get("next", ["/"])[0]
+        self._responder(303, cabeceras={
+            "Location": siguiente if siguiente.startswith("/") else "/",
+            "Set-Cookie": f"{self.server.cookie}=1; Path=/"
+        })
+
+class _ServidorSitio(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, sitio: str, paginas: dict[str, str], fixtures: "ServidorFixtures"):
+        super().__init__(("127.0.0.1", 0), _ManejadorFixtures)
+        self.sitio = sitio
+        self.cookie = f"fixture_sesion_{sitio}"
+        self.paginas = paginas
+        self.fixtures = fixtures
+
+    @property
+    def latencia(self) -> float:
+        return(self.fixtures.latencia)
+
+    def buscar(self, ruta: str) -> Optional[str]:
+        # Ruta exacta (con query) o, si no está, la misma ruta sin query
+        return(self.paginas.get(ruta, self.paginas.get(urlsplit(ruta).path)))
+
+    def reescribir(self, html: str) -> str:
+        for sitio, url_original in SITIOS.items():
+            html = html.replace(url_original, self.fixtures.urls[sitio])
+        return(html)
+
+    def contar(self, tipo: str) -> None:
+        self.fixtures.contar(self.sitio, tipo)
+
+class ServidorFixtures:
+    """
+    Local HTTP stand-in for U-Campus and U-Cursos.
+
+    Every site is served by its own threaded HTTP server on a free port of
+    127.0.0.1, started in background threads. Use it as a context manager or
+    call `iniciar` and `detener`.
+
+    Args:
+        paginas (dict[str, dict[str, str]]): Pages of every site ("ucampus",
+            "ucursos"), keyed by route (path plus query string).
+        latencia (float, optional): Seconds added before answering every
+            page, to emulate the response time of the real servers.
+            Defaults to 0.
+    """
+
+    def __init__(self, paginas: dict[str, dict[str, str]], latencia: float = 0.0):
+        self.paginas = paginas
+        self.latencia = latencia
+        self.urls = {}
+        self._servidores = []
+        self._contadores = Counter()
+        self._lock = threading.Lock()
+
+    def iniciar(self) -> "ServidorFixtures":
+        """
+        Start the servers. `urls` maps every site to its local base URL.
+
+        Returns:
+            ServidorFixtures: The server itself.
+        """
+        for sitio in SITIOS:
+            servidor = _ServidorSitio(sitio, self.paginas.get(sitio, {}), self)
+            self.urls[sitio] = f"http://127.0.0.1:{servidor.server_port}"
+            threading.Thread(target=servidor.serve_forever, daemon=True).start()
+            self._servidores.append(servidor)
+        logger.info(f"🚀 Servidor de fixtures en {self.urls['ucampus']} (ucampus) y {self.urls['ucursos']} (ucursos)")
+        return(self)
+
+    def detener(self) -> None:
+        """Stop the servers."""
+        for servidor in self._servidores:
+            servidor.shutdown()
+            servidor.server_close()
+        self._servidores = []
+
+    def __enter__(self) -> "ServidorFixtures":
+        return(self.iniciar())
+
+    def __exit__(self, *args) -> None:
+        self.detener()
+
+    def contar(self, sitio: str, tipo: str) -> None:
+        """Count a response of a site ("paginas" or "login")."""
+        with self._lock:
+            self._contadores[(sitio, tipo)] += 1
+
+    def contadores(self, reiniciar: bool = False) -> dict[tuple[str, str], int]:
+        """
+        Return the number of responses by (site, type) since the start or the
+        last reset.
+
+        Args:
+            reiniciar (bool, optional): Reset the counters after reading them.
+                Defaults to False.
+
+        Returns:
+            dict[tuple[str, str], int]: Responses by site and type ("paginas"
+            for fixture pages, "login" for login forms).
+        """
+        with self._lock:
+            contadores = dict(self._contadores)
+            if reiniciar:
+                self._contadores.clear()
+        return(contadores)
+
+def _pagina(cuerpo: str) -> str:
+    return(f"<html><head><title>Fixture</title></head><body>{cuerpo}</body></html>")
+
+def _tabla(encabezados: list[str], filas: list[list[str]], atributos: str = "") -> str:
+    thead = "".join(f"<th>{encabezado}</th>" for encabezado in encabezados)
+    tbody = "".join("<tr>" + "".join(f"<td>{celda}</td>" for celda in fila) + "</tr>" for fila in filas)
+    return(f"<table {atributos}><thead><tr>{thead}</tr></thead><tbody>{tbody}</tbody></table>")
+
+def _historial(azar: random.Random, periodos: list[str], cursos_por_periodo: list[list[str]]) -> str:
+    indicadores = "".join(
+        f"<dt>{nombre}</dt><dd>{valor}</dd>"
+        for nombre, valor in (("Carrera", "Ingeniería Civil"), ("Ingreso", periodos[0]), ("Avance", "80%"))
+    )
+    filas = "<tr><th>Periodo</th><th>CRA / CAR</th><th></th><th>Cursos</th></tr>"
+    for periodo, cursos in zip(periodos, cursos_por_periodo):
+        celdas = "".join(f"<td>{curso} 6 - {azar.uniform(4, 7):.1f}</td>" for curso in cursos)
+        filas += f"<tr><td>{periodo}</td><td>{azar.uniform(4, 7):.2f}<br>100%</td><td>&nbsp;</td>{celdas}</tr>"
+    dictados = "<tr><td colspan='4'>2024</td></tr>" + "".join(
+        f"<tr><td>{i}</td><td>Curso dictado {i}<br>CC{3000 + i}</td><td>Otoño</td><td>Auxiliar</td></tr>"
+        for i in range(1, 4)
+    )
+    return(_pagina(
+        '<div id="navigation-wrapper"></div>'
+        f'<dl id="indicadores">{indicadores}</dl>'
+        f'<div id="resumen" style="display:none"><table>{filas}</table></div>'
+        '<h2 id="cursos_dictados">Cursos Dictados</h2>'
+        '<table><thead><tr><th>Nº</th><th>Curso</th><th>Semestre</th><th>Cargo</th></tr></thead>'
+        f'<tbody>{dictados}</tbody></table>'
+        '<h2>Exámenes de Grado y/o Título</h2>'
+        + _tabla(["Examen / Título", "Fecha", "Nota", "Profesor Guía"],
+                 [["Examen de Título", "01/12/2024", "6.5", "Profesora Guía"]])
+    ))
+
+def _pagina_ub(azar: random.Random, years: list[str], year: str) -> str:
+    opciones = "".join(
+        f'<option value="{y}"{" selected" if y == year else ""}>{y}</option>' for y in years
+    )
+    meses = [[mes, f"{azar.randint(5, 40)}", "Pagada"] for mes in ("Marzo", "Abril", "Mayo", "Junio")]
+    return(_pagina(
+        '<div id="navigation-wrapper"></div>'
+        '<form method="get" action="/m/fcfm_unidades_becarias/becas_alumno">'
+        f'<select id="ano" name="ano">{opciones}</select></form>'
+        '<div id="ano_chosen" class="chosen-container"></div>'
+        '<h2>UBs Asignadas</h2>' + _tabla(["Mes", "UBs", "Estado"], meses)
+        + '<h2>UBs Eliminadas</h2>' + _tabla(["Mes", "UBs", "Motivo"], [["Julio", "3", "Renuncia"]])
+    ))
+
+def _recuento(azar: random.Random, cursos: list[str]) -> str:
+    filas = "".join(
+        f"<tr><td>{curso}</td><td>6</td><td>{azar.choice(['Aprobado', 'Convalidado'])}</td></tr>"
+        for curso in cursos
+    )
+    return(_pagina(
+        '<div id="navigation-wrapper"></div>'
+        '<table class="excel"><thead><tr><th>Curso</th><th>UDs</th><th>Estado</th></tr></thead>'
+        f'<tbody id="Plan 2019">{filas}</tbody></table>'
+    ))
+
+def paginas_sinteticas(
+    n_periodos: int = 8,
+    cursos_por_periodo: int = 5,
+    user_id: str = "benchmark",
+    semilla: int = 0
+) -> dict[str, dict[str, str]]:
+    """
+    Generate a synthetic student with the page structure the extractors
+    expect: historial, UB (one page per year), recuento, the U-Cursos home,
+    the course list and the notas and actas page of every course.
+
+    Args:
+        n_periodos (int, optional): Number of semesters. Defaults to 8.
+        cursos_por_periodo (int, optional): Courses per semester. Defaults to
+            5.
+        user_id (str, optional): U-Cursos user id. Defaults to "benchmark".
+        semilla (int, optional): Seed of the random grades. Defaults to 0.
+
+    Returns:
+        dict[str, dict[str, str]]: Pages for `ServidorFixtures`.
+    """
+    azar = random.Random(semilla)
+    semestres = [(2021 + i // 2, 1 + i % 2) for i in range(n_periodos)]
+    periodos = [f"{ano} {'Otoño' if semestre == 1 else 'Primavera'}" for ano, semestre in semestres]
+    cursos = [[f"CC{1000 + 10 * i + j}" for j in range(cursos_por_periodo)] for i in range(n_periodos)]
+    years = sorted({str(ano) for ano, _ in semestres}, reverse=True)
+
+    ucampus = {
+        "/m/fcfm_bia/historial": _historial(azar, periodos, cursos),
+        "/m/medicina_bia/historial": _historial(azar, periodos, cursos),
+        "/m/fcfm_bia/recuento_uds": _recuento(azar, sum(cursos, [])),
+        "/m/medicina_bia/recuento_uds": _recuento(azar, sum(cursos, [])),
+        "/m/fcfm_unidades_becarias/becas_alumno": _pagina_ub(azar, years, years[0])
+    }
+    for year in years:
+        ucampus[f"/m/fcfm_unidades_becarias/becas_alumno?ano={year}"] = _pagina_ub(azar, years, year)
+
+    ucursos = {"/": _pagina(f'<div id="navigation-wrapper" class="usuario.{user_id}"></div>')}
+    celdas = ""
+    for (ano, semestre), codigos in zip(semestres, cursos):
+        for codigo in codigos:
+            ruta = f"/ingenieria/{ano}/{semestre}/{codigo}/1/"
+            celdas += (
+                f'<tr><td class="objetoflex string"><a href="{ruta}">{codigo}</a>'
+                '<div class="cargo cargo-alumno">Alumno</div></td></tr>'
+            )
+            notas = "".join(
+                f"<tr><td><h1>Control {i}</h1></td><td><span>{azar.uniform(1, 7):.1f}</span></td></tr>"
+                for i in range(1, 4)
+            )
+            ucursos[f"{ruta}notas/alumno"] = _pagina(
+                '<div id="navigation-wrapper"></div>'
+                '<table><thead><tr><th>Evaluación</th><th>Promedio</th></tr></thead>'
+                f'<tbody>{notas}<tr class="separador"><td colspan="2"></td></tr></tbody></table>'
+            )
+            ucursos[f"{ruta}actas/"] = _pagina(
+                '<div id="navigation-wrapper"></div>'
+                '<table class="detalle">'
+                f'<tr><th>Nota Final</th><td>{azar.uniform(4, 7):.1f}</td></tr>'
+                f'<tr><th>Promedio del curso</th><td>{azar.uniform(4, 7):.1f}</td></tr>'
+                f'<tr><th>Aprobados</th><td>{azar.randint(20, 90)}</td></tr>'
+                '<tr><th>Observaciones</th></tr></table>'
+            )
+    # Entradas que no son cursos del alumno (deben ignorarse): sin cargo,
+    # ayudantía y comunidad
+    celdas += '<tr><td class="objetoflex string"><a href="/ingenieria/2024/1/CC9999/1/">CC9999</a></td></tr>'
+    celdas += (
+        '<tr><td class="objetoflex string"><a href="/ingenieria/2024/1/CC3001/2/">CC3001</a>'
+        '<div class="cargo cargo-auxiliar">Auxiliar</div></td></tr>'
+        '<tr><td class="objetoflex string"><a href="/ingenieria/comunidad/cadcc/">CaDCC</a>'
+        '<div class="cargo cargo-alumno">Alumno</div></td></tr>'
+    )
+    ucursos[f"/usuario/{user_id}/todos_cursos/"] = _pagina(f"<table>{celdas}</table>")
+    return({"ucampus": ucampus, "ucursos": ucursos})
+
+def paginas_grabadas(directorio: str, rut: str) -> dict[str, dict[str, str]]:
+    """
+    Build the fixture pages from the HTML snapshots recorded for a student
+    (settings "snapshots"), so a real crawl can be replayed offline.
+
+    The latest snapshot of every URL is used. The U-Cursos home is not
+    recorded by the scrapers, so a minimal one carrying the user id of the
+    recorded course list is added.
+
+    Args:
+        directorio (str): Directory of the snapshot store.
+        rut (str): RUT of the recorded student.
+
+    Returns:
+        dict[str, dict[str, str]]: Pages for `ServidorFixtures`.
+    """
+    almacen = AlmacenSnapshots(directorio, rut)
+    ultimas = {entrada["url"]: entrada for entrada in almacen.entradas()}
+    paginas = {sitio: {} for sitio in SITIOS}
+    for url, entrada in ultimas.items():
+        partes = urlsplit(url)
+        sitio = "ucursos" if "u-cursos" in partes.netloc else "ucampus"
+        ruta = partes.path + (f"?{partes.query}" if partes.query else "")
+        paginas[sitio][ruta] = almacen.leer(entrada["sha256"])
+        if entrada["tipo"] == "cursos" and "/usuario/" in partes.path:
+            user_id = partes.path.split("/usuario/")[1].split("/")[0]
+            paginas["ucursos"]["/"] = _pagina(f'<div id="navigation-wrapper" class="usuario.{user_id}"></div>')
+    logger.info(
+        f"📂 {len(paginas['ucampus'])} páginas de ucampus y {len(paginas['ucursos'])} de u-cursos "
+        f"grabadas para {rut}"
+    )
+    return(paginas)
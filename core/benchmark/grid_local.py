@@ -0,0 +1,237 @@
+import sys
+import json
+import threading
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from selenium.webdriver.chrome.service import Service
+from core.scrapper.navegador import resolver_chromedriver
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Grid local de prueba.
+
+Imita un endpoint de Selenium Grid en 127.0.0.1 para probar el modo "grid"
+sin otra máquina: cada POST /session levanta un chromedriver local propio y
+desde ahí en adelante los comandos de esa sesión se reenvían a él; DELETE
+/session/<id> cierra el navegador y el chromedriver. Como un nodo real, no
+abre más de max_sesiones navegadores a la vez: las sesiones nuevas esperan
+en cola a que se libere un cupo.
+
+Uso independiente: python -m core.benchmark.grid_local [puerto] [max_sesiones]
+'''
+
+class _ManejadorGrid(BaseHTTPRequestHandler):
+    server: "_ServidorGrid"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _responder(self, estado: int, cuerpo: bytes, tipo: str = "application/json; charset=utf-8") -> None:
+        self.send_response(estado)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def _error(self, estado: int, error: str, mensaje: str) -> None:
+        cuerpo = {"value": {"error": error, "message": mensaje, "stacktrace": ""}}
+        self._responder(estado, json.dumps(cuerpo).encode("utf-8"))
+
+    def _cuerpo(self) -> bytes:
+        return(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+
+    def _reenviar(self, metodo: str) -> None:
+        partes = self.path.strip("/").split("/")
+        if len(partes) < 2 or partes[0] != "session":
+            self._error(404, "unknown command", f"Ruta no soportada: {self.path}")
+            return
+        servicio = self.server.grid.servicio(partes[1])
+        if servicio is None:
+            self._error(404, "invalid session id", f"Sesión desconocida: {partes[1]}")
+            return
+        respuesta = requests.request(
+            metodo, f"{servicio.service_url}{self.path}", data=self._cuerpo() or None,
+            headers={"Content-Type": "application/json; charset=utf-8"}
+        )
+        if metodo == "DELETE" and len(partes) == 2:
+            self.server.grid.cerrar_sesion(partes[1])
+        self._responder(respuesta.status_code, respuesta.content)
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") == "/status":
+            grid = self.server.grid
+            cuerpo = {"value": {
+                "ready": grid.sesiones_activas < grid.max_sesiones,
+                "message": f"{grid.sesiones_activas}/{grid.max_sesiones} sesiones"
+            }}
+            self._responder(200, json.dumps(cuerpo).encode("utf-8"))
+            return
+        self._reenviar("GET")
+
+    def do_POST(self) -> None:
+        if self.path.rstrip("/") != "/session":
+            self._reenviar("POST")
+            return
+        try:
+            estado, cuerpo = self.server.grid.crear_sesion(self._cuerpo())
+        except Exception as e:
+            logger.exception("❌ El grid local no pudo crear la sesión")
+            self._error(500, "session not created", str(e))
+            return
+        self._responder(estado, cuerpo)
+
+    def do_DELETE(self) -> None:
+        self._reenviar("DELETE")
+
+class _ServidorGrid(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, puerto: int, grid: "GridLocal"):
+        super().__init__(("127.0.0.1", puerto), _ManejadorGrid)
+        self.grid = grid
+
+class GridLocal:
+    """
+    Local stand-in for a Selenium Grid endpoint.
+
+    Use it as a context manager or call `iniciar` and `detener`; `url` is
+    the endpoint to put in settings["grid"]["urls"].
+
+    Args:
+        max_sesiones (int, optional): Browsers open at the same time; new
+            sessions wait for a free slot. Defaults to 2.
+        puerto (int, optional): Port on 127.0.0.1. Defaults to 0 (a free
+            port).
+        chromedriver (str, optional): Path of the chromedriver binary.
+            Defaults to `resolver_chromedriver()`.
+        timeout (float, optional): Seconds a new session waits for a slot.
+            Defaults to 300.
+    """
+
+    def __init__(
+        self,
+        max_sesiones: int = 2,
+        puerto: int = 0,
+        chromedriver: Optional[str] = None,
+        timeout: float = 300.0
+    ):
+        self.max_sesiones = max(max_sesiones, 1)
+        self.puerto = puerto
+        self.chromedriver = chromedriver
+        self.timeout = timeout
+        self.url = None
+        self.maximo_simultaneo = 0
+        self._servicios = {}
+        self._reservadas = 0
+        self._condicion = threading.Condition()
+        self._servidor = None
+
+    @property
+    def sesiones_activas(self) -> int:
+        """Sessions open or being created."""
+        return(self._reservadas)
+
+    def iniciar(self) -> "GridLocal":
+        """
+        Start the endpoint in a background thread.
+
+        Returns:
+            GridLocal: The grid itself.
+        """
+        self.chromedriver = self.chromedriver or resolver_chromedriver()
+        self._servidor = _ServidorGrid(self.puerto, self)
+        self.url = f"http://127.0.0.1:{self._servidor.server_port}"
+        threading.Thread(target=self._servidor.serve_forever, daemon=True).start()
+        logger.info(f"🚀 Grid local en {self.url} con {self.max_sesiones} sesiones")
+        return(self)
+
+    def detener(self) -> None:
+        """Close every open session and stop the endpoint."""
+        for sesion in list(self._servicios):
+            self.cerrar_sesion(sesion)
+        if self._servidor is not None:
+            self._servidor.shutdown()
+            self._servidor.server_close()
+            self._servidor = None
+
+    def __enter__(self) -> "GridLocal":
+        return(self.iniciar())
+
+    def __exit__(self, *args) -> None:
+        self.detener()
+
+    def servicio(self, sesion: str) -> Optional[Service]:
+        """Return the chromedriver service of a session, or None."""
+        with self._condicion:
+            return(self._servicios.get(sesion))
+
+    def crear_sesion(self, cuerpo: bytes) -> tuple[int, bytes]:
+        """
+        Wait for a free slot, start a chromedriver and create the session on
+        it.
+
+        Args:
+            cuerpo (bytes): Body of the POST /session request.
+
+        Returns:
+            tuple[int, bytes]: Status code and body of the chromedriver
+            response.
+
+        Raises:
+            TimeoutError: If no slot was freed within `timeout` seconds.
+        """
+        with self._condicion:
+            if not self._condicion.wait_for(lambda: self._reservadas < self.max_sesiones, self.timeout):
+                raise TimeoutError(f"Sin cupo en el grid local tras {self.timeout:.0f}s")
+            self._reservadas += 1
+            self.maximo_simultaneo = max(self.maximo_simultaneo, self._reservadas)
+        servicio = Service(self.chromedriver)
+        try:
+            servicio.start()
+            respuesta = requests.post(
+                f"{servicio.service_url}/session", data=cuerpo,
+                headers={"Content-Type": "application/json; charset=utf-8"}
+            )
+            sesion = respuesta.json()["value"].get("sessionId") if respuesta.ok else None
+            if sesion is None:
+                raise RuntimeError(respuesta.text)
+        except Exception:
+            servicio.stop()
+            self._liberar()
+            raise
+        with self._condicion:
+            self._servicios[sesion] = servicio
+        return(respuesta.status_code, respuesta.content)
+
+    def cerrar_sesion(self, sesion: str) -> None:
+        """Stop the chromedriver of a session and free its slot."""
+        with self._condicion:
+            servicio = self._servicios.pop(sesion, None)
+        if servicio is None:
+            return
+        try:
+            requests.delete(f"{servicio.service_url}/session/{sesion}", timeout=10)
+        except requests.RequestException:
+            pass
+        servicio.stop()
+        self._liberar()
+
+    def _liberar(self) -> None:
+        with self._condicion:
+            self._reservadas -= 1
+            self._condicion.notify_all()
+
+if __name__ == "__main__":
+    puerto = int(sys.argv[1]) if len(sys.argv) > 1 else 4444
+    max_sesiones = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    with GridLocal(max_sesiones, puerto) as grid:
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
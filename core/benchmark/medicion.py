@@ -0,0 +1,183 @@
+import os
+import time
+import threading
+import pandas as pd
+from pathlib import Path
+from collections import Counter
+from typing import Any, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from core.scrapper.webscrapper import scrapper
+from core.scrapper.excel_exporter import excel_exporter
+from core.benchmark.fixtures import ServidorFixtures, paginas_sinteticas
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Benchmark end-to-end del recorrido.
+
+Ejecuta scrapper() completo contra el servidor de fixtures una vez por
+backend y mide el tiempo total, las páginas servidas por segundo y la
+cantidad de comandos WebDriver (cada find_element, .text, get, etc. es un
+viaje de ida y vuelta al chromedriver). Los demás settings (workers,
+pipelines concurrentes, perfil liviano...) se toman de la configuración, así
+que el mismo benchmark sirve para comparar cualquier optimización.
+'''
+
+# Settings que define cada backend medido
+BACKENDS = {
+    "selenium": {"ucampus_backend": "selenium", "ucursos_backend": "selenium", "login_http": False},
+    "lxml": {"ucampus_backend": "lxml", "ucursos_backend": "selenium", "login_http": False},
+    "prefetch": {"ucampus_backend": "lxml", "ucursos_backend": "selenium", "login_http": False, "ucursos_prefetch": True},
+    "http": {"ucampus_backend": "lxml", "ucursos_backend": "http", "login_http": False},
+    "sin_navegador": {"ucampus_backend": "lxml", "ucursos_backend": "http", "login_http": True}
+}
+
+CREDENCIALES_BENCHMARK = {"usuario": "benchmark", "clave": "benchmark", "rut": "11111111-1", "facultad": "fcfm"}
+
+class ContadorRPC:
+    """
+    Count the WebDriver commands sent by every driver of the process while
+    the context is active.
+
+    All WebDriver and WebElement calls go through `WebDriver.execute`, which
+    is wrapped for the duration of the context.
+    """
+
+    def __init__(self):
+        self.por_comando = Counter()
+        self._lock = threading.Lock()
+        self._original = None
+
+    @property
+    def total(self) -> int:
+        """Total number of commands sent."""
+        return(sum(self.por_comando.values()))
+
+    def __enter__(self) -> "ContadorRPC":
+        original = WebDriver.execute
+        contador = self
+
+        def execute(driver, driver_command, params=None):
+            with contador._lock:
+                contador.por_comando[driver_command] += 1
+            return(original(driver, driver_command, params))
+
+        self._original = original
+        WebDriver.execute = execute
+        return(self)
+
+    def __exit__(self, *args) -> None:
+        WebDriver.execute = self._original
+
+def medir_backend(
+    settings: dict[str, Any],
+    base_path: str,
+    servidor: ServidorFixtures,
+    backend: str
+) -> dict[str, Any]:
+    """
+    Run a full scrape against the fixture server with one backend.
+
+    Snapshots, stored sessions, incremental mode, the negative cache and
+    the shared acta cache are disabled so every run crawls every page. The
+    output files go to "<output_dir>/benchmark".
+
+    Args:
+        settings (dict[str, Any]): Configuration dictionary.
+        base_path (str): Base path where the output directory resides.
+        servidor (ServidorFixtures): A started fixture server.
+        backend (str): Key of `BACKENDS`.
+
+    Returns:
+        dict[str, Any]: "Backend", "Estado", "Segundos", "Páginas",
+        "Páginas/s", "Logins", "RPC WebDriver", "RPC por página", the most
+        frequent commands and "Error".
+    """
+    settings_backend = settings | BACKENDS[backend] | {
+        "url_ucampus": servidor.urls["ucampus"],
+        "url_ucursos": servidor.urls["ucursos"],
+        "output_dir": str(Path(settings["output_dir"]) / "benchmark"),
+        "snapshots": False,
+        "sesiones_persistentes": False,
+        "ucursos_incremental": False,
+        "cache_negativo": False,
+        "cache_actas": False
+    }
+    servidor.contadores(reiniciar=True)
+    estado, error = "ok", ""
+    with ContadorRPC() as rpc:
+        inicio = time.perf_counter()
+        try:
+            scrapper(settings_backend, base_path, credenciales=CREDENCIALES_BENCHMARK)
+        except Exception as e:
+            logger.exception(f"❌ Falló el benchmark del backend {backend}")
+            estado, error = "error", f"{type(e).__name__}: {e}"
+        segundos = time.perf_counter() - inicio
+
+    contadores = servidor.contadores()
+    paginas = sum(cantidad for (_, tipo), cantidad in contadores.items() if tipo == "paginas")
+    logins = sum(cantidad for (_, tipo), cantidad in contadores.items() if tipo == "login")
+    resultado = {
+        "Backend": backend,
+        "Estado": estado,
+        "Segundos": round(segundos, 2),
+        "Páginas": paginas,
+        "Páginas/s": round(paginas / segundos, 2) if segundos else 0.0,
+        "Logins": logins,
+        "RPC WebDriver": rpc.total,
+        "RPC por página": round(rpc.total / paginas, 1) if paginas else 0.0,
+        "Comandos frecuentes": ", ".join(f"{comando}={n}" for comando, n in rpc.por_comando.most_common(5)),
+        "Error": error
+    }
+    logger.info(
+        f"📊 {backend}: {resultado['Segundos']}s, {paginas} páginas ({resultado['Páginas/s']} pág/s), "
+        f"{rpc.total} RPC WebDriver"
+    )
+    return(resultado)
+
+def ejecutar_benchmark(
+    settings: dict[str, Any],
+    base_path: str,
+    paginas: Optional[dict[str, dict[str, str]]] = None,
+    backends: Optional[list[str]] = None,
+    latencia: Optional[float] = None
+) -> pd.DataFrame:
+    """
+    Measure the end-to-end crawl of every backend offline and export a
+    report to "reporte_benchmark.xlsx" in the output directory.
+
+    Args:
+        settings (dict[str, Any]): Configuration dictionary. Uses
+            "benchmark_backends" and "benchmark_latencia".
+        base_path (str): Base path where the output directory resides.
+        paginas (dict[str, dict[str, str]], optional): Fixture pages (see
+            `fixtures.paginas_grabadas`). Defaults to a synthetic student
+            (`fixtures.paginas_sinteticas`).
+        backends (list[str], optional): Keys of `BACKENDS` to measure.
+            Defaults to settings["benchmark_backends"].
+        latencia (float, optional): Seconds the server waits before every
+            page. Defaults to settings["benchmark_latencia"].
+
+    Returns:
+        pandas.DataFrame: One row per backend (see `medir_backend`).
+    """
+    paginas = paginas or paginas_sinteticas()
+    backends = backends or settings.get("benchmark_backends", list(BACKENDS))
+    if latencia is None:
+        latencia = settings.get("benchmark_latencia", 0.0)
+    desconocidos = [backend for backend in backends if backend not in BACKENDS]
+    if desconocidos:
+        raise ValueError(f"Backends desconocidos: {desconocidos}. Disponibles: {list(BACKENDS)}")
+
+    logger.info(f"🚀 Benchmark de {len(backends)} backends con latencia {latencia}s por página")
+    with ServidorFixtures(paginas, latencia) as servidor:
+        reporte = pd.DataFrame([medir_backend(settings, base_path, servidor, backend) for backend in backends])
+
+    salida = os.path.join(base_path, Path(settings["output_dir"]))
+    os.makedirs(salida, exist_ok=True)
+    excel_exporter("reporte_benchmark", salida, {"Benchmark": reporte})
+    return(reporte)
@@ -4,8 +4,9 @@ import os
 from pathlib import Path
 import logging
 from config.logger import setup_logger
-from typing import Any
+from typing import Any, Optional
 from core.cleaner.acta_milagrosa import get_acta_milagrosa_data
+from core.scrapper.cache_actas import CacheActas
 
 setup_logger() 
 logger = logging.getLogger(__name__)
@@ -165,7 +166,8 @@ def limpiar_recuento(
     return(df_dict)    
 
 def limpiar_actas_ucursos(
-    df_dict: dict[str, pd.DataFrame]
+    df_dict: dict[str, pd.DataFrame],
+    cache_actas: Optional[CacheActas] = None
     ) -> dict[str, pd.DataFrame]:
     """
     Clean and restructure the "Actas_ucursos" DataFrame within the input
@@ -177,6 +179,11 @@ def limpiar_actas_ucursos(
     name. The "Periodo" column is formatted as "<Año> <Semestre>" with
     the semester expressed as "Otoño", "Primavera", or "Verano".
 
+    With a shared acta cache, the acta of every course of the student (the
+    course URLs of "Actas_ucursos" and "Notas_ucursos") is read from the
+    cache, and the rows of the "Actas_ucursos" sheet are only used for the
+    courses that are not cached.
+
     Args:
         df_dict (dict[str, pd.DataFrame]): A dictionary of DataFrames that
             must include a key "Actas_ucursos" with columns:
@@ -184,6 +191,9 @@ def limpiar_actas_ucursos(
             - "Indicador": Indicator name.
             - "Valor": Indicator value.
             - "Estadísticas del Curso": (dropped in cleaning).
+        cache_actas (CacheActas, optional): Shared acta cache (see
+            `core.scrapper.cache_actas`). Defaults to None (only the sheet is
+            used).
 
     Returns:
         dict[str, pandas.DataFrame]: The updated dictionary where the
@@ -199,6 +209,18 @@ def limpiar_actas_ucursos(
         DataFrame lacks the expected columns.
     """
     ## LIMPIEZA ACTA DE UCURSOS
+    if cache_actas is not None:
+        actas = df_dict["Actas_ucursos"]
+        cursos = list(actas["Curso URL"])
+        if "Notas_ucursos" in df_dict:
+            cursos += list(df_dict["Notas_ucursos"]["Curso URL"])
+        cursos = list(dict.fromkeys(cursos))
+        filas, faltantes = cache_actas.filas(cursos)
+        logger.info(f"ℹ️️ {len(cursos) - len(faltantes)} de {len(cursos)} actas tomadas del caché compartido")
+        df_dict["Actas_ucursos"] = pd.concat(
+            [pd.DataFrame(filas, columns=["Curso URL", "Indicador", "Valor"]), actas[actas["Curso URL"].isin(faltantes)]],
+            ignore_index=True
+        )
     df_dict["Actas_ucursos"] = df_dict["Actas_ucursos"].pivot(index="Curso URL", columns="Indicador", values="Valor").reset_index().drop(columns=["Estadísticas del Curso"])
     df_dict["Actas_ucursos"]["Codigo_curso"] = df_dict["Actas_ucursos"]["Curso URL"].apply(lambda x: x.split("/")[-3])
     df_dict["Actas_ucursos"]["Año"] = df_dict["Actas_ucursos"]["Curso URL"].apply(lambda x: x.split("/")[4]).astype(int)
@@ -584,6 +606,8 @@ def limpiar_datos(
         settings (dict[str, Any]): Configuration dictionary containing at least
             the key ``"output_dir"`` specifying the folder where input/output
             files are located.
+            With ``"cache_actas"`` the actas are read from the shared acta
+            cache in ``"cache_actas_dir"``.
         base_path (str): Base path where the output directory resides.
 
     Returns:
@@ -596,7 +620,13 @@ def limpiar_datos(
     ## LIMPIEZA DE DATOS                  
     df_dict = load_scrapped_data(settings,base_path,rut)
     df_dict = limpiar_recuento(df_dict)
-    df_dict = limpiar_actas_ucursos(df_dict)
+    cache_actas = None
+    if settings.get("cache_actas", False):
+        cache_actas = CacheActas(
+            os.path.join(base_path, Path(settings["output_dir"]), settings.get("cache_actas_dir", "cache_actas")),
+            settings.get("cache_actas_dias")
+        )
+    df_dict = limpiar_actas_ucursos(df_dict, cache_actas)
     df_dict = limpiar_notas_ucursos(df_dict)
     df_dict = limpiar_tabla_notas(df_dict)
     df_dict = limpiar_indicadores_titulo(df_dict)
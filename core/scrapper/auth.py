@@ -1,11 +1,12 @@
 import logging
-import time
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webdriver import WebDriver
-from typing import Tuple
+from typing import Callable, Optional, Tuple
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from config.logger import setup_logger
+from core.scrapper.esperas import esperar
+from core.scrapper.sesiones import AlmacenSesiones
 
 setup_logger() 
 logger = logging.getLogger(__name__)
@@ -26,6 +27,8 @@ def login_generic(
     password, and submit fields based on the given selectors, enters the
     credentials, and submits the form. After submission, it waits until an
     element defined in `success_check` is located to confirm successful login.
+    Both waits use the shared wait layer (`esperas.esperar`) with the "login"
+    time budget, so they return as soon as the elements are present.
     If any step fails, the exception is logged.
 
     Args:
@@ -53,12 +56,9 @@ def login_generic(
     try:
         logger.info("🔁 Navegando a página de login...")
         driver.get(url)
-        time.sleep(3)
 
         logger.info("🔎 Esperando campo de usuario...")
-        username_field = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((selectors["username"]))
-        )
+        username_field = esperar(driver, "login", [selectors["username"]], solo_objetivos=True)
         logger.debug("ℹ️️ Campo usuario encontrado")
 
         password_field = driver.find_element(*selectors["password"])
@@ -76,10 +76,152 @@ def login_generic(
         submit_button.click()
         logger.info("📌 Credenciales ingresadas")
 
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located(success_check)
-        )
+        esperar(driver, "login", [success_check], solo_objetivos=True)
         logger.info("✅ Login exitoso")
 
     except Exception as e:
         logger.exception("❌ Fallo durante el login")
+
+
+def login_con_sesion(
+    driver: WebDriver,
+    url: str,
+    username: str,
+    password: str,
+    selectors: dict,
+    success_check: Tuple[str,str],
+    almacen: Optional[AlmacenSesiones] = None
+) -> None:
+    """
+    Log in reusing a stored session when possible.
+
+    If `almacen` has cookies for the site of `url`, they are loaded into the
+    driver and `url` is opened: when the page shows `success_check` the
+    session is still valid and no login is done. Otherwise (no session,
+    expired cookies or no store) `login_generic` is called, and after a
+    successful login the new cookies are saved in the store.
+
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance.
+        url (str): The URL of the login page (a page that requires login).
+        username (str): The username credential for login.
+        password (str): The password credential for login.
+        selectors (dict): Locators of the login form (see `login_generic`).
+        success_check (Tuple[str, str]): Locator of an element only present
+            when logged in.
+        almacen (AlmacenSesiones, optional): Encrypted session store. If
+            None, this is the same as `login_generic`.
+
+    Returns:
+        None
+    """
+    sitio = urlsplit(url).netloc
+    if almacen is not None:
+        cookies = almacen.cargar(sitio)
+        if cookies:
+            try:
+                partes = urlsplit(url)
+                driver.get(f"{partes.scheme}://{partes.netloc}/")
+                for cookie in cookies:
+                    cookie.pop("sameSite", None)
+                    driver.add_cookie(cookie)
+                driver.get(url)
+                esperar(driver, "login", [success_check, selectors["username"]], solo_objetivos=True)
+                if driver.find_elements(*success_check):
+                    logger.info(f"✅ Sesión reutilizada en {sitio}")
+                    return
+                logger.info(f"ℹ️️ Sesión guardada de {sitio} expirada, se hace login")
+            except Exception:
+                logger.warning(f"⚠️ No se pudo reutilizar la sesión de {sitio}, se hace login")
+            driver.delete_all_cookies()
+            almacen.borrar(sitio)
+
+    login_generic(driver, url, username, password, selectors, success_check)
+
+    if almacen is not None and driver.find_elements(*success_check):
+        almacen.guardar(sitio, driver.get_cookies())
+
+def copiar_sesion(origen: WebDriver, destino: WebDriver) -> None:
+    """
+    Copy the authenticated session of one WebDriver into another one.
+
+    The cookies visible on the current page of `origen` are read and added to
+    `destino`. Since Selenium only accepts cookies for the domain currently
+    loaded, `destino` first visits the root of the same site, receives the
+    cookies and then navigates to the page `origen` is showing, so it starts
+    from the same authenticated state without going through the login form.
+
+    Args:
+        origen (WebDriver): An already authenticated WebDriver instance.
+        destino (WebDriver): The WebDriver instance that receives the session.
+
+    Returns:
+        None
+
+    Raises:
+        Exception: If navigation or cookie insertion fails in `destino`.
+    """
+    url = origen.current_url
+    partes = urlsplit(url)
+    destino.get(f"{partes.scheme}://{partes.netloc}/")
+    for cookie in origen.get_cookies():
+        cookie.pop("sameSite", None)
+        destino.add_cookie(cookie)
+    destino.get(url)
+    logger.debug(f"ℹ️️ Sesión copiada a nuevo driver ({partes.netloc})")
+
+def crear_pool_sesiones(
+    driver: WebDriver,
+    n: int,
+    crear_driver: Callable[[], WebDriver]
+) -> list[WebDriver]:
+    """
+    Create `n` additional WebDriver instances sharing the session of `driver`.
+
+    The new browsers are launched concurrently with `crear_driver` and receive
+    the cookies of the authenticated `driver` through `copiar_sesion`, so the
+    login is performed only once. If any of the new drivers fails to start,
+    the ones already created are closed and the exception is raised.
+
+    Args:
+        driver (WebDriver): An authenticated WebDriver instance.
+        n (int): Number of additional drivers to create.
+        crear_driver (Callable[[], WebDriver]): Factory that returns a new,
+            unauthenticated WebDriver (e.g. a configured `get_chrome_driver`).
+
+    Returns:
+        list[WebDriver]: The new authenticated WebDriver instances.
+
+    Raises:
+        Exception: If a driver cannot be created or the session cannot be
+        copied. The exception is logged before being raised.
+    """
+    if n <= 0:
+        return([])
+
+    def _nuevo_driver() -> WebDriver:
+        nuevo = crear_driver()
+        try:
+            copiar_sesion(driver, nuevo)
+        except Exception:
+            nuevo.quit()
+            raise
+        return(nuevo)
+
+    logger.info(f"🚀 Creando {n} sesiones adicionales...")
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        futuros = [executor.submit(_nuevo_driver) for _ in range(n)]
+    drivers = []
+    errores = []
+    for futuro in futuros:
+        try:
+            drivers.append(futuro.result())
+        except Exception as e:
+            errores.append(e)
+    if errores:
+        logger.error(f"❌ No se pudieron crear {len(errores)} de {n} sesiones adicionales")
+        for nuevo in drivers:
+            nuevo.quit()
+        raise errores[0]
+    logger.info(f"✅ {n} sesiones adicionales listas")
+    return(drivers)
@@ -0,0 +1,130 @@
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime
+from typing import Optional
+from core.scrapper.cache_base import vigencia_por_periodo, CachePorProceso
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Caché compartido de actas de cursos.
+
+El acta de u-cursos (<curso>/actas/) describe la sección del curso, no al
+estudiante: en un batch de una cohorte decenas de estudiantes comparten la
+misma sección y su acta se descargaba y parseaba una vez por cada uno. Las
+filas de cada acta se guardan en un archivo JSON por URL del curso dentro de
+un directorio común a todos los RUT, así la primera corrida que la visita la
+deja disponible para las demás. Cada archivo se escribe en un temporal y se
+reemplaza de forma atómica, de modo que los procesos del batch pueden leer y
+escribir el directorio al mismo tiempo sin bloqueos. Las actas de periodos
+cerrados casi no cambian y se reutilizan por meses; las de cursos en curso
+vencen al día siguiente.
+'''
+
+DIAS_POR_DEFECTO = {
+    "abierto": 1,
+    "cerrado": 365,
+    "desconocido": 7
+}
+
+class CacheActas:
+    """
+    Directory of acta records shared by every student, one JSON file per
+    course URL.
+
+    Args:
+        directorio (str): Directory of the cache. Created on the first write.
+        dias (dict[str, float], optional): Time to live by kind of course
+            (see `cache_base.vigencia_por_periodo`), merged over
+            `DIAS_POR_DEFECTO`.
+    """
+
+    def __init__(self, directorio: str, dias: Optional[dict[str, float]] = None):
+        self.directorio = directorio
+        self.dias = DIAS_POR_DEFECTO | (dias or {})
+
+    def _ruta(self, curso_url: str) -> str:
+        nombre = hashlib.sha256(curso_url.encode("utf-8")).hexdigest()[:32]
+        return(os.path.join(self.directorio, f"{nombre}.json"))
+
+    def obtener(self, curso_url: str) -> Optional[list[dict[str, str]]]:
+        """
+        Return the cached acta of a course.
+
+        Args:
+            curso_url (str): URL of the course.
+
+        Returns:
+            list[dict[str, str]] | None: The records returned by the acta
+            extractors ("Curso URL", "Indicador", "Valor"), or None if the
+            course is not cached, the entry expired or the file is
+            unreadable.
+        """
+        try:
+            with open(self._ruta(curso_url), encoding="utf-8") as f:
+                entrada = json.load(f)
+        except FileNotFoundError:
+            return(None)
+        except (OSError, ValueError):
+            logger.warning(f"⚠️ Acta en caché ilegible para {curso_url}, se vuelve a descargar")
+            return(None)
+        if entrada.get("curso_url") != curso_url or entrada["expira"] <= datetime.now().isoformat(timespec="seconds"):
+            return(None)
+        return(entrada["filas"])
+
+    def guardar(self, curso_url: str, filas: list[dict[str, str]]) -> None:
+        """
+        Store the acta of a course, replacing the previous entry.
+
+        Args:
+            curso_url (str): URL of the course.
+            filas (list[dict[str, str]]): Records returned by the acta
+                extractors.
+        """
+        ahora = datetime.now()
+        entrada = {
+            "curso_url": curso_url,
+            "fecha": ahora.isoformat(timespec="seconds"),
+            "expira": (ahora + vigencia_por_periodo(curso_url, self.dias)).isoformat(timespec="seconds"),
+            "filas": filas
+        }
+        ruta = self._ruta(curso_url)
+        os.makedirs(self.directorio, exist_ok=True)
+        temporal = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(entrada, f, ensure_ascii=False, indent=2)
+        os.replace(temporal, ruta)
+
+    def filas(self, cursos_url: list[str]) -> tuple[list[dict[str, str]], list[str]]:
+        """
+        Collect the cached actas of several courses.
+
+        Args:
+            cursos_url (list[str]): URLs of the courses.
+
+        Returns:
+            tuple[list[dict[str, str]], list[str]]: The records of the
+            cached courses, in the given order, and the URLs that are not
+            cached.
+        """
+        filas, faltantes = [], []
+        for curso_url in dict.fromkeys(cursos_url):
+            acta = self.obtener(curso_url)
+            if acta is None:
+                faltantes.append(curso_url)
+            else:
+                filas.extend(acta)
+        return(filas, faltantes)
+
+# Mientras está activo, recorrer_cursos toma de aquí las actas que encuentra y
+# guarda las que descarga
+_activacion = CachePorProceso(CacheActas)
+activar_cache_actas = _activacion.activar
+desactivar_cache_actas = _activacion.desactivar
+cache_actas_activo = _activacion.activo
@@ -0,0 +1,66 @@
+from datetime import date, timedelta
+from typing import Any, Optional
+from core.scrapper.incremental import periodo_curso, curso_cerrado
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Piezas comunes de los cachés del recorrido.
+
+El caché negativo (cache_negativo) y el caché compartido de actas
+(cache_actas) guardan datos por curso con un vencimiento que depende del
+periodo del curso, y ambos se activan para todo el proceso para que
+recorrer_cursos los use sin pasarlos por cada llamada.
+'''
+
+def vigencia_por_periodo(curso_url: str, dias: dict[str, float], hoy: Optional[date] = None) -> timedelta:
+    """
+    Return how long data cached for a course stays valid, by the kind of
+    period of the course. Used by the negative cache and the acta cache.
+
+    Args:
+        curso_url (str): URL of the course.
+        dias (dict[str, float]): Days for courses of the current or previous
+            period ("abierto"), of closed periods ("cerrado") and for URLs
+            without a period ("desconocido").
+        hoy (date, optional): Reference date. Defaults to today.
+
+    Returns:
+        timedelta: Time to live of the cached data.
+    """
+    if periodo_curso(curso_url) is None:
+        clave = "desconocido"
+    else:
+        clave = "cerrado" if curso_cerrado(curso_url, hoy=hoy) else "abierto"
+    return(timedelta(days=dias[clave]))
+
+class CachePorProceso:
+    """
+    Cache enabled for the whole process, so `ucursos.recorrer_cursos` can use
+    it without threading it through every extractor call.
+
+    Args:
+        clase (type): Class of the cache; `activar` builds it with its
+            arguments.
+    """
+
+    def __init__(self, clase: type):
+        self.clase = clase
+        self._activo = None
+
+    def activar(self, *args: Any, **kwargs: Any) -> Any:
+        """Build the cache with the given arguments, enable it and return it."""
+        self._activo = self.clase(*args, **kwargs)
+        return(self._activo)
+
+    def desactivar(self) -> None:
+        """Disable the cache."""
+        self._activo = None
+
+    def activo(self) -> Any:
+        """Return the enabled cache, or None if it is disabled."""
+        return(self._activo)
@@ -0,0 +1,120 @@
+import os
+import json
+import threading
+from datetime import datetime
+from typing import Optional
+from core.scrapper.cache_base import vigencia_por_periodo, CachePorProceso
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Caché negativo de páginas de cursos.
+
+Muchos cursos no tienen tabla de notas (cursos antiguos, cursos de medicina
+del semestre en curso) o no tienen acta publicada, y cada corrida los volvía
+a visitar. Cuando una página carga bien pero no trae la tabla se anota en
+cache_negativo_<rut>.json, por URL del curso y tipo de página, con un
+vencimiento que depende del periodo del curso: los cursos en curso se
+revisan de nuevo al día siguiente, los de periodos cerrados casi nunca
+cambian y se revisan después de meses. Mientras la entrada esté vigente el
+recorrido no visita la página.
+'''
+
+DIAS_POR_DEFECTO = {
+    "abierto": 1,
+    "cerrado": 180,
+    "desconocido": 7
+}
+
+class CacheNegativo:
+    """
+    Persisted set of course pages known to be empty, with an expiry date per
+    entry. Expired entries are dropped when the file is loaded.
+
+    Args:
+        ruta (str): Path of the JSON file.
+        dias (dict[str, float], optional): Time to live by kind of course
+            (see `cache_base.vigencia_por_periodo`), merged over
+            `DIAS_POR_DEFECTO`.
+    """
+
+    def __init__(self, ruta: str, dias: Optional[dict[str, float]] = None):
+        self.ruta = ruta
+        self.dias = DIAS_POR_DEFECTO | (dias or {})
+        self._lock = threading.Lock()
+        self._entradas = {}
+        if os.path.exists(ruta):
+            try:
+                with open(ruta, encoding="utf-8") as f:
+                    entradas = json.load(f)
+            except (OSError, ValueError):
+                logger.warning(f"⚠️ Caché negativo {ruta} ilegible, se empieza de cero")
+                entradas = {}
+            ahora = datetime.now().isoformat(timespec="seconds")
+            self._entradas = {clave: entrada for clave, entrada in entradas.items() if entrada["expira"] > ahora}
+        logger.info(f"📂 Caché negativo con {len(self._entradas)} páginas vacías vigentes")
+
+    @staticmethod
+    def _clave(tipo: str, curso_url: str) -> str:
+        return(f"{tipo}|{curso_url}")
+
+    def _guardar(self) -> None:
+        os.makedirs(os.path.dirname(self.ruta) or ".", exist_ok=True)
+        temporal = f"{self.ruta}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(self._entradas, f, ensure_ascii=False, indent=2)
+        os.replace(temporal, self.ruta)
+
+    def vigente(self, tipo: str, curso_url: str) -> bool:
+        """
+        Tell whether a page is known to be empty and the entry has not
+        expired.
+
+        Args:
+            tipo (str): Page type ("notas" or "actas").
+            curso_url (str): URL of the course.
+
+        Returns:
+            bool: True if the page can be skipped.
+        """
+        entrada = self._entradas.get(self._clave(tipo, curso_url))
+        return(entrada is not None and entrada["expira"] > datetime.now().isoformat(timespec="seconds"))
+
+    def registrar(self, tipo: str, curso_url: str) -> None:
+        """
+        Record that a page loaded without content.
+
+        Args:
+            tipo (str): Page type ("notas" or "actas").
+            curso_url (str): URL of the course.
+        """
+        ahora = datetime.now()
+        with self._lock:
+            self._entradas[self._clave(tipo, curso_url)] = {
+                "fecha": ahora.isoformat(timespec="seconds"),
+                "expira": (ahora + vigencia_por_periodo(curso_url, self.dias)).isoformat(timespec="seconds")
+            }
+            self._guardar()
+
+    def olvidar(self, tipo: str, curso_url: str) -> None:
+        """
+        Remove the entry of a page (e.g. because it now has content).
+
+        Args:
+            tipo (str): Page type ("notas" or "actas").
+            curso_url (str): URL of the course.
+        """
+        with self._lock:
+            if self._entradas.pop(self._clave(tipo, curso_url), None) is not None:
+                self._guardar()
+
+# Mientras está activo, recorrer_cursos omite las páginas con una entrada
+# vigente y anota las que resultan vacías
+_activacion = CachePorProceso(CacheNegativo)
+activar_cache_negativo = _activacion.activar
+desactivar_cache_negativo = _activacion.desactivar
+cache_negativo_activo = _activacion.activo
@@ -0,0 +1,81 @@
+import re
+from collections import Counter
+from typing import Any
+from core.scrapper.incremental import periodo_curso
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Clasificación de la lista de cursos de u-cursos.
+
+La página "todos_cursos" lista todo lo que el usuario tiene en u-cursos:
+cursos donde fue alumno, cursos donde fue auxiliar o profesor (que ya vienen
+en la docencia de U-Campus), comunidades y páginas institucionales. Antes de
+recorrer se etiqueta cada entrada con su tipo según el cargo mostrado en la
+lista y la forma de la URL, y solo se piden las páginas que tienen sentido
+para ese tipo: notas y acta para los cursos donde fue alumno, nada para el
+resto.
+'''
+
+# /<unidad>/<año>/<semestre>/<código>/<sección>/
+PATRON_CURSO = re.compile(r"/\d{4}/[123]/[^/?#]+/[^/?#]+/?(?:[?#]|$)")
+
+PAGINAS_POR_TIPO = {
+    "alumno": ["notas", "actas"],
+    "docencia": [],
+    "sin_cargo": [],
+    "comunidad": []
+}
+
+def tipo_curso(curso_url: str, cargos: list[str]) -> str:
+    """
+    Classify an entry of the "todos_cursos" page.
+
+    Args:
+        curso_url (str): URL of the entry.
+        cargos (list[str]): Roles shown next to the entry (see
+            `parsers.parsear_cursos`).
+
+    Returns:
+        str: "comunidad" if the URL is not a course of a period (communities,
+        institutional pages), "alumno" if the user took the course,
+        "docencia" if the user only had another role (teaching assistant,
+        professor...) and "sin_cargo" if no role is shown.
+    """
+    if periodo_curso(curso_url) is None or PATRON_CURSO.search(curso_url) is None:
+        return("comunidad")
+    if "alumno" in cargos:
+        return("alumno")
+    return("docencia" if cargos else "sin_cargo")
+
+def clasificar_cursos(cursos: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Tag every entry of the "todos_cursos" page with its type and the page
+    types that have to be crawled for it.
+
+    Args:
+        cursos (list[dict[str, Any]]): Entries returned by
+            `parsers.parsear_cursos`.
+
+    Returns:
+        list[dict[str, Any]]: The same entries, in the same order, with the
+        keys "tipo" (see `tipo_curso`) and "paginas" (list of page types,
+        e.g. ["notas", "actas"], empty if the entry is not crawled).
+    """
+    clasificados = []
+    for curso in cursos:
+        tipo = tipo_curso(curso["url"], curso["cargos"])
+        clasificados.append(curso | {"tipo": tipo, "paginas": list(PAGINAS_POR_TIPO[tipo])})
+
+    conteo = Counter(curso["tipo"] for curso in clasificados)
+    omitidos = sum(1 for curso in clasificados if not curso["paginas"])
+    logger.info(
+        f"🏷️ {len(clasificados)} entradas en u-cursos: "
+        + ", ".join(f"{tipo}={cantidad}" for tipo, cantidad in conteo.most_common())
+        + f"; {omitidos} no se recorren"
+    )
+    return(clasificados)
@@ -0,0 +1,195 @@
+import requests
+from typing import Tuple
+from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.remote.webdriver import WebDriver
+from core.scrapper.parsers import cargar_html
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+# User agent usado cuando no hay un navegador del cual copiarlo
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36"
+)
+MAX_FORMULARIOS_SSO = 3
+
+def _nueva_sesion(pool_size: int) -> requests.Session:
+    sesion = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    sesion.mount("https://", adapter)
+    sesion.mount("http://", adapter)
+    return(sesion)
+
+def _xpath_locator(locator: Tuple[str, str]) -> str:
+    tipo, valor = locator
+    if tipo in ("name", "id"):
+        return(f"//*[@{tipo}='{valor}']")
+    if tipo == "xpath":
+        return(valor)
+    raise ValueError(f"Locator no soportado sin navegador: {locator}")
+
+def _enviar_formulario(
+    sesion: requests.Session,
+    formulario,
+    url_pagina: str,
+    valores_extra: dict[str, str],
+    timeout: float
+) -> requests.Response:
+    valores = dict(formulario.form_values())
+    botones = formulario.xpath(".//input[@type='submit'][@name]")
+    if botones:  # form_values() omite el botón, algunos servidores lo esperan
+        valores[botones[0].get("name")] = botones[0].get("value", "")
+    valores |= valores_extra
+    accion = urljoin(url_pagina, formulario.get("action") or "")
+    if (formulario.get("method") or "get").lower() == "post":
+        respuesta = sesion.post(accion, data=valores, timeout=timeout)
+    else:
+        respuesta = sesion.get(accion, params=valores, timeout=timeout)
+    respuesta.raise_for_status()
+    return(respuesta)
+
+def login_http(
+    url: str,
+    username: str,
+    password: str,
+    selectors: dict,
+    success_check: Tuple[str,str],
+    pool_size: int = 10,
+    timeout: float = 15
+) -> requests.Session:
+    """
+    Log in with plain HTTP requests, without launching a browser.
+
+    The page at `url` is downloaded (following the redirects to the login
+    page), the form that contains the username field is filled with the
+    credentials and all its other fields (hidden tokens included), and it is
+    submitted. Intermediate SSO pages that only hold a self-submitting form
+    (e.g. a SAMLResponse without visible fields) are submitted as a browser
+    would do with JavaScript. The login succeeds when the final page contains
+    the `success_check` element.
+
+    Args:
+        url (str): URL of a page that requires login.
+        username (str): The username credential for login.
+        password (str): The password credential for login.
+        selectors (dict): Locators of the login fields, as for
+            `login_generic` ("name", "id" or "xpath" locators).
+        success_check (Tuple[str, str]): Locator of an element only present
+            when logged in.
+        pool_size (int, optional): Maximum number of pooled connections per
+            host. Defaults to 10.
+        timeout (float, optional): Timeout in seconds for every request.
+            Defaults to 15.
+
+    Returns:
+        requests.Session: An authenticated HTTP session, usable with
+        `obtener_html` and the HTTP extractors.
+
+    Raises:
+        PermissionError: If the login form is not found or the success
+            element is not present after submitting it.
+        requests.RequestException: If a request fails.
+    """
+    sesion = _nueva_sesion(pool_size)
+    sesion.headers["User-Agent"] = USER_AGENT
+
+    respuesta = sesion.get(url, timeout=timeout)
+    respuesta.raise_for_status()
+    doc = cargar_html(respuesta.text)
+    campos_usuario = doc.xpath(_xpath_locator(selectors["username"]))
+    formularios = list(campos_usuario[0].iterancestors("form")) if campos_usuario else []
+    if not formularios:
+        raise PermissionError(f"No se encontró el formulario de login en {respuesta.url}")
+
+    nombre_usuario = campos_usuario[0].get("name")
+    nombre_clave = doc.xpath(_xpath_locator(selectors["password"]))[0].get("name")
+    respuesta = _enviar_formulario(
+        sesion, formularios[0], respuesta.url, {nombre_usuario: username, nombre_clave: password}, timeout
+    )
+    logger.info("📌 Credenciales enviadas por HTTP")
+
+    for _ in range(MAX_FORMULARIOS_SSO):
+        doc = cargar_html(respuesta.text)
+        if doc.xpath(_xpath_locator(success_check)):
+            logger.info(f"✅ Login HTTP exitoso en {respuesta.url}")
+            return(sesion)
+        # Páginas intermedias del SSO: un formulario sin campos visibles que
+        # el navegador enviaría solo con JavaScript
+        intermedios = [
+            formulario for formulario in doc.xpath("//form")
+            if not formulario.xpath(".//input[not(@type='hidden') and not(@type='submit')]")
+        ]
+        if not intermedios:
+            break
+        respuesta = _enviar_formulario(sesion, intermedios[0], respuesta.url, {}, timeout)
+
+    raise PermissionError(f"Login HTTP fallido: {success_check} no encontrado en {respuesta.url}")
+
+def crear_sesion_http(
+    driver: WebDriver,
+    pool_size: int = 10
+) -> requests.Session:
+    """
+    Create a pooled HTTP session that reuses the login of a Selenium driver.
+
+    The cookies of the page currently loaded in `driver` and its user agent
+    are copied into a `requests.Session`. The session mounts an adapter with
+    `pool_size` keep-alive connections per host, so it can be shared by
+    several threads fetching pages of the same site.
+
+    Args:
+        driver (WebDriver): An authenticated WebDriver instance.
+        pool_size (int, optional): Maximum number of pooled connections per
+            host. Defaults to 10.
+
+    Returns:
+        requests.Session: An authenticated HTTP session.
+    """
+    sesion = _nueva_sesion(pool_size)
+
+    try:
+        sesion.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+    except Exception:
+        logger.debug("ℹ️️ No se pudo leer el user agent del driver")
+
+    for cookie in driver.get_cookies():
+        sesion.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain"),
+            path=cookie.get("path", "/")
+        )
+    logger.info(f"✅ Sesión HTTP creada con {len(sesion.cookies)} cookies")
+    return(sesion)
+
+def obtener_html(
+    sesion: requests.Session,
+    url: str,
+    timeout: float = 15
+) -> str:
+    """
+    Download the raw HTML of a page with an authenticated HTTP session.
+
+    Args:
+        sesion (requests.Session): Session created with `crear_sesion_http`.
+        url (str): URL of the page.
+        timeout (float, optional): Timeout in seconds for the request.
+            Defaults to 15.
+
+    Returns:
+        str: The HTML of the page.
+
+    Raises:
+        requests.RequestException: If the request fails or the server answers
+        with an error status.
+    """
+    respuesta = sesion.get(url, timeout=timeout)
+    respuesta.raise_for_status()
+    if "charset" not in respuesta.headers.get("Content-Type", "").lower():
+        respuesta.encoding = respuesta.apparent_encoding
+    return(respuesta.text)
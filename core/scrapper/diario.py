@@ -0,0 +1,118 @@
+import os
+import json
+import threading
+from datetime import datetime
+from typing import Any, Optional
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Diario de avance del recorrido de u-cursos.
+
+Cada página de curso procesada con éxito (notas o acta) se agrega como una
+línea JSON a journal_<rut>.jsonl apenas termina, con las filas extraídas.
+Si la corrida se interrumpe (Chrome se cae, expira la sesión, Ctrl+C), al
+volver a ejecutar con --resume las páginas ya registradas no se visitan de
+nuevo y sus filas se toman del diario.
+'''
+
+class DiarioRecorrido:
+    """
+    Append-only JSONL journal of the course pages already processed.
+
+    Args:
+        ruta (str): Path of the journal file.
+        reanudar (bool, optional): Keep the entries of a previous run. If
+            False the file is truncated. Defaults to False.
+    """
+
+    def __init__(self, ruta: str, reanudar: bool = False):
+        self.ruta = ruta
+        self._lock = threading.Lock()
+        self._completados = {}
+        os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        if reanudar and os.path.exists(ruta):
+            with open(ruta, encoding="utf-8") as f:
+                lineas = f.readlines()
+            for linea in lineas:
+                try:
+                    entrada = json.loads(linea)
+                except json.JSONDecodeError:  # Línea cortada por una interrupción
+                    continue
+                self._completados[(entrada["tipo"], entrada["curso_url"])] = entrada["filas"]
+            if lineas and not lineas[-1].endswith("\n"):
+                with open(ruta, "a", encoding="utf-8") as f:
+                    f.write("\n")
+            logger.info(f"📂 Reanudando desde {ruta}: {len(self._completados)} páginas ya procesadas")
+        else:
+            open(ruta, "w", encoding="utf-8").close()
+
+    def completado(self, tipo: str, curso_url: str) -> Optional[list[dict[str, Any]]]:
+        """
+        Return the rows journaled for a page, or None if it is still pending.
+
+        Args:
+            tipo (str): Page type ("notas" or "actas").
+            curso_url (str): URL of the course.
+
+        Returns:
+            list[dict[str, Any]] | None: The rows extracted in a previous
+            attempt, or None.
+        """
+        return(self._completados.get((tipo, curso_url)))
+
+    def registrar(self, tipo: str, curso_url: str, filas: list[dict[str, Any]]) -> None:
+        """
+        Append a processed page to the journal. The line is flushed right
+        away so it survives a crash of the process.
+
+        Args:
+            tipo (str): Page type ("notas" or "actas").
+            curso_url (str): URL of the course.
+            filas (list[dict[str, Any]]): Rows extracted from the page.
+        """
+        entrada = {
+            "tipo": tipo,
+            "curso_url": curso_url,
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "filas": filas
+        }
+        with self._lock:
+            with open(self.ruta, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entrada, ensure_ascii=False) + "\n")
+                f.flush()
+            self._completados[(tipo, curso_url)] = filas
+
+_diario_activo: Optional[DiarioRecorrido] = None
+
+def activar_diario(ruta: str, reanudar: bool = False) -> DiarioRecorrido:
+    """
+    Enable the crawl journal for the current process.
+
+    While enabled, `recorrer_cursos` skips the pages already journaled and
+    records every page it processes.
+
+    Args:
+        ruta (str): Path of the journal file.
+        reanudar (bool, optional): Resume from the existing journal instead of
+            starting a new one. Defaults to False.
+
+    Returns:
+        DiarioRecorrido: The active journal.
+    """
+    global _diario_activo
+    _diario_activo = DiarioRecorrido(ruta, reanudar)
+    return(_diario_activo)
+
+def desactivar_diario() -> None:
+    """Disable the crawl journal for the current process."""
+    global _diario_activo
+    _diario_activo = None
+
+def diario_activo() -> Optional[DiarioRecorrido]:
+    """Return the active crawl journal, or None if it is disabled."""
+    return(_diario_activo)
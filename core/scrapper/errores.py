@@ -0,0 +1,20 @@
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Errores del recorrido de páginas de cursos.
+
+Distinguen las páginas que cargaron bien pero no tienen contenido (no se
+reintentan y pueden ir al caché negativo) de las que se sirvieron sin la
+sesión iniciada (un fallo normal, que se reintenta).
+'''
+
+class PaginaSinContenido(Exception):
+    """Raised when a course page loaded correctly but has no notas/acta table."""
+
+class SesionExpirada(Exception):
+    """Raised when a course page shows the login form instead of the logged-in layout."""
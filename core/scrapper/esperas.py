@@ -0,0 +1,303 @@
+import json
+import math
+import time
+import threading
+from collections import deque
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import TimeoutException
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Capa de esperas compartida por los scrapers.
+
+En vez de dormir un tiempo fijo después de cada navegación, las funciones de
+este módulo retornan apenas aparece el elemento esperado (tabla, dropdown,
+mensaje de error) o apenas la página terminó de cargar sin mostrarlo. Cada
+tipo de página tiene un presupuesto de tiempo configurable ("timeouts", en
+segundos, tomado de los settings que recibe scrapper() mediante configurar o,
+si nadie llamó a configurar, de config/settings.json) y cada espera queda
+registrada con su duración real para poder revisar dónde se va el tiempo.
+
+Con "timeouts_adaptativos" el presupuesto de cada tipo de página se ajusta a
+lo observado: una vez que hay suficientes esperas exitosas, el timeout pasa a
+ser un múltiplo del percentil 95 de su duración (nunca más que el
+configurado), así una página que no va a cargar se abandona pronto. El
+registro guarda como máximo las últimas MAX_REGISTROS esperas y se vacía al
+empezar cada corrida. Los reintentos (timeout_completo) usan siempre el
+presupuesto configurado.
+'''
+
+TIMEOUTS_POR_DEFECTO = {
+    "login": 10,
+    "historial": 15,
+    "ub": 10,
+    "recuento": 10,
+    "notas": 10,
+    "actas": 10
+}
+GRACIA_POR_DEFECTO = 0.5
+INTERVALO_SONDEO = 0.1
+MIN_MUESTRAS_ADAPTATIVO = 10
+MARGEN_ADAPTATIVO = 3.0
+PISO_ADAPTATIVO = 2.0
+# Esperas guardadas por corrida: las más antiguas se descartan
+MAX_REGISTROS = 5000
+
+registro_esperas = deque(maxlen=MAX_REGISTROS)
+_lock_registro = threading.Lock()
+_configuracion = {}
+_hilo = threading.local()
+
+def configurar(settings: dict) -> None:
+    """
+    Take the wait settings ("timeouts", "gracia_espera" and
+    "timeouts_adaptativos") from a configuration dictionary instead of
+    config/settings.json. Called by `scrapper` at the start of every run, so
+    the overrides of the benchmark and the batch reach the waits.
+
+    Args:
+        settings (dict): Configuration dictionary.
+    """
+    _configuracion["timeouts"] = TIMEOUTS_POR_DEFECTO | settings.get("timeouts", {})
+    _configuracion["gracia"] = settings.get("gracia_espera", GRACIA_POR_DEFECTO)
+    _configuracion["adaptativo"] = settings.get("timeouts_adaptativos", False)
+
+def reiniciar_registro() -> None:
+    """
+    Empty `registro_esperas`. Called by `scrapper` at the start of every run,
+    so the adaptive timeouts and the summary of a run only use its own waits
+    (not the ones of previous students or benchmark backends).
+    """
+    with _lock_registro:
+        registro_esperas.clear()
+
+def _cargar_configuracion() -> dict:
+    if not _configuracion:
+        settings_path = Path(__file__).resolve().parent.parent.parent / "config" / "settings.json"
+        try:
+            with open(settings_path, encoding="utf-8") as f:
+                settings = json.load(f)
+        except Exception:
+            settings = {}
+        configurar(settings)
+    return(_configuracion)
+
+def percentil(valores: list[float], p: float) -> float:
+    """
+    Return the p-th percentile of a list of values (nearest rank).
+
+    Args:
+        valores (list[float]): Values, in any order. Must not be empty.
+        p (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The smallest value with at least p% of the values below or
+        equal to it.
+    """
+    ordenados = sorted(valores)
+    rango = max(math.ceil(p / 100 * len(ordenados)), 1)
+    return(ordenados[rango - 1])
+
+@contextmanager
+def timeout_completo(activo: bool = True) -> Iterator[None]:
+    """
+    Make `timeout_pagina` return the configured timeout, ignoring the
+    adaptive one, for the waits of the current thread. Used for retries: a
+    page that timed out with the adaptive budget gets the full one on the
+    next attempt.
+
+    Args:
+        activo (bool, optional): Whether to apply it. Defaults to True.
+    """
+    anterior = getattr(_hilo, "completo", False)
+    _hilo.completo = anterior or activo
+    try:
+        yield
+    finally:
+        _hilo.completo = anterior
+
+def timeout_pagina(pagina: str) -> float:
+    """
+    Return the time budget, in seconds, for a page type.
+
+    With "timeouts_adaptativos" enabled and at least
+    `MIN_MUESTRAS_ADAPTATIVO` successful waits recorded for the page type,
+    the budget is `MARGEN_ADAPTATIVO` times the 95th percentile of their
+    duration, between `PISO_ADAPTATIVO` and the configured timeout. Inside
+    `timeout_completo` the configured timeout is always used.
+
+    Args:
+        pagina (str): Page type (e.g. "login", "notas", "ub").
+
+    Returns:
+        float: The adaptive timeout, or the configured one (see
+        `configurar`), or the default one.
+    """
+    configuracion = _cargar_configuracion()
+    configurado = configuracion["timeouts"].get(pagina, max(TIMEOUTS_POR_DEFECTO.values()))
+    if not configuracion["adaptativo"] or getattr(_hilo, "completo", False):
+        return(configurado)
+    with _lock_registro:
+        muestras = [
+            registro["Segundos"] for registro in registro_esperas
+            if registro["Página"] == pagina and registro["Resultado"] == "objetivo"
+        ]
+    if len(muestras) < MIN_MUESTRAS_ADAPTATIVO:
+        return(configurado)
+    return(min(configurado, max(PISO_ADAPTATIVO, MARGEN_ADAPTATIVO * percentil(muestras, 95))))
+
+def _registrar(pagina: str, inicio: float, resultado: str, url: str) -> None:
+    segundos = time.perf_counter() - inicio
+    with _lock_registro:
+        registro_esperas.append({
+            "Página": pagina,
+            "URL": url,
+            "Segundos": round(segundos, 3),
+            "Resultado": resultado
+        })
+    logger.debug(f"ℹ️️ Espera '{pagina}' terminó en {segundos:.2f}s ({resultado})")
+
+def esperar(
+    driver: WebDriver,
+    pagina: str,
+    objetivos: list[Tuple[str, str]],
+    alternativas: Optional[list[Tuple[str, str]]] = None,
+    timeout: Optional[float] = None,
+    solo_objetivos: bool = False
+) -> WebElement:
+    """
+    Wait until one of the target elements is present and return it.
+
+    The DOM is polled every 100 ms. The wait ends as soon as:
+        - one of `objetivos` is present (the element is returned), or
+        - one of `alternativas` (e.g. an error marker) is present, or
+        - the document finished loading and none of the targets appeared
+          after the configured grace period ("gracia_espera"), unless
+          `solo_objetivos` is True, or
+        - the time budget for `pagina` runs out.
+
+    In the last three cases a `TimeoutException` is raised, so callers can
+    treat them like the old `WebDriverWait` timeouts, but without paying the
+    full timeout when the page is already complete. The real duration of
+    every wait is stored in `registro_esperas`.
+
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance.
+        pagina (str): Page type, used to pick the timeout and in the log.
+        objetivos (list[Tuple[str, str]]): Locators of the expected elements.
+        alternativas (list[Tuple[str, str]], optional): Locators of elements
+            that mean the target will not appear (error messages, etc.).
+        timeout (float, optional): Overrides the configured timeout.
+        solo_objetivos (bool, optional): Keep waiting after the document is
+            complete. Needed right after a click that starts a navigation,
+            when the old page still reports itself as loaded. Defaults to
+            False.
+
+    Returns:
+        WebElement: The first target element found.
+
+    Raises:
+        TimeoutException: If no target is found (see above).
+    """
+    timeout = timeout if timeout is not None else timeout_pagina(pagina)
+    gracia = _cargar_configuracion()["gracia"]
+    alternativas = alternativas or []
+    inicio = time.perf_counter()
+    completa_desde = [None]
+    try:
+        url = driver.current_url
+    except Exception:
+        url = ""
+
+    def _condicion(d: WebDriver):
+        for locator in objetivos:
+            elementos = d.find_elements(*locator)
+            if elementos:
+                return(("objetivo", elementos[0]))
+        for locator in alternativas:
+            if d.find_elements(*locator):
+                return(("alternativa", None))
+        if not solo_objetivos and d.execute_script("return document.readyState;") == "complete":
+            if completa_desde[0] is None:
+                completa_desde[0] = time.perf_counter()
+            elif time.perf_counter() - completa_desde[0] >= gracia:
+                return(("sin_objetivo", None))
+        return(False)
+
+    try:
+        resultado, elemento = WebDriverWait(driver, timeout, poll_frequency=INTERVALO_SONDEO).until(_condicion)
+    except TimeoutException:
+        _registrar(pagina, inicio, "timeout", url)
+        raise TimeoutException(f"Tiempo agotado esperando '{pagina}' ({timeout}s)")
+    _registrar(pagina, inicio, resultado, url)
+    if elemento is None:
+        raise TimeoutException(f"Elemento esperado no encontrado en '{pagina}' ({resultado})")
+    return(elemento)
+
+def esperar_recarga(
+    driver: WebDriver,
+    pagina: str,
+    elemento_anterior: WebElement,
+    timeout: Optional[float] = None
+) -> bool:
+    """
+    Wait until an element of the previous page is detached from the DOM.
+
+    Used after actions that trigger a page reload (e.g. choosing a year in a
+    dropdown) instead of a fixed sleep. The duration is recorded in
+    `registro_esperas`.
+
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance.
+        pagina (str): Page type, used to pick the timeout and in the log.
+        elemento_anterior (WebElement): Element that belongs to the page
+            shown before the action.
+        timeout (float, optional): Overrides the configured timeout.
+
+    Returns:
+        bool: True if the page was reloaded, False if the time budget ran out.
+    """
+    timeout = timeout if timeout is not None else timeout_pagina(pagina)
+    inicio = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=INTERVALO_SONDEO).until(EC.staleness_of(elemento_anterior))
+    except TimeoutException:
+        _registrar(pagina, inicio, "sin_recarga", driver.current_url)
+        return(False)
+    _registrar(pagina, inicio, "recarga", driver.current_url)
+    return(True)
+
+def resumen_esperas() -> dict[str, dict[str, float]]:
+    """
+    Summarize the recorded waits per page type and log the summary.
+
+    Returns:
+        dict[str, dict[str, float]]: For each page type, the number of waits
+        and the total, mean and maximum duration in seconds.
+    """
+    with _lock_registro:
+        registros = list(registro_esperas)
+    resumen = {}
+    for registro in registros:
+        datos = resumen.setdefault(registro["Página"], {"n": 0, "total": 0.0, "max": 0.0})
+        datos["n"] += 1
+        datos["total"] += registro["Segundos"]
+        datos["max"] = max(datos["max"], registro["Segundos"])
+    for pagina, datos in resumen.items():
+        datos["promedio"] = datos["total"] / datos["n"]
+        logger.info(
+            f"📏 Esperas '{pagina}': {datos['n']} | total {datos['total']:.1f}s | "
+            f"promedio {datos['promedio']:.2f}s | máx {datos['max']:.2f}s"
+        )
+    return(resumen)
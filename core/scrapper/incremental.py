@@ -0,0 +1,202 @@
+import os
+import re
+import pandas as pd
+from datetime import date
+from typing import Optional
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Scraping incremental de u-cursos.
+
+Las URLs de los cursos incluyen año y semestre
+(https://www.u-cursos.cl/ingenieria/2025/2/ME10059/1/) y las notas de un
+semestre cerrado no cambian. Estas funciones permiten reutilizar las filas
+del Excel de la corrida anterior (data_UCURSOS_<rut>.xlsx) para los cursos de
+periodos cerrados y volver a descargar solo los cursos del periodo actual y
+de los `ventana` periodos anteriores.
+
+Los periodos se numeran como año * 3 + (semestre - 1): semestre 1 (otoño),
+2 (primavera) y 3 (verano, que se dicta en enero y febrero del año
+siguiente).
+'''
+
+HOJAS_UCURSOS = ("Notas_ucursos", "Actas_ucursos")
+# Hoja del Excel donde queda cada tipo de página
+HOJA_POR_PAGINA = {"notas": "Notas_ucursos", "actas": "Actas_ucursos"}
+PATRON_PERIODO = re.compile(r"/(\d{4})/([123])/")
+
+def periodo_curso(curso_url: str) -> Optional[tuple[int, int]]:
+    """
+    Return the (year, semester) encoded in a U-Cursos course URL.
+
+    Args:
+        curso_url (str): URL of the course.
+
+    Returns:
+        tuple[int, int] | None: Year and semester, or None if the URL does not
+        follow the '/<year>/<semester>/' pattern.
+    """
+    coincidencia = PATRON_PERIODO.search(curso_url)
+    if coincidencia is None:
+        return(None)
+    return((int(coincidencia.group(1)), int(coincidencia.group(2))))
+
+def periodo_actual(hoy: Optional[date] = None) -> tuple[int, int]:
+    """
+    Return the academic period in progress on a given date.
+
+    January and February belong to the summer term (semester 3) of the
+    previous year, March to July to semester 1 and August to December to
+    semester 2.
+
+    Args:
+        hoy (date, optional): Reference date. Defaults to today.
+
+    Returns:
+        tuple[int, int]: Year and semester.
+    """
+    hoy = hoy or date.today()
+    if hoy.month <= 2:
+        return((hoy.year - 1, 3))
+    return((hoy.year, 1 if hoy.month <= 7 else 2))
+
+def _indice_periodo(periodo: tuple[int, int]) -> int:
+    return(periodo[0] * 3 + periodo[1] - 1)
+
+def curso_cerrado(curso_url: str, ventana: int = 1, hoy: Optional[date] = None) -> bool:
+    """
+    Tell whether the grades of a course can no longer change.
+
+    A course is considered closed when its period is more than `ventana`
+    periods older than the current one. Courses whose URL has no period are
+    never considered closed.
+
+    Args:
+        curso_url (str): URL of the course.
+        ventana (int, optional): Number of past periods that are still
+            re-downloaded. Defaults to 1.
+        hoy (date, optional): Reference date. Defaults to today.
+
+    Returns:
+        bool: True if the course belongs to a closed period.
+    """
+    periodo = periodo_curso(curso_url)
+    if periodo is None:
+        return(False)
+    return(_indice_periodo(periodo_actual(hoy)) - _indice_periodo(periodo) > ventana)
+
+def cargar_datos_previos(ruta_excel: str) -> dict[str, pd.DataFrame]:
+    """
+    Read the U-Cursos sheets written by a previous run.
+
+    Values are read as text, with empty cells as empty strings, so the cached
+    rows look like the ones produced by the scrapers.
+
+    Args:
+        ruta_excel (str): Path of the previous "data_UCURSOS_<rut>.xlsx".
+
+    Returns:
+        dict[str, pandas.DataFrame]: The "Notas_ucursos" and "Actas_ucursos"
+        sheets, or an empty dictionary if the file does not exist or cannot
+        be read.
+    """
+    if not os.path.exists(ruta_excel):
+        logger.info(f"ℹ️️ No hay datos previos en {ruta_excel}, se descargan todos los cursos")
+        return({})
+    try:
+        hojas = pd.read_excel(ruta_excel, sheet_name=None, dtype=str, keep_default_na=False)
+    except Exception as e:
+        logger.warning(f"⚠️ No se pudieron leer los datos previos de {ruta_excel}: {e}")
+        return({})
+    logger.info(f"📂 Datos previos cargados desde {ruta_excel}")
+    return({hoja: hojas[hoja] for hoja in HOJAS_UCURSOS if hoja in hojas})
+
+def separar_cursos(
+    urls_cursos_alumno: list[str],
+    datos_previos: dict[str, pd.DataFrame],
+    ventana: int = 1,
+    hoy: Optional[date] = None,
+    paginas_por_curso: Optional[dict[str, list[str]]] = None
+) -> tuple[list[str], list[str]]:
+    """
+    Split the course URLs into the ones that must be downloaded again and the
+    ones that can be reused from the previous run.
+
+    A course is reused only if it belongs to a closed period and the previous
+    run has rows for it in the sheet of every page type it needs, so a
+    course whose acta (or notas) failed last time is downloaded again.
+
+    Args:
+        urls_cursos_alumno (list[str]): List of URLs for the student's courses.
+        datos_previos (dict[str, pandas.DataFrame]): Sheets returned by
+            `cargar_datos_previos`.
+        ventana (int, optional): See `curso_cerrado`. Defaults to 1.
+        hoy (date, optional): Reference date. Defaults to today.
+        paginas_por_curso (dict[str, list[str]], optional): Page types
+            crawled for each URL (see `clasificacion.clasificar_cursos`).
+            Defaults to None (notas and actas for every course).
+
+    Returns:
+        tuple[list[str], list[str]]: URLs to download and URLs to reuse, both
+        in their original order.
+    """
+    en_cache = {}
+    for hoja, df in datos_previos.items():
+        en_cache[hoja] = set(df["Curso URL"]) if "Curso URL" in df.columns else set()
+
+    descargar, reutilizar = [], []
+    for url in urls_cursos_alumno:
+        paginas = (paginas_por_curso or {}).get(url, list(HOJA_POR_PAGINA))
+        completo = all(url in en_cache.get(HOJA_POR_PAGINA[pagina], ()) for pagina in paginas)
+        if completo and curso_cerrado(url, ventana, hoy):
+            reutilizar.append(url)
+        else:
+            descargar.append(url)
+    return(descargar, reutilizar)
+
+def combinar_datos(
+    df_dict: dict[str, pd.DataFrame],
+    datos_previos: dict[str, pd.DataFrame],
+    urls_reutilizadas: list[str],
+    urls_cursos_alumno: list[str]
+) -> dict[str, pd.DataFrame]:
+    """
+    Merge the freshly downloaded rows with the cached rows of the reused
+    courses.
+
+    Rows are ordered following `urls_cursos_alumno`, keeping the original
+    order inside each course, so the result matches a full run.
+
+    Args:
+        df_dict (dict[str, pandas.DataFrame]): Data of the downloaded courses.
+        datos_previos (dict[str, pandas.DataFrame]): Sheets of the previous run.
+        urls_reutilizadas (list[str]): Courses taken from the previous run.
+        urls_cursos_alumno (list[str]): All the course URLs, in page order.
+
+    Returns:
+        dict[str, pandas.DataFrame]: The merged "Notas_ucursos" and
+        "Actas_ucursos" DataFrames.
+    """
+    orden = {url: i for i, url in enumerate(urls_cursos_alumno)}
+    reutilizadas = set(urls_reutilizadas)
+    combinado = {}
+    for hoja in HOJAS_UCURSOS:
+        partes = []
+        nuevo = df_dict.get(hoja)
+        if nuevo is not None and not nuevo.empty:
+            partes.append(nuevo)
+        previo = datos_previos.get(hoja)
+        if previo is not None and "Curso URL" in previo.columns:
+            partes.append(previo[previo["Curso URL"].isin(reutilizadas)])
+        if not partes:
+            combinado[hoja] = df_dict.get(hoja, pd.DataFrame())
+            continue
+        df = pd.concat(partes, ignore_index=True)
+        df = df.iloc[df["Curso URL"].map(orden).fillna(len(orden)).argsort(kind="stable")].reset_index(drop=True)
+        combinado[hoja] = df
+    return(combinado)
@@ -1,28 +1,396 @@
+import os
+import json
+import time
+import copy
+import uuid
+import hashlib
+import shutil
+import atexit
+import weakref
+import threading
+from queue import Queue
+from pathlib import Path
+from functools import partial
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from typing import Any, Callable, Iterator, Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.command import Command
+from selenium.common.exceptions import (
+    TimeoutException, WebDriverException, InvalidSessionIdException, NoSuchWindowException
+)
+from urllib3.exceptions import HTTPError as ErrorConexion
 from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
 import logging
 from config.logger import setup_logger
 
+try:
+    import psutil
+except ImportError:  # Sin psutil no se mide la memoria de Chrome
+    psutil = None
+
 setup_logger()
 logger = logging.getLogger(__name__)
 # Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
 
+'''
+Caché de chromedriver.
+
+ChromeDriverManager().install() consulta la red en cada arranque para saber
+qué versión descargar, lo que cuesta tiempo en cada proceso del batch y falla
+sin conexión. La ruta del chromedriver se guarda en drivers/chromedriver.json
+asociada a la versión mayor de Chrome instalada: mientras Chrome no cambie de
+versión se reutiliza ese binario sin tocar la red. Si Chrome se actualiza se
+descarga el driver que corresponde, y si no hay red se usa el último driver
+conocido.
+
+Pool de pestañas.
+
+Cada Chrome completo cuesta cientos de MB, lo que limita cuántos recorridos
+paralelos caben en una máquina. PoolPestanas abre N pestañas en un solo
+navegador (misma sesión, sin logins extra) y entrega a cada hilo una vista
+de WebDriver atada a una pestaña. Chromedriver atiende una pestaña a la vez,
+así que cada comando toma un lock y cambia de pestaña si hace falta; las
+navegaciones se disparan sin esperar la carga, de modo que varias páginas
+cargan en paralelo mientras los demás hilos leen las suyas.
+
+Ciclo de vida del driver.
+
+Un Chrome que no se cierra (por una excepción, o porque el proceso del batch
+termina) queda vivo como proceso huérfano, y un recorrido largo hace crecer
+la memoria del navegador. DriverGestionado revisa la sesión antes de cada
+página y reemplaza el navegador cuando la sesión murió, tras cierta cantidad
+de páginas o cuando Chrome supera un límite de memoria, reponiendo las
+cookies para no repetir el login. driver_gestionado garantiza el cierre y los
+drivers que sigan vivos al salir del proceso se cierran con atexit.
+
+Perfil persistente.
+
+Con un perfil temporal cada navegador descarga de nuevo el JS y CSS de
+u-cursos y U-Campus antes de mostrar la primera tabla. Con un directorio de
+perfil, cada navegador parte de una copia propia de la caché HTTP y de
+código guardada ahí (Chrome no permite dos navegadores sobre el mismo
+perfil) y al cerrarse publica su caché para las corridas siguientes. Solo se
+copian los directorios de caché: las cookies de sesión nunca quedan en disco.
+
+Navegadores remotos.
+
+Con "grid" los navegadores se piden a uno o más endpoints compatibles con
+Selenium Grid en vez de abrirse en esta máquina, así el batch reparte la
+memoria de Chrome entre varios nodos. PoolGrid limita las sesiones abiertas
+por endpoint (en este proceso; cada nodo del grid además encola según su
+propia capacidad) y mantiene la afinidad: todos los navegadores de un mismo
+estudiante van al mismo endpoint, elegido por un hash estable del rut.
+'''
+
+CACHE_DRIVER = Path(__file__).resolve().parent.parent.parent / "drivers" / "chromedriver.json"
+
+# Recursos bloqueados en modo liviano: los scrapers solo leen texto de tablas
+URLS_BLOQUEADAS_LIVIANO = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.css",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*"
+]
+ARGUMENTOS_LIVIANO = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--blink-settings=imagesEnabled=false"
+]
+
+_ruta_driver = None
+_lock_driver = threading.Lock()
+
+def version_chrome() -> Optional[str]:
+    """
+    Return the version of the Chrome (or Chromium) installed in the system.
+
+    Returns:
+        str | None: The full version (e.g. "141.0.7390.54"), or None if no
+        browser is found.
+    """
+    sistema = OperationSystemManager()
+    for tipo in (ChromeType.GOOGLE, ChromeType.CHROMIUM):
+        version = sistema.get_browser_version_from_os(tipo)
+        if version:
+            return(version)
+    return(None)
+
+def _leer_cache() -> dict:
+    try:
+        with open(CACHE_DRIVER, encoding="utf-8") as f:
+            return(json.load(f))
+    except Exception:
+        return({})
+
+def _escribir_cache(cache: dict) -> None:
+    CACHE_DRIVER.parent.mkdir(exist_ok=True)
+    temporal = CACHE_DRIVER.with_suffix(f".{os.getpid()}.tmp")
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(temporal, CACHE_DRIVER)
+
+def resolver_chromedriver() -> str:
+    """
+    Return the path of a chromedriver compatible with the installed Chrome,
+    downloading it only when needed.
+
+    The result is memoized for the process and persisted in
+    `drivers/chromedriver.json`, keyed by Chrome's major version, so later
+    runs and other processes reuse the same binary without network access.
+    If the download fails (e.g. offline), the last cached driver is used.
+
+    Returns:
+        str: Path of the chromedriver executable.
+
+    Raises:
+        Exception: If no driver is cached and it cannot be downloaded.
+    """
+    global _ruta_driver
+    with _lock_driver:
+        if _ruta_driver and os.path.exists(_ruta_driver):
+            return(_ruta_driver)
+        inicio = time.perf_counter()
+        version = version_chrome()
+        mayor = version.split(".")[0] if version else None
+        cache = _leer_cache()
+        ruta = cache.get("drivers", {}).get(mayor) if mayor else None
+        if ruta and os.path.exists(ruta):
+            origen = "caché"
+        else:
+            try:
+                ruta = ChromeDriverManager().install()
+                origen = "descarga"
+                if mayor:
+                    cache.setdefault("drivers", {})[mayor] = ruta
+                cache["ultimo"] = ruta
+                _escribir_cache(cache)
+            except Exception:
+                ruta = cache.get("ultimo")
+                if not ruta or not os.path.exists(ruta):
+                    raise
+                origen = "caché (sin red)"
+                logger.warning(f"⚠️ No se pudo verificar chromedriver para Chrome {version}, se usa {ruta}")
+        _ruta_driver = ruta
+        logger.info(f"📦 chromedriver desde {origen} en {time.perf_counter() - inicio:.2f}s (Chrome {version})")
+    return(_ruta_driver)
+
+# Caché HTTP y caché de código JS dentro de un perfil de Chrome
+DIRECTORIOS_CACHE = [os.path.join("Default", "Cache"), os.path.join("Default", "Code Cache")]
+# Clones que quedan de procesos que murieron sin cerrar el navegador
+HORAS_CLON_HUERFANO = 24
+
+def clonar_perfil(directorio: str) -> str:
+    """
+    Create a profile directory for one browser, seeded with the shared cache.
+
+    The clone is created under "<directorio>/clones" and receives a copy of
+    the cache directories (`DIRECTORIOS_CACHE`) published in
+    "<directorio>/cache". Clones left by processes that died are removed.
+
+    Args:
+        directorio (str): Persistent profile directory.
+
+    Returns:
+        str: Path of the new profile directory.
+    """
+    clones = os.path.join(directorio, "clones")
+    os.makedirs(clones, exist_ok=True)
+    limite = time.time() - HORAS_CLON_HUERFANO * 3600
+    for nombre in os.listdir(clones):
+        ruta = os.path.join(clones, nombre)
+        if os.path.getmtime(ruta) < limite:
+            shutil.rmtree(ruta, ignore_errors=True)
+
+    clon = os.path.join(clones, uuid.uuid4().hex)
+    os.makedirs(clon)
+    for subdirectorio in DIRECTORIOS_CACHE:
+        origen = os.path.join(directorio, "cache", subdirectorio)
+        if os.path.isdir(origen):
+            try:
+                shutil.copytree(origen, os.path.join(clon, subdirectorio))
+            except (OSError, shutil.Error) as e:
+                logger.warning(f"⚠️ No se pudo copiar la caché de Chrome ({subdirectorio}): {e}")
+    return(clon)
+
+def publicar_perfil(clon: str, directorio: str) -> None:
+    """
+    Publish the cache of a closed browser as the shared cache and delete its
+    profile clone.
+
+    The cache is copied to a temporary directory and swapped in with
+    renames, so a browser starting at the same time never sees a half
+    copied cache. If another browser publishes at the same time, one of the
+    two copies is kept.
+
+    Args:
+        clon (str): Profile directory of the closed browser.
+        directorio (str): Persistent profile directory.
+    """
+    destino = os.path.join(directorio, "cache")
+    temporal = f"{destino}.{uuid.uuid4().hex}.tmp"
+    anterior = f"{destino}.{uuid.uuid4().hex}.old"
+    try:
+        for subdirectorio in DIRECTORIOS_CACHE:
+            origen = os.path.join(clon, subdirectorio)
+            if os.path.isdir(origen):
+                shutil.copytree(origen, os.path.join(temporal, subdirectorio))
+        if os.path.isdir(temporal):
+            if os.path.isdir(destino):
+                os.replace(destino, anterior)
+            os.replace(temporal, destino)
+            logger.debug(f"💾 Caché de Chrome publicada en {destino}")
+    except (OSError, shutil.Error) as e:
+        logger.warning(f"⚠️ No se pudo guardar la caché de Chrome: {e}")
+    finally:
+        for ruta in (temporal, anterior, clon):
+            shutil.rmtree(ruta, ignore_errors=True)
+
+class PoolGrid:
+    """
+    Leases browser sessions from Selenium-Grid-compatible endpoints.
+
+    Each endpoint accepts at most `max_sesiones` sessions opened by this
+    process; `crear_sesion` blocks until a slot is free. The first session
+    of an affinity key (e.g. a RUT) goes to the endpoint given by a stable
+    hash of the key, or to the endpoint with more free slots if that one is
+    full, and every later session with the same key goes to the same
+    endpoint.
+
+    Args:
+        urls (list[str]): Endpoint URLs (e.g. "http://nodo1:4444").
+        max_sesiones (int, optional): Concurrent sessions per endpoint.
+            Defaults to 4.
+        timeout (float, optional): Seconds to wait for a free slot. Defaults
+            to 300.
+    """
+
+    def __init__(self, urls: list[str], max_sesiones: int = 4, timeout: float = 300.0):
+        if not urls:
+            raise ValueError("PoolGrid necesita al menos un endpoint")
+        self.urls = [url.rstrip("/") for url in urls]
+        self.max_sesiones = max(max_sesiones, 1)
+        self.timeout = timeout
+        self._condicion = threading.Condition()
+        self._en_uso = {url: 0 for url in self.urls}
+        self._afinidades = {}
+
+    def _elegir(self, afinidad: Optional[str]) -> str:
+        if afinidad is not None and afinidad in self._afinidades:
+            return(self._afinidades[afinidad])
+        clave = afinidad if afinidad is not None else uuid.uuid4().hex
+        preferido = self.urls[int(hashlib.sha256(clave.encode("utf-8")).hexdigest(), 16) % len(self.urls)]
+        if self._en_uso[preferido] >= self.max_sesiones:
+            preferido = min(self.urls, key=lambda url: self._en_uso[url])
+        if afinidad is not None:
+            self._afinidades[afinidad] = preferido
+        return(preferido)
+
+    def arrendar(self, afinidad: Optional[str] = None) -> str:
+        """
+        Reserve a session slot.
+
+        Args:
+            afinidad (str, optional): Affinity key. Defaults to None (any
+                endpoint).
+
+        Returns:
+            str: URL of the endpoint where the session must be created.
+
+        Raises:
+            TimeoutError: If no slot was freed within `timeout` seconds.
+        """
+        limite = time.monotonic() + self.timeout
+        with self._condicion:
+            url = self._elegir(afinidad)
+            while self._en_uso[url] >= self.max_sesiones:
+                restante = limite - time.monotonic()
+                if restante <= 0 or not self._condicion.wait(restante):
+                    raise TimeoutError(f"Sin sesiones libres en {url} tras {self.timeout:.0f}s")
+            self._en_uso[url] += 1
+        return(url)
+
+    def liberar(self, url: str) -> None:
+        """Free a slot reserved with `arrendar`."""
+        with self._condicion:
+            self._en_uso[url] = max(self._en_uso[url] - 1, 0)
+            self._condicion.notify_all()
+
+    def crear_sesion(self, opciones: Options, afinidad: Optional[str] = None) -> WebDriver:
+        """
+        Open a remote browser session in a free slot.
+
+        The slot is freed when the driver is closed with `cerrar_driver`, or
+        immediately if the session cannot be created.
+
+        Args:
+            opciones (Options): Chrome options of the session.
+            afinidad (str, optional): Affinity key. Defaults to None.
+
+        Returns:
+            WebDriver: Remote WebDriver of the session.
+        """
+        url = self.arrendar(afinidad)
+        try:
+            driver = webdriver.Remote(command_executor=url, options=opciones)
+        except Exception:
+            self.liberar(url)
+            raise
+        driver._liberar_grid = partial(self.liberar, url)
+        logger.info(f"📌 Sesión remota en {url} ({self._en_uso[url]}/{self.max_sesiones})")
+        return(driver)
+
+_pools_grid = {}
+_lock_pools_grid = threading.Lock()
+
+def pool_grid(urls: list[str], max_sesiones: int = 4, timeout: float = 300.0) -> PoolGrid:
+    """
+    Return the `PoolGrid` of the process for a set of endpoints, creating it
+    the first time, so every scrape of the process shares the same limits.
+
+    Args:
+        urls (list[str]): Endpoint URLs.
+        max_sesiones (int, optional): Concurrent sessions per endpoint.
+            Defaults to 4.
+        timeout (float, optional): Seconds to wait for a free slot. Defaults
+            to 300.
+
+    Returns:
+        PoolGrid: The shared pool.
+    """
+    clave = (tuple(urls), max_sesiones, timeout)
+    with _lock_pools_grid:
+        if clave not in _pools_grid:
+            _pools_grid[clave] = PoolGrid(urls, max_sesiones, timeout)
+        return(_pools_grid[clave])
+
 def get_chrome_driver(
     headless: bool = True,
     disable_gpu: bool = True,
-    colab_mode: bool = False
+    colab_mode: bool = False,
+    lean: bool = False,
+    perfil: Optional[str] = None,
+    grid: Optional[PoolGrid] = None,
+    afinidad: Optional[str] = None
 ) -> WebDriver:
     """
     Initialize and configure a Selenium Chrome WebDriver instance.
 
     The function sets Chrome options for headless execution, GPU disabling,
-    and Colab/Docker compatibility if needed. It also uses
-    `ChromeDriverManager` to automatically download and manage the appropriate
-    ChromeDriver version. If initialization fails, the exception is logged and
-    re-raised.
+    and Colab/Docker compatibility if needed. The ChromeDriver binary is
+    provided by `resolver_chromedriver`, which only downloads it (through
+    `ChromeDriverManager`) the first time or when Chrome changes version.
+    The cold-start time is logged. If initialization fails, the exception is
+    logged and re-raised.
 
     Args:
         headless (bool, optional): Whether to run Chrome in headless mode
@@ -32,6 +400,22 @@ def get_chrome_driver(
         colab_mode (bool, optional): Whether to enable compatibility options
             for restricted environments like Google Colab or Docker
             (`--no-sandbox`, `--disable-dev-shm-usage`). Defaults to False.
+        lean (bool, optional): Whether to use the lean profile: the `eager`
+            page-load strategy (navigation returns once the DOM is ready),
+            no extensions or background networking, and images, fonts,
+            stylesheets and analytics blocked through CDP
+            (`URLS_BLOQUEADAS_LIVIANO`). Defaults to False.
+        perfil (str, optional): Persistent profile directory. The browser
+            runs on its own clone of the cached assets stored there
+            (`clonar_perfil`), which is published back when it is closed
+            with `cerrar_driver`. Defaults to None (temporary profile).
+            Ignored for remote sessions.
+        grid (PoolGrid, optional): Pool of remote endpoints. If given, the
+            browser is a remote session leased from it instead of a local
+            Chrome; resources are not blocked through CDP in lean mode.
+            Defaults to None (local Chrome).
+        afinidad (str, optional): Affinity key for `grid` (e.g. the RUT of
+            the student). Defaults to None.
 
     Returns:
         WebDriver: A Selenium Chrome WebDriver instance ready for use.
@@ -40,8 +424,13 @@ def get_chrome_driver(
         Exception: If ChromeDriver initialization fails. The exception is logged
         and then re-raised.
     """
+    clon = None
     try:
+        inicio = time.perf_counter()
         chrome_options = Options()
+        if perfil and grid is None:
+            clon = clonar_perfil(perfil)
+            chrome_options.add_argument(f"--user-data-dir={clon}")
         
         if headless:
             chrome_options.add_argument('--headless')
@@ -50,13 +439,418 @@ def get_chrome_driver(
         if colab_mode:
             chrome_options.add_argument('--no-sandbox')
             chrome_options.add_argument('--disable-dev-shm-usage')
+        if lean:
+            chrome_options.page_load_strategy = 'eager'
+            for argumento in ARGUMENTOS_LIVIANO:
+                chrome_options.add_argument(argumento)
 
-        driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=chrome_options
-        )
-        logger.info("✅ Chrome driver initialized.")
+        if grid is not None:
+            driver = grid.crear_sesion(chrome_options, afinidad)
+        else:
+            driver = webdriver.Chrome(
+                service=Service(resolver_chromedriver()),
+                options=chrome_options
+            )
+        if lean and grid is None:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": URLS_BLOQUEADAS_LIVIANO})
+        if clon:
+            driver._perfil_chrome = (clon, perfil)
+        logger.info(f"✅ Chrome driver initialized in {time.perf_counter() - inicio:.2f}s.")
     except Exception as e:
         logger.exception("❌ Failed to initialize Chrome driver.")
+        if clon:
+            shutil.rmtree(clon, ignore_errors=True)
         raise e
     return driver
+
+_drivers_vivos = weakref.WeakSet()
+# Cada cuántas páginas se copian las cookies para restaurarlas si el navegador
+# muere: copiarlas en cada página costaría un comando WebDriver más por página
+PAGINAS_POR_COPIA_COOKIES = 25
+
+def _sesion_muerta(error: Exception) -> bool:
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ErrorConexion, OSError)):
+        return(True)
+    mensaje = str(error).lower()
+    return(isinstance(error, WebDriverException) and ("not reachable" in mensaje or "disconnected" in mensaje))
+
+def memoria_navegador(driver: WebDriver) -> Optional[float]:
+    """
+    Return the resident memory of a browser: chromedriver plus every Chrome
+    process it started.
+
+    Args:
+        driver (WebDriver): A local Selenium WebDriver instance.
+
+    Returns:
+        float | None: Resident memory in MB, or None if it cannot be measured
+        (psutil not installed, remote driver or finished process).
+    """
+    proceso = getattr(getattr(driver, "service", None), "process", None)
+    if psutil is None or proceso is None:
+        return(None)
+    try:
+        raiz = psutil.Process(proceso.pid)
+        rss = sum(p.memory_info().rss for p in [raiz] + raiz.children(recursive=True))
+    except psutil.Error:
+        return(None)
+    return(rss / 2**20)
+
+def cerrar_driver(driver: WebDriver) -> None:
+    """
+    Close a browser, killing its processes if `quit` fails.
+
+    If the browser runs on a persistent profile clone, its cache is
+    published (`publicar_perfil`) after a clean `quit`, and the clone is
+    discarded otherwise. Remote sessions give their `PoolGrid` slot back.
+
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance.
+    """
+    proceso = getattr(getattr(driver, "service", None), "process", None)
+    perfil = getattr(driver, "_perfil_chrome", None)
+    liberar_grid = getattr(driver, "_liberar_grid", None)
+    try:
+        driver.quit()
+        if perfil:
+            publicar_perfil(*perfil)
+        return
+    except Exception as e:
+        logger.warning(f"⚠️ driver.quit() falló ({e}), se terminan los procesos del navegador")
+    finally:
+        if liberar_grid is not None:
+            liberar_grid()
+    try:
+        if psutil is not None and proceso is not None:
+            raiz = psutil.Process(proceso.pid)
+            for hijo in raiz.children(recursive=True):
+                hijo.kill()
+            raiz.kill()
+        elif proceso is not None:
+            proceso.kill()
+    except Exception as e:
+        logger.warning(f"⚠️ No se pudieron terminar los procesos del navegador: {e}")
+    if perfil:
+        shutil.rmtree(perfil[0], ignore_errors=True)
+
+class DriverGestionado:
+    """
+    WebDriver wrapper that replaces the browser when needed.
+
+    The browser is replaced by a new one from `fabrica` before a `get` after
+    `max_paginas` pages or when chromedriver and Chrome together use more
+    than `max_rss_mb` MB, and when a `get` fails because the session no
+    longer responds (the page is then requested again on the new browser).
+    The limits are checked without WebDriver commands; the cookies of the
+    current page are copied right before a planned replacement and every
+    `PAGINAS_POR_COPIA_COOKIES` pages (for a session that dies), and the
+    ones of the destination site are restored in the new browser before
+    navigating, so the login is kept. Every other attribute is delegated to
+    the current browser.
+
+    Args:
+        fabrica (Callable[[], WebDriver]): Factory of new browsers (e.g. a
+            configured `get_chrome_driver`).
+        max_paginas (int, optional): Pages after which the browser is
+            replaced. Defaults to None (never).
+        max_rss_mb (float, optional): Memory in MB above which the browser is
+            replaced. Requires psutil. Defaults to None (never).
+    """
+
+    def __init__(
+        self,
+        fabrica: Callable[[], WebDriver],
+        max_paginas: Optional[int] = None,
+        max_rss_mb: Optional[float] = None
+    ):
+        self.fabrica = fabrica
+        self.max_paginas = max_paginas
+        self.max_rss_mb = max_rss_mb
+        if max_rss_mb and psutil is None:
+            logger.warning("⚠️ psutil no está instalado, no se limita la memoria del navegador")
+        self.driver = fabrica()
+        self.paginas = 0
+        self.reciclajes = 0
+        self._cookies = []
+        _drivers_vivos.add(self)
+
+    def __getattr__(self, nombre: str) -> Any:
+        if nombre == "driver":
+            raise AttributeError(nombre)
+        return(getattr(self.driver, nombre))
+
+    def _copiar_cookies(self) -> None:
+        try:
+            self._cookies = self.driver.get_cookies()
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudieron copiar las cookies del navegador: {e}")
+
+    def _motivo_reciclaje(self) -> Optional[str]:
+        if self.max_paginas and self.paginas >= self.max_paginas:
+            return(f"{self.paginas} páginas")
+        if self.max_rss_mb:
+            memoria = memoria_navegador(self.driver)
+            if memoria is not None and memoria > self.max_rss_mb:
+                return(f"{memoria:.0f} MB de memoria")
+        return(None)
+
+    def reciclar(self, url: str, motivo: str = "reciclaje manual") -> None:
+        """
+        Replace the browser with a new one carrying the cookies of the site
+        of `url`.
+
+        Args:
+            url (str): URL that will be loaded next.
+            motivo (str, optional): Reason shown in the log.
+        """
+        logger.info(f"ℹ️️ Reemplazando el navegador ({motivo})")
+        anterior = self.driver
+        self.driver = self.fabrica()
+        cerrar_driver(anterior)
+        self.paginas = 0
+        self.reciclajes += 1
+
+        partes = urlsplit(url)
+        cookies = [
+            cookie for cookie in self._cookies
+            if (partes.hostname or "").endswith(cookie.get("domain", "").lstrip("."))
+        ]
+        if cookies:
+            self.driver.get(f"{partes.scheme}://{partes.netloc}/")
+            for cookie in cookies:
+                cookie.pop("sameSite", None)
+                self.driver.add_cookie(cookie)
+
+    def get(self, url: str) -> None:
+        """
+        Load a page, replacing the browser first if needed.
+
+        Args:
+            url (str): URL of the page.
+        """
+        motivo = self._motivo_reciclaje()
+        if motivo is not None:
+            self._copiar_cookies()
+            self.reciclar(url, motivo)
+        elif self.paginas % PAGINAS_POR_COPIA_COOKIES == 1:
+            # La primera copia se hace en la segunda página, ya con el login hecho
+            self._copiar_cookies()
+        try:
+            self.driver.get(url)
+        except Exception as e:
+            if not _sesion_muerta(e):
+                raise
+            self.reciclar(url, f"la sesión no responde ({type(e).__name__})")
+            self.driver.get(url)
+        self.paginas += 1
+
+    def quit(self) -> None:
+        """Close the current browser (see `cerrar_driver`)."""
+        _drivers_vivos.discard(self)
+        cerrar_driver(self.driver)
+
+def driver_crudo(driver: WebDriver) -> WebDriver:
+    """
+    Return the browser behind a `DriverGestionado`, or `driver` itself.
+
+    Used by the tab wrappers, which keep window handles that would not
+    survive a browser replacement.
+    """
+    return(driver.driver if isinstance(driver, DriverGestionado) else driver)
+
+@contextmanager
+def driver_gestionado(
+    fabrica: Callable[[], WebDriver],
+    max_paginas: Optional[int] = None,
+    max_rss_mb: Optional[float] = None
+) -> Iterator[DriverGestionado]:
+    """
+    Create a `DriverGestionado` that is always closed when the `with` block
+    ends, even on errors.
+
+    Args:
+        fabrica (Callable[[], WebDriver]): Factory of new browsers.
+        max_paginas (int, optional): Pages after which the browser is
+            replaced. Defaults to None (never).
+        max_rss_mb (float, optional): Memory in MB above which the browser is
+            replaced. Defaults to None (never).
+
+    Yields:
+        DriverGestionado: The managed driver.
+    """
+    driver = DriverGestionado(fabrica, max_paginas, max_rss_mb)
+    try:
+        yield driver
+    finally:
+        driver.quit()
+
+@atexit.register
+def cerrar_drivers_vivos() -> None:
+    """Close every `DriverGestionado` still open (called at exit)."""
+    for driver in list(_drivers_vivos):
+        driver.quit()
+
+# Marca el documento actual y navega después de que el script retorna, así
+# chromedriver no espera la carga con el lock tomado
+SCRIPT_NAVEGAR = (
+    "window.__navegacion_pool = true; var url = arguments[0];"
+    "setTimeout(function() { window.location.href = url; }, 0);"
+)
+# La navegación terminó cuando el documento marcado fue reemplazado y el nuevo
+# ya tiene el DOM listo (como la estrategia "eager")
+SCRIPT_NAVEGANDO = "return window.__navegacion_pool === true || document.readyState === 'loading';"
+INTERVALO_NAVEGACION = 0.05
+
+class PoolPestanas:
+    """
+    Pool of tabs of a single browser, leased to threads as WebDriver views.
+
+    Every view is a shallow copy of `driver` (same chromedriver session) whose
+    commands are serialized with a lock and preceded by a switch to its tab
+    when another tab was active. `get` on a view starts the navigation and
+    waits for it polling in short commands, so other tabs keep working while
+    the page loads. Elements found through a view belong to that view, so
+    the extractors use a leased tab exactly like a driver of their own.
+
+    The original tab is part of the pool and every new tab starts on the URL
+    of `driver`. `driver` itself must not be used while the pool is open.
+
+    Args:
+        driver (WebDriver): Authenticated Selenium WebDriver.
+        n (int): Number of tabs, the original one included.
+        timeout_navegacion (float, optional): Seconds a `get` may take.
+            Defaults to 30.
+    """
+
+    def __init__(self, driver: WebDriver, n: int, timeout_navegacion: float = 30.0):
+        driver = driver_crudo(driver)
+        self.driver = driver
+        self.timeout_navegacion = timeout_navegacion
+        self._lock = threading.Lock()
+        self._original = driver.current_window_handle
+        self._activa = self._original
+        self._libres = Queue()
+        self._vistas = {}
+        url_inicial = driver.current_url
+
+        handles = [self._original]
+        try:
+            for _ in range(max(n, 1) - 1):
+                driver.switch_to.new_window("tab")
+                handles.append(driver.current_window_handle)
+            driver.switch_to.window(self._original)
+            for handle in handles:
+                self._vistas[handle] = self._crear_vista(handle)
+            # Las pestañas nuevas cargan la página del driver en paralelo
+            for handle in handles[1:]:
+                self._navegar(self._vistas[handle], url_inicial)
+            for handle in handles[1:]:
+                self._esperar_navegacion(self._vistas[handle], url_inicial)
+        except Exception:
+            self._handles = handles
+            self.cerrar()
+            raise
+        self._handles = handles
+        for handle in handles:
+            self._libres.put(handle)
+        logger.info(f"🚀 Pool de {len(handles)} pestañas en un solo navegador")
+
+    def _crear_vista(self, handle: str) -> WebDriver:
+        pool = self
+        vista = copy.copy(self.driver)
+        vista._pestana_pool = handle
+
+        def execute(driver_command: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+            with pool._lock:
+                if pool._activa != handle:
+                    pool.driver.switch_to.window(handle)
+                    pool._activa = handle
+                return(type(vista).execute(vista, driver_command, params))
+
+        def get(url: str) -> None:
+            pool._navegar(vista, url)
+            pool._esperar_navegacion(vista, url)
+
+        vista.execute = execute
+        vista.get = get
+        return(vista)
+
+    def _navegar(self, vista: WebDriver, url: str) -> None:
+        vista.execute(Command.W3C_EXECUTE_SCRIPT, {"script": SCRIPT_NAVEGAR, "args": [url]})
+
+    def _esperar_navegacion(self, vista: WebDriver, url: str) -> None:
+        limite = time.monotonic() + self.timeout_navegacion
+        while vista.execute(Command.W3C_EXECUTE_SCRIPT, {"script": SCRIPT_NAVEGANDO, "args": []})["value"]:
+            if time.monotonic() > limite:
+                raise TimeoutException(f"La pestaña no terminó de cargar {url}")
+            time.sleep(INTERVALO_NAVEGACION)
+
+    def arrendar(self, timeout: Optional[float] = None) -> WebDriver:
+        """
+        Lease a free tab, waiting until one is released if needed.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait. Defaults to
+                None (wait forever).
+
+        Returns:
+            WebDriver: View of the leased tab.
+
+        Raises:
+            queue.Empty: If no tab was released within `timeout`.
+        """
+        return(self._vistas[self._libres.get(timeout=timeout)])
+
+    def liberar(self, pestana: WebDriver) -> None:
+        """
+        Give a leased tab back to the pool.
+
+        Args:
+            pestana (WebDriver): View returned by `arrendar`.
+        """
+        self._libres.put(pestana._pestana_pool)
+
+    @contextmanager
+    def arriendo(self) -> Iterator[WebDriver]:
+        """Lease a tab for the duration of a `with` block."""
+        pestana = self.arrendar()
+        try:
+            yield pestana
+        finally:
+            self.liberar(pestana)
+
+    def despachar(self, funcion: Callable[[WebDriver, Any], Any], trabajos: list[Any]) -> list[Any]:
+        """
+        Run `funcion(pestana, trabajo)` for every job on the first free tab.
+
+        Args:
+            funcion (Callable[[WebDriver, Any], Any]): Function receiving a
+                leased tab and a job (e.g. a URL).
+            trabajos (list[Any]): Jobs to run.
+
+        Returns:
+            list[Any]: The results, in job order.
+
+        Raises:
+            Exception: The first exception raised by `funcion`.
+        """
+        def _ejecutar(trabajo: Any) -> Any:
+            with self.arriendo() as pestana:
+                return(funcion(pestana, trabajo))
+
+        with ThreadPoolExecutor(max_workers=len(self._vistas)) as executor:
+            return(list(executor.map(_ejecutar, trabajos)))
+
+    def cerrar(self) -> None:
+        """Close every tab except the original one and switch back to it."""
+        with self._lock:
+            try:
+                for handle in self._handles:
+                    if handle != self._original:
+                        self.driver.switch_to.window(handle)
+                        self.driver.close()
+                self.driver.switch_to.window(self._original)
+                self._activa = self._original
+            except Exception as e:
+                logger.warning(f"⚠️ No se pudieron cerrar las pestañas del pool: {e}")
@@ -0,0 +1,449 @@
+import re
+from typing import Optional
+from urllib.parse import urljoin, urlencode
+import lxml.html
+from lxml.html import HtmlElement
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Parsers de HTML sin navegador.
+
+Estas funciones reciben el HTML crudo de una página (obtenido con una
+petición HTTP o con driver.page_source) y extraen los mismos datos que los
+extractores basados en Selenium. Para que los resultados sean idénticos:
+
+- cargar_html agrega los <tbody> implícitos que el navegador crea al
+  construir el DOM, así los XPath ".//tbody/tr" funcionan igual.
+- texto_visible imita WebElement.text: colapsa espacios, convierte <br> y
+  elementos de bloque en saltos de línea y omite scripts y elementos ocultos.
+'''
+
+ELEMENTOS_BLOQUE = {
+    "address", "article", "aside", "blockquote", "caption", "dd", "div", "dl",
+    "dt", "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2",
+    "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p",
+    "pre", "section", "table", "tbody", "tfoot", "thead", "tr", "ul"
+}
+ELEMENTOS_OCULTOS = {"head", "noscript", "script", "style", "template", "title"}
+CELDAS = {"td", "th"}
+
+def cargar_html(html: str) -> HtmlElement:
+    """
+    Parse an HTML document and normalize it like a browser DOM.
+
+    Table rows that are direct children of a <table> are wrapped in a
+    <tbody>, as browsers do, so XPath expressions written for the Selenium
+    extractors match the same rows.
+
+    Args:
+        html (str): Raw HTML of the page.
+
+    Returns:
+        HtmlElement: The root <html> element of the parsed document.
+    """
+    doc = lxml.html.document_fromstring(html)
+    for tabla in doc.iter("table"):
+        filas_sueltas = [hijo for hijo in tabla if hijo.tag == "tr"]
+        if filas_sueltas:
+            tbody = lxml.html.Element("tbody")
+            filas_sueltas[0].addprevious(tbody)
+            for fila in filas_sueltas:
+                tbody.append(fila)
+    return(doc)
+
+def _oculto(elemento: HtmlElement) -> bool:
+    if elemento.tag in ELEMENTOS_OCULTOS or elemento.get("hidden") is not None:
+        return(True)
+    if elemento.tag == "input" and (elemento.get("type") or "").lower() == "hidden":
+        return(True)
+    estilo = (elemento.get("style") or "").replace(" ", "").lower()
+    return("display:none" in estilo or "visibility:hidden" in estilo)
+
+def texto_visible(elemento: HtmlElement) -> str:
+    """
+    Return the rendered text of an element, like Selenium's `WebElement.text`.
+
+    Whitespace inside text nodes is collapsed to single spaces, <br> and
+    block-level elements produce line breaks, table cells are separated by
+    spaces, and hidden descendants (scripts, styles, `hidden` attribute or
+    inline `display:none`) are skipped. Leading and trailing spaces of every
+    line are removed, as well as empty lines.
+
+    Args:
+        elemento (HtmlElement): Element whose text is extracted.
+
+    Returns:
+        str: The visible text of the element.
+    """
+    partes = []
+
+    def _agregar(texto: Optional[str]) -> None:
+        if texto:
+            partes.append(re.sub(r"[ \t\n\r\f\v]+", " ", texto))
+
+    def _recorrer(nodo: HtmlElement, raiz: bool = False) -> None:
+        if not isinstance(nodo.tag, str):  # comentarios e instrucciones
+            if not raiz:
+                _agregar(nodo.tail)
+            return
+        if raiz or not _oculto(nodo):
+            tag = nodo.tag.lower()
+            if tag == "br":
+                partes.append("\n")
+            if tag in ELEMENTOS_BLOQUE:
+                partes.append("\n")
+            _agregar(nodo.text)
+            for hijo in nodo:
+                _recorrer(hijo)
+            if tag in ELEMENTOS_BLOQUE:
+                partes.append("\n")
+            if tag in CELDAS:
+                partes.append(" ")
+        if not raiz:
+            _agregar(nodo.tail)
+
+    _recorrer(elemento, raiz=True)
+    texto = "".join(partes).replace("\xa0", " ")
+    lineas = [linea.strip(" ") for linea in texto.split("\n")]
+    return("\n".join(linea for linea in lineas if linea))
+
+def _con_clase(clase: str) -> str:
+    return(f"contains(concat(' ', normalize-space(@class), ' '), ' {clase} ')")
+
+def parsear_notas(html: str, curso_url: str) -> Optional[list[dict[str, str]]]:
+    """
+    Extract evaluation names and grades from the HTML of a grades page.
+
+    Mirrors `ucursos.notas_curso`: the target table is the first one whose
+    headers include "Evaluación" and a header containing "Prom"; separator
+    rows are skipped, the evaluation name is read from the <h1> of the first
+    cell and the grade from the <span> of the last cell.
+
+    Args:
+        html (str): Raw HTML of the '<curso>/notas/alumno' page.
+        curso_url (str): URL of the course, stored in every record.
+
+    Returns:
+        list[dict[str, str]] | None: One record per evaluation with the keys
+        "Curso URL", "Evaluación" and "Promedio", or None if the grades table
+        is not present in the page.
+    """
+    doc = cargar_html(html)
+    target_table = None
+    for table in doc.iter("table"):
+        headers = [texto_visible(th).strip() for th in table.iter("th")]
+        if "Evaluación" in headers and any("Prom" in th for th in headers):
+            target_table = table
+            break
+
+    if target_table is None:
+        return(None)
+
+    notas = []
+    for row in target_table.xpath(".//tbody/tr[not(contains(@class, 'separador'))]"):
+        try:
+            cols = row.xpath(".//td")
+            evaluacion = texto_visible(cols[0].xpath(".//h1")[0]).strip()
+            promedio = texto_visible(cols[-1].xpath(".//span")[0]).strip()
+            notas.append({
+                "Curso URL": curso_url,
+                "Evaluación": evaluacion,
+                "Promedio": promedio
+            })
+        except Exception as e:
+            logger.warning(f"⚠️ Could not extract row: {e}")
+    return(notas)
+
+def parsear_acta(html: str, curso_url: str) -> Optional[list[dict[str, str]]]:
+    """
+    Extract the acta statistics from the HTML of an acta page.
+
+    Mirrors `ucursos.acta_curso`: every row of the first "table.detalle"
+    produces a record with the first cell as indicator and the second one as
+    value (empty if the row has a single cell).
+
+    Args:
+        html (str): Raw HTML of the '<curso>/actas/' page.
+        curso_url (str): URL of the course, stored in every record.
+
+    Returns:
+        list[dict[str, str]] | None: One record per indicator with the keys
+        "Curso URL", "Indicador" and "Valor", or None if the acta table is not
+        present in the page.
+    """
+    doc = cargar_html(html)
+    tablas = doc.xpath(f"//table[{_con_clase('detalle')}]")
+    if not tablas:
+        return(None)
+
+    acta = []
+    for row in tablas[0].iter("tr"):
+        cols = row.xpath(".//th") + row.xpath(".//td")
+        if len(cols) == 1:
+            label = texto_visible(cols[0]).strip()
+            value = ""
+        elif len(cols) >= 2:
+            label = texto_visible(cols[0]).strip()
+            value = texto_visible(cols[1]).strip()
+        else:
+            continue
+        acta.append({
+            "Curso URL": curso_url,
+            "Indicador": label,
+            "Valor": value
+        })
+    return(acta)
+
+def pares_indicadores(doc: HtmlElement) -> list[tuple[str, str]]:
+    """
+    Extract the (label, value) pairs of the "indicadores" list of the
+    U-Campus historial page.
+
+    Args:
+        doc (HtmlElement): Document returned by `cargar_html`.
+
+    Returns:
+        list[tuple[str, str]]: Text of each <dt> paired with its <dd>.
+
+    Raises:
+        KeyError: If the page has no element with id "indicadores".
+    """
+    indicadores_dl = doc.get_element_by_id("indicadores")
+    dt_tags = indicadores_dl.xpath(".//dt")
+    dd_tags = indicadores_dl.xpath(".//dd")
+    return([(texto_visible(dt).strip(), texto_visible(dd).strip()) for dt, dd in zip(dt_tags, dd_tags)])
+
+def filas_resumen(doc: HtmlElement) -> list[list[str]]:
+    """
+    Extract the cell texts of every row of the "resumen" table of the
+    U-Campus historial page.
+
+    The table is read even if it is hidden with CSS, like the Selenium
+    extractor does after forcing its visibility.
+
+    Args:
+        doc (HtmlElement): Document returned by `cargar_html`.
+
+    Returns:
+        list[list[str]]: One list of <td> texts per <tr> (empty for header
+        rows).
+
+    Raises:
+        KeyError | IndexError: If the section or its table does not exist.
+    """
+    tabla = doc.get_element_by_id("resumen").xpath(".//table")[0]
+    return([[texto_visible(td).strip() for td in fila.xpath(".//td")] for fila in tabla.iter("tr")])
+
+def tabla_siguiente(doc: HtmlElement, xpath_titulo: str) -> Optional[HtmlElement]:
+    """
+    Return the first <table> sibling that follows the element matched by
+    `xpath_titulo` (usually an <h2>).
+
+    Args:
+        doc (HtmlElement): Document returned by `cargar_html`.
+        xpath_titulo (str): XPath of the title element.
+
+    Returns:
+        HtmlElement | None: The table, or None if the title or the table do
+        not exist.
+    """
+    titulos = doc.xpath(xpath_titulo)
+    if not titulos:
+        return(None)
+    tablas = titulos[0].xpath("following-sibling::table[1]")
+    return(tablas[0] if tablas else None)
+
+def celdas_tabla(
+    tabla: HtmlElement,
+    xpath_filas: str = ".//tbody/tr"
+) -> tuple[list[str], list[list[str]]]:
+    """
+    Extract the header texts and the cell texts of the rows of a table.
+
+    Args:
+        tabla (HtmlElement): The table element.
+        xpath_filas (str, optional): XPath of the rows, relative to the table.
+            Defaults to ".//tbody/tr".
+
+    Returns:
+        tuple[list[str], list[list[str]]]: The <th> texts of the table and one
+        list of <td> texts per row.
+    """
+    encabezados = [texto_visible(th).strip() for th in tabla.iter("th")]
+    filas = [[texto_visible(td).strip() for td in fila.xpath(".//td")] for fila in tabla.xpath(xpath_filas)]
+    return(encabezados, filas)
+
+def celdas_recuento(doc: HtmlElement) -> tuple[list[str], list[list[str]]]:
+    """
+    Extract the "Recuento de UDs" table of U-Campus.
+
+    Args:
+        doc (HtmlElement): Document returned by `cargar_html`.
+
+    Returns:
+        tuple[list[str], list[list[str]]]: The <th> texts of the table and,
+        for every non empty row, the id of its <tbody> (the plan) followed by
+        the <td> texts.
+
+    Raises:
+        IndexError: If the page has no element with class "excel".
+    """
+    tabla = doc.xpath(f"//*[{_con_clase('excel')}]")[0]
+    encabezados = [texto_visible(th).strip() for th in tabla.iter("th")]
+    datos = []
+    for tbody in tabla.iter("tbody"):
+        plan = tbody.get("id", "")
+        for fila in tbody.iter("tr"):
+            columnas = [texto_visible(td).strip() for td in fila.xpath(".//td")]
+            if columnas:
+                datos.append([plan] + columnas)
+    return(encabezados, datos)
+
+def parsear_cursos(html: str, url_pagina: str) -> list[dict[str, object]]:
+    """
+    Extract every entry of the U-Cursos "todos_cursos" page with the roles
+    shown next to it.
+
+    Each cell "td.objetoflex.string" with a link is one entry (courses,
+    communities and institutional pages alike). The roles are taken from the
+    "cargo-<rol>" classes of the "div.cargo" elements of the cell.
+
+    Args:
+        html (str): Raw HTML of the page.
+        url_pagina (str): URL of the page, used to resolve relative links.
+
+    Returns:
+        list[dict[str, object]]: One dictionary per entry, in page order,
+        with the absolute "url", the link text ("nombre") and the list of
+        roles ("cargos", e.g. ["alumno"] or ["auxiliar"]).
+    """
+    doc = cargar_html(html)
+    cursos = []
+    for td in doc.xpath(f"//td[{_con_clase('objetoflex')} and {_con_clase('string')}]"):
+        enlaces = td.xpath(".//a")
+        href = enlaces[0].get("href") if enlaces else None
+        if not href:
+            continue
+        cargos = []
+        for div in td.xpath(f".//div[{_con_clase('cargo')}]"):
+            for clase in div.get("class", "").split():
+                if clase.startswith("cargo-") and clase[len("cargo-"):] not in cargos:
+                    cargos.append(clase[len("cargo-"):])
+        cursos.append({
+            "url": urljoin(url_pagina, href),
+            "nombre": texto_visible(enlaces[0]).strip(),
+            "cargos": cargos
+        })
+    return(cursos)
+
+def parsear_urls_cursos(html: str, url_pagina: str) -> list[str]:
+    """
+    Extract the course URLs of the student from the HTML of the U-Cursos
+    "todos_cursos" page.
+
+    Mirrors `ucursos.urls_cursos`: only cells "td.objetoflex.string" that
+    contain a "div.cargo.cargo-alumno" are kept, and the first link of each
+    cell is resolved against the page URL (like `get_attribute("href")`).
+
+    Args:
+        html (str): Raw HTML of the page.
+        url_pagina (str): URL of the page, used to resolve relative links.
+
+    Returns:
+        list[str]: Absolute course URLs, in page order.
+    """
+    return([curso["url"] for curso in parsear_cursos(html, url_pagina) if "alumno" in curso["cargos"]])
+
+def valor_seleccionado(doc: HtmlElement, id_select: str) -> Optional[str]:
+    """
+    Return the value a <select> shows when the page is rendered: the option
+    marked as selected, or the first option if none is.
+
+    Args:
+        doc (HtmlElement): Document returned by `cargar_html`.
+        id_select (str): id of the <select>.
+
+    Returns:
+        str | None: The value, or None if the select has no options.
+    """
+    opciones = doc.xpath(f"//select[@id='{id_select}']/option")
+    seleccionadas = [opcion for opcion in opciones if opcion.get("selected") is not None]
+    opcion = (seleccionadas or opciones or [None])[0]
+    return(None if opcion is None else opcion.get("value", texto_visible(opcion)))
+
+def url_formulario(
+    doc: HtmlElement,
+    id_campo: str,
+    valor: str,
+    url_pagina: str
+) -> Optional[str]:
+    """
+    Build the URL that the GET form containing a field would load if the
+    field had another value (e.g. the page of another year).
+
+    Args:
+        doc (HtmlElement): Document returned by `cargar_html`.
+        id_campo (str): id of the form field.
+        valor (str): Value for the field.
+        url_pagina (str): URL of the page, used to resolve the form action.
+
+    Returns:
+        str | None: The URL with the form values as query string, or None if
+        the field is not inside a GET form (the page cannot be addressed by
+        URL).
+    """
+    campos = doc.xpath(f"//*[@id='{id_campo}']")
+    if not campos or not campos[0].get("name"):
+        return(None)
+    formularios = list(campos[0].iterancestors("form"))
+    if not formularios or (formularios[0].get("method") or "get").lower() != "get":
+        return(None)
+    formulario, nombre = formularios[0], campos[0].get("name")
+    valores = [(clave, v) for clave, v in formulario.form_values() if clave != nombre] + [(nombre, valor)]
+    accion = urljoin(url_pagina, formulario.get("action") or "")
+    return(f"{accion.split('?')[0]}?{urlencode(valores)}")
+
+def sesion_activa(html: str) -> bool:
+    """
+    Tell whether the HTML of a U-Cursos page was served to a logged-in user.
+
+    Mirrors `ucursos._sesion_activa`: the page must have the logged-in
+    layout (the "navigation-wrapper" element) and no password field, so a
+    login or SSO page reached after the session expired is not mistaken for
+    a course page without content.
+
+    Args:
+        html (str): Raw HTML of the page.
+
+    Returns:
+        bool: True if the page shows the logged-in layout.
+    """
+    doc = cargar_html(html)
+    return(bool(doc.xpath("//*[@id='navigation-wrapper']")) and not doc.xpath("//input[@type='password']"))
+
+def parsear_id_usuario(html: str) -> Optional[str]:
+    """
+    Extract the U-Cursos user id from the HTML of any page seen while logged
+    in.
+
+    Mirrors the logic of `webscrapper.pipeline_ucursos`: the id is the part
+    after the dot of the first class that starts with "usuario" (e.g.
+    "usuario.abc123").
+
+    Args:
+        html (str): Raw HTML of the page.
+
+    Returns:
+        str | None: The user id, or None if no such class is present.
+    """
+    doc = cargar_html(html)
+    for elemento in doc.xpath("//*[@class]"):
+        for clase in elemento.get("class").split():
+            if clase.startswith("usuario") and "." in clase:
+                return(clase.split(".")[1])
+    return(None)
@@ -0,0 +1,205 @@
+import time
+import heapq
+import random
+import threading
+from collections import deque
+from typing import Any, Optional
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Planificador de recorridos con reintentos.
+
+Los trabajos nuevos se entregan primero; un trabajo que falla vuelve a una
+cola diferida y solo se entrega de nuevo cuando pasa su espera (backoff
+exponencial con un poco de azar), así una página lenta o caída nunca retrasa
+a las demás. Si se acumulan muchos fallos seguidos (el sitio está caído o la
+sesión expiró) se abre un circuit breaker: nadie toma trabajos durante el
+enfriamiento, luego un solo trabajo de prueba decide si se sigue (se cierra)
+o se vuelve a abrir con el doble de enfriamiento. Tras demasiadas aperturas
+se abandonan los trabajos que quedan.
+'''
+
+REINTENTOS_POR_DEFECTO = {
+    "max_intentos": 3,
+    "espera_base": 1.0,
+    "espera_max": 30.0,
+    "umbral_fallos": 5,
+    "enfriamiento": 30.0,
+    "max_aperturas": 3
+}
+
+class PlanificadorRecorrido:
+    """
+    Thread-safe job scheduler with a deferred retry queue and a circuit
+    breaker.
+
+    Workers call `siguiente` to get a job and report it with `exito` or
+    `fallo`. `siguiente` blocks while only deferred retries are left or the
+    breaker is open, and returns None when every job has finished.
+
+    Args:
+        trabajos (list[Any]): Jobs to schedule, identified by their index.
+        max_intentos (int, optional): Attempts per job, the first one
+            included. Defaults to 3.
+        espera_base (float, optional): Delay in seconds before the first
+            retry; doubled on every further retry. Defaults to 1.
+        espera_max (float, optional): Maximum retry delay in seconds.
+            Defaults to 30.
+        umbral_fallos (int, optional): Consecutive failures that open the
+            breaker. Defaults to 5.
+        enfriamiento (float, optional): Seconds the breaker stays open the
+            first time; doubled on every reopening. Defaults to 30.
+        max_aperturas (int, optional): Openings after which the remaining
+            jobs are abandoned. Defaults to 3.
+    """
+
+    def __init__(
+        self,
+        trabajos: list[Any],
+        max_intentos: int = 3,
+        espera_base: float = 1.0,
+        espera_max: float = 30.0,
+        umbral_fallos: int = 5,
+        enfriamiento: float = 30.0,
+        max_aperturas: int = 3
+    ):
+        self.max_intentos = max(max_intentos, 1)
+        self.espera_base = espera_base
+        self.espera_max = espera_max
+        self.umbral_fallos = umbral_fallos
+        self.enfriamiento = enfriamiento
+        self.max_aperturas = max_aperturas
+        self.fallidos = {}
+        self._nuevos = deque((i, trabajo, 0) for i, trabajo in enumerate(trabajos))
+        self._diferidos = []
+        self._pendientes = len(trabajos)
+        self._secuencia = 0
+        self._condicion = threading.Condition()
+        # Circuit breaker: "cerrado", "abierto" o "semiabierto"
+        self._estado = "cerrado"
+        self._fallos_seguidos = 0
+        self._aperturas = 0
+        self._abierto_hasta = 0.0
+        self._sonda_en_curso = False
+
+    def siguiente(self, bloquear: bool = True) -> Optional[tuple[int, Any, int]]:
+        """
+        Return the next job to process, waiting if needed.
+
+        Args:
+            bloquear (bool, optional): If False, return None instead of
+                waiting when no job can be handed out right now or the
+                breaker is not closed (used to take a job in advance).
+                Defaults to True.
+
+        Returns:
+            tuple[int, Any, int] | None: The index of the job, the job and
+            the attempt number (0 for the first attempt), or None if there is
+            nothing left to do.
+        """
+        with self._condicion:
+            while True:
+                if self._pendientes <= 0:
+                    return(None)
+                if not bloquear and self._estado != "cerrado":
+                    return(None)
+                ahora = time.monotonic()
+                if self._estado == "abierto":
+                    if ahora < self._abierto_hasta:
+                        self._condicion.wait(self._abierto_hasta - ahora)
+                        continue
+                    self._estado = "semiabierto"
+                    logger.info("ℹ️️ Circuit breaker semiabierto, se prueba con un trabajo")
+                if self._estado == "semiabierto" and self._sonda_en_curso:
+                    self._condicion.wait()
+                    continue
+
+                if self._nuevos:
+                    trabajo = self._nuevos.popleft()
+                elif self._diferidos and self._diferidos[0][0] <= ahora:
+                    trabajo = heapq.heappop(self._diferidos)[2]
+                elif not bloquear:
+                    return(None)
+                else:
+                    # Solo quedan reintentos que aún no toca, o trabajos en curso
+                    espera = self._diferidos[0][0] - ahora if self._diferidos else None
+                    self._condicion.wait(espera)
+                    continue
+
+                if self._estado == "semiabierto":
+                    self._sonda_en_curso = True
+                return(trabajo)
+
+    def exito(self, i: int) -> None:
+        """
+        Report that a job finished successfully.
+
+        Args:
+            i (int): Index of the job.
+        """
+        with self._condicion:
+            self._pendientes -= 1
+            self._fallos_seguidos = 0
+            if self._estado == "semiabierto":
+                self._estado = "cerrado"
+                self._sonda_en_curso = False
+                logger.info("✅ Circuit breaker cerrado, el recorrido continúa")
+            self._condicion.notify_all()
+
+    def fallo(self, i: int, trabajo: Any, intento: int, error: Exception) -> Optional[float]:
+        """
+        Report that a job failed. The job is deferred for a retry, or
+        recorded in `fallidos` if it has no attempts left.
+
+        Args:
+            i (int): Index of the job.
+            trabajo (Any): The job.
+            intento (int): Attempt number returned by `siguiente`.
+            error (Exception): The error raised by the job.
+
+        Returns:
+            float | None: Seconds until the retry, or None if the job will not
+            be retried.
+        """
+        with self._condicion:
+            self._fallos_seguidos += 1
+            espera = None
+            if intento + 1 < self.max_intentos and self._aperturas <= self.max_aperturas:
+                espera = min(self.espera_max, self.espera_base * 2 ** intento)
+                espera += random.uniform(0, espera / 10)
+                self._secuencia += 1
+                heapq.heappush(self._diferidos, (time.monotonic() + espera, self._secuencia, (i, trabajo, intento + 1)))
+            else:
+                self.fallidos[i] = f"{type(error).__name__}: {error}"
+                self._pendientes -= 1
+
+            if self._estado == "semiabierto":
+                self._sonda_en_curso = False
+                self._abrir()
+            elif (self._estado == "cerrado" and self._fallos_seguidos >= self.umbral_fallos
+                    and self._aperturas <= self.max_aperturas):
+                self._abrir()
+            self._condicion.notify_all()
+            return(None if i in self.fallidos else espera)
+
+    def _abrir(self) -> None:
+        self._aperturas += 1
+        if self._aperturas > self.max_aperturas:
+            abandonados = list(self._nuevos) + [trabajo for _, _, trabajo in self._diferidos]
+            for i, _, _ in abandonados:
+                self.fallidos[i] = "Abandonado por circuit breaker"
+            self._pendientes -= len(abandonados)
+            self._nuevos.clear()
+            self._diferidos = []
+            self._estado = "cerrado"
+            logger.error(f"❌ Circuit breaker abierto {self._aperturas - 1} veces, se abandonan {len(abandonados)} trabajos")
+            return
+        enfriamiento = self.enfriamiento * 2 ** (self._aperturas - 1)
+        self._estado = "abierto"
+        self._abierto_hasta = time.monotonic() + enfriamiento
+        logger.warning(f"⚠️ {self._fallos_seguidos} fallos seguidos, circuit breaker abierto por {enfriamiento:.1f}s")
@@ -0,0 +1,123 @@
+import time
+from typing import Any
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import TimeoutException
+from core.scrapper.navegador import driver_crudo, SCRIPT_NAVEGAR, SCRIPT_NAVEGANDO, INTERVALO_NAVEGACION
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Navegación en dos pestañas con precarga.
+
+Con un solo navegador el recorrido alterna red y parseo: driver.get espera
+que la página cargue y recién después se leen las filas de la tabla. Con dos
+pestañas de la misma sesión (mismas cookies, sin otro login) la página
+siguiente se empieza a cargar en la pestaña libre mientras se lee la actual;
+cuando el extractor la pide ya está cargada o a medio camino, así el tiempo
+total se acerca al tiempo de red.
+'''
+
+class PestanasPrefetch:
+    """
+    WebDriver wrapper that can preload the next page in a second tab.
+
+    `anticipar` starts loading a URL in the idle tab without waiting for it,
+    marking the document it replaces (`navegador.SCRIPT_NAVEGAR`). `get`
+    switches to that tab if the URL was preloaded and waits until the marked
+    document is gone, so the previous page of the tab is never read as the new
+    one; otherwise it navigates the current tab as usual. Every other
+    attribute is delegated to the wrapped driver, so the extractors receive it
+    as a regular WebDriver.
+
+    Args:
+        driver (WebDriver): Authenticated Selenium WebDriver. A second tab is
+            opened in the same window session.
+        timeout_navegacion (float, optional): Seconds `get` waits for a
+            preloaded page to replace the previous one. Defaults to 30.
+    """
+
+    def __init__(self, driver: WebDriver, timeout_navegacion: float = 30.0):
+        driver = driver_crudo(driver)
+        self.driver = driver
+        self.timeout_navegacion = timeout_navegacion
+        self._original = driver.current_window_handle
+        driver.switch_to.new_window("tab")
+        self._pestanas = [self._original, driver.current_window_handle]
+        driver.switch_to.window(self._original)
+        self._actual = self._original
+        self._anticipadas = {}  # url -> pestaña donde se está cargando
+
+    def __getattr__(self, nombre: str) -> Any:
+        return(getattr(self.driver, nombre))
+
+    def _libres(self) -> list[str]:
+        return([pestana for pestana in self._pestanas if pestana not in self._anticipadas.values()])
+
+    def anticipar(self, url: str) -> None:
+        """
+        Start loading a page in a tab that is not holding another preloaded
+        page and return immediately.
+
+        Errors are logged and ignored: the page is then loaded normally by
+        `get`.
+
+        Args:
+            url (str): URL that will be requested next.
+        """
+        libres = self._libres()
+        if not libres:
+            return
+        try:
+            self.driver.switch_to.window(libres[0])
+            self.driver.execute_script(SCRIPT_NAVEGAR, url)
+            self._anticipadas[url] = libres[0]
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudo precargar {url}: {e}")
+        finally:
+            self.driver.switch_to.window(self._actual)
+
+    def get(self, url: str) -> None:
+        """
+        Show a page: switch to the tab where it was preloaded and wait until
+        the navigation replaced the previous document, or navigate a tab that
+        is not holding a preloaded page.
+
+        Args:
+            url (str): URL of the page.
+
+        Raises:
+            TimeoutException: If the preloaded page did not replace the
+                previous one within `timeout_navegacion` seconds.
+        """
+        if url in self._anticipadas:
+            self._actual = self._anticipadas.pop(url)
+            self.driver.switch_to.window(self._actual)
+            limite = time.monotonic() + self.timeout_navegacion
+            while self.driver.execute_script(SCRIPT_NAVEGANDO):
+                if time.monotonic() > limite:
+                    raise TimeoutException(f"La pestaña de precarga no terminó de cargar {url}")
+                time.sleep(INTERVALO_NAVEGACION)
+            return
+        libres = self._libres()
+        if not libres:
+            self._anticipadas.clear()
+            libres = [self._actual]
+        if self._actual not in libres:
+            self._actual = libres[0]
+            self.driver.switch_to.window(self._actual)
+        self.driver.get(url)
+
+    def cerrar(self) -> None:
+        """Close the extra tab and leave the driver on its original tab."""
+        try:
+            for pestana in self._pestanas:
+                if pestana != self._original:
+                    self.driver.switch_to.window(pestana)
+                    self.driver.close()
+            self.driver.switch_to.window(self._original)
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudo cerrar la pestaña de precarga: {e}")
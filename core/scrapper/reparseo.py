@@ -0,0 +1,165 @@
+import os
+import pandas as pd
+from pathlib import Path
+from typing import Any
+from core.scrapper.snapshots import AlmacenSnapshots
+from core.scrapper.parsers import (
+    cargar_html, pares_indicadores, filas_resumen, tabla_siguiente,
+    celdas_tabla, celdas_recuento, parsear_notas, parsear_acta,
+    parsear_urls_cursos
+)
+from core.scrapper.ucampus import (
+    tabla_indicadores, tablas_resumen, tabla_dictados, tabla_examenes,
+    tabla_ub, tabla_recuento, XPATH_EXAMENES, H2_UB_ASIGNADAS, H2_UB_ELIMINADAS
+)
+from core.scrapper.excel_exporter import excel_exporter
+import logging
+from config.logger import setup_logger
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+def reparsear_ucampus(almacen: AlmacenSnapshots) -> dict[str, pd.DataFrame]:
+    """
+    Rebuild the U-Campus DataFrames from the stored snapshots of a student.
+
+    The latest snapshot of the historial, UB (one per year) and recuento
+    pages are parsed with the same functions used by the "lxml" backend of
+    `extraer_datos_ucampus`, so the result has the same keys and contents as
+    a live extraction. Sections that cannot be parsed are logged and returned
+    as empty DataFrames.
+
+    Args:
+        almacen (AlmacenSnapshots): Snapshot store of the student.
+
+    Returns:
+        dict[str, pandas.DataFrame]: Same keys as `extraer_datos_ucampus`.
+    """
+    logger.info("🚀 Reparseo de snapshots de ucampus")
+    df_dict = {
+        "indicadores": pd.DataFrame(),
+        "notas": pd.DataFrame(),
+        "semestre": pd.DataFrame(),
+        "docencia": pd.DataFrame(),
+        "titulo": pd.DataFrame(),
+        "UB": pd.DataFrame(),
+        "UB_eliminadas": pd.DataFrame(),
+        "recuento": pd.DataFrame()
+    }
+
+    historial = almacen.ultimas("historial").get(None)
+    if historial:
+        doc = cargar_html(almacen.leer(historial["sha256"]))
+        try:
+            df_dict["indicadores"] = tabla_indicadores(pares_indicadores(doc))
+        except Exception:
+            logger.exception("⚠️ Error al reparsear indicadores")
+        try:
+            # Mismo orden que extraer_datos_ucampus
+            df_dict["notas"], df_dict["semestre"] = tablas_resumen(filas_resumen(doc))
+        except Exception:
+            logger.exception("⚠️ Error al reparsear resumen")
+        try:
+            tabla = tabla_siguiente(doc, "//*[@id='cursos_dictados']")
+            df_dict["docencia"] = tabla_dictados(*celdas_tabla(tabla, ".//tbody/tr[td]"))
+        except Exception:
+            logger.exception("⚠️ Error al reparsear labores docentes")
+        try:
+            df_dict["titulo"] = tabla_examenes(celdas_tabla(tabla_siguiente(doc, XPATH_EXAMENES))[1])
+        except Exception:
+            logger.exception("⚠️ Error al reparsear Exámenes de Grado y/o Título")
+    else:
+        logger.warning("⚠️ No hay snapshot del historial")
+
+    asignadas, eliminadas = [], []
+    for year_value, entrada in almacen.ultimas("ub", "ano").items():
+        doc = cargar_html(almacen.leer(entrada["sha256"]))
+        for locator, destino in ((H2_UB_ASIGNADAS, asignadas), (H2_UB_ELIMINADAS, eliminadas)):
+            tabla = tabla_siguiente(doc, locator[1])
+            if tabla is not None:
+                destino.append(tabla_ub(*celdas_tabla(tabla), year_value))
+    if asignadas:
+        df_dict["UB"] = pd.concat(asignadas, ignore_index=True)
+    if eliminadas:
+        df_dict["UB_eliminadas"] = pd.concat(eliminadas, ignore_index=True)
+
+    recuento = almacen.ultimas("recuento").get(None)
+    if recuento:
+        try:
+            encabezados, datos = celdas_recuento(cargar_html(almacen.leer(recuento["sha256"])))
+            if datos:
+                df_dict["recuento"] = tabla_recuento(encabezados, datos)
+        except Exception:
+            logger.exception("⚠️ Error al reparsear recuento de UDs")
+
+    logger.info("✅ Reparseo de ucampus completado")
+    return(df_dict)
+
+def reparsear_ucursos(almacen: AlmacenSnapshots) -> dict[str, pd.DataFrame]:
+    """
+    Rebuild the U-Cursos DataFrames from the stored snapshots of a student.
+
+    The course order is taken from the latest snapshot of the "todos_cursos"
+    page (or from the order of the stored course pages if it is missing), and
+    the latest notas and actas snapshot of every course are parsed with
+    `parsear_notas` and `parsear_acta`.
+
+    Args:
+        almacen (AlmacenSnapshots): Snapshot store of the student.
+
+    Returns:
+        dict[str, pandas.DataFrame]: Same keys as `extraer_datos_ucursos`.
+    """
+    logger.info("🚀 Reparseo de snapshots de u-cursos")
+    notas = almacen.ultimas("notas", "curso_url")
+    actas = almacen.ultimas("actas", "curso_url")
+
+    cursos = almacen.ultimas("cursos").get(None)
+    if cursos:
+        urls = parsear_urls_cursos(almacen.leer(cursos["sha256"]), cursos["url"])
+    else:
+        urls = list(dict.fromkeys(list(notas) + list(actas)))
+
+    notas_data, acta_data = [], []
+    for curso_url in urls:
+        if curso_url in notas:
+            notas_data += parsear_notas(almacen.leer(notas[curso_url]["sha256"]), curso_url) or []
+        if curso_url in actas:
+            acta_data += parsear_acta(almacen.leer(actas[curso_url]["sha256"]), curso_url) or []
+    logger.info(f"ℹ️️ Total de notas registradas: {len(notas_data)}")
+    logger.info(f"ℹ️️ Total de actas registradas: {len(acta_data)}")
+    return({
+        "Notas_ucursos": pd.DataFrame(notas_data),
+        "Actas_ucursos": pd.DataFrame(acta_data)
+    })
+
+def reparsear_snapshots(
+    settings: dict[str, Any],
+    base_path: str,
+    rut: str
+) -> None:
+    """
+    Re-run the parsers over the stored snapshots of a student and export the
+    raw Excel files, without opening a browser or logging in.
+
+    The files have the same names and sheets as the ones written by
+    `scrapper` ("data_UCAMPUS_<rut>.xlsx" and "data_UCURSOS_<rut>.xlsx"), so
+    `limpiar_datos` can be run right after.
+
+    Args:
+        settings (dict[str, Any]): Configuration dictionary. Must include
+            "output_dir"; the snapshots are read from "<output_dir>/snapshots".
+        base_path (str): Base path where the output directory resides.
+        rut (str): RUT of the student.
+
+    Returns:
+        None
+    """
+    path = os.path.join(base_path, Path(settings["output_dir"]))
+    almacen = AlmacenSnapshots(os.path.join(path, "snapshots"), rut)
+    if not almacen.entradas():
+        logger.warning(f"⚠️ No hay snapshots para el rut {rut}")
+        return
+    excel_exporter(f"data_UCAMPUS_{rut}", path, reparsear_ucampus(almacen))
+    excel_exporter(f"data_UCURSOS_{rut}", path, reparsear_ucursos(almacen))
@@ -0,0 +1,142 @@
+import os
+import json
+import base64
+import hashlib
+from datetime import datetime
+from typing import Any, Optional
+import logging
+from config.logger import setup_logger
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+except ImportError:  # Sin cryptography no se guardan sesiones
+    Fernet = None
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Almacén cifrado de sesiones.
+
+Después de un login exitoso las cookies del sitio se guardan cifradas con
+Fernet en <directorio>/sesion_<hash>.bin, un archivo por usuario y sitio. La
+llave se deriva de la contraseña del usuario con PBKDF2 (y una sal aleatoria
+guardada en <directorio>/sal.bin), así que las cookies solo se pueden leer
+conociendo la contraseña, y si la contraseña cambia las sesiones antiguas
+simplemente dejan de servir.
+'''
+
+ITERACIONES_KDF = 390000
+
+class AlmacenSesiones:
+    """
+    Encrypted, per user and site, store of session cookies.
+
+    Args:
+        directorio (str): Directory of the store.
+        usuario (str): User name; selects the session files.
+        clave (str): Password of the user, used to derive the encryption key.
+
+    Raises:
+        RuntimeError: If the cryptography package is not installed.
+    """
+
+    def __init__(self, directorio: str, usuario: str, clave: str):
+        if Fernet is None:
+            raise RuntimeError("Se necesita cryptography para guardar sesiones")
+        self.directorio = directorio
+        self.usuario = usuario
+        os.makedirs(directorio, exist_ok=True)
+        kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=self._sal(), iterations=ITERACIONES_KDF)
+        self._fernet = Fernet(base64.urlsafe_b64encode(kdf.derive(clave.encode("utf-8"))))
+
+    def _sal(self) -> bytes:
+        ruta = os.path.join(self.directorio, "sal.bin")
+        try:
+            with open(ruta, "xb") as f:
+                sal = os.urandom(16)
+                f.write(sal)
+                return(sal)
+        except FileExistsError:
+            with open(ruta, "rb") as f:
+                return(f.read())
+
+    def _ruta(self, sitio: str) -> str:
+        nombre = hashlib.sha256(f"{self.usuario}|{sitio}".encode("utf-8")).hexdigest()[:24]
+        return(os.path.join(self.directorio, f"sesion_{nombre}.bin"))
+
+    def guardar(self, sitio: str, cookies: list[dict[str, Any]]) -> None:
+        """
+        Encrypt and store the cookies of a site.
+
+        Args:
+            sitio (str): Site identifier (host name).
+            cookies (list[dict[str, Any]]): Cookies as returned by
+                `driver.get_cookies()`.
+        """
+        contenido = json.dumps({
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "cookies": cookies
+        }).encode("utf-8")
+        ruta = self._ruta(sitio)
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "wb") as f:
+            f.write(self._fernet.encrypt(contenido))
+        os.replace(temporal, ruta)
+        logger.debug(f"💾 Sesión guardada para {sitio}")
+
+    def cargar(self, sitio: str) -> Optional[list[dict[str, Any]]]:
+        """
+        Return the stored cookies of a site.
+
+        Args:
+            sitio (str): Site identifier (host name).
+
+        Returns:
+            list[dict[str, Any]] | None: The cookies, or None if there is no
+            session or it cannot be decrypted (e.g. the password changed).
+        """
+        ruta = self._ruta(sitio)
+        if not os.path.exists(ruta):
+            return(None)
+        try:
+            with open(ruta, "rb") as f:
+                return(json.loads(self._fernet.decrypt(f.read()))["cookies"])
+        except (InvalidToken, ValueError, KeyError):
+            logger.warning(f"⚠️ Sesión guardada para {sitio} ilegible, se descarta")
+            self.borrar(sitio)
+            return(None)
+
+    def borrar(self, sitio: str) -> None:
+        """
+        Remove the stored session of a site.
+
+        Args:
+            sitio (str): Site identifier (host name).
+        """
+        try:
+            os.remove(self._ruta(sitio))
+        except FileNotFoundError:
+            pass
+
+def crear_almacen_sesiones(directorio: str, usuario: str, clave: str) -> Optional[AlmacenSesiones]:
+    """
+    Create the session store, or return None (and log why) if it cannot be
+    used, so callers simply fall back to a full login.
+
+    Args:
+        directorio (str): Directory of the store.
+        usuario (str): User name.
+        clave (str): Password of the user.
+
+    Returns:
+        AlmacenSesiones | None: The store, or None.
+    """
+    try:
+        return(AlmacenSesiones(directorio, usuario, clave))
+    except Exception as e:
+        logger.warning(f"⚠️ No se pueden reutilizar sesiones: {e}")
+        return(None)
@@ -0,0 +1,326 @@
+import os
+import json
+import zlib
+import hashlib
+import threading
+from datetime import datetime
+from typing import Any, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+import logging
+from config.logger import setup_logger
+
+try:
+    import zstandard
+except ImportError:  # Sin zstandard se comprime con zlib
+    zstandard = None
+
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+'''
+Almacén local de snapshots HTML.
+
+Cada página descargada por los scrapers se guarda comprimida y direccionada
+por contenido (sha256 del HTML) en <directorio>/blobs, de modo que páginas
+idénticas ocupan un solo archivo aunque se descarguen en muchas corridas o
+para muchos estudiantes. Por cada estudiante se mantiene un índice JSONL
+(index_<rut>.jsonl) con una línea por descarga: URL, fecha, tipo de página,
+metadatos (curso, año) y hash del contenido.
+
+Las páginas de u-cursos y ucampus se parecen mucho entre sí (mismo layout,
+menús y scripts), por lo que con zstandard instalado se puede entrenar un
+diccionario compartido (entrenar_diccionario) que reduce bastante el tamaño
+de cada blob. Los diccionarios quedan en <directorio>/dicts y cada blob zstd
+guarda el id del diccionario con el que se comprimió.
+'''
+
+NIVEL_COMPRESION = 10
+TAMANO_DICCIONARIO = 112640
+MIN_MUESTRAS_DICCIONARIO = 50
+
+class AlmacenSnapshots:
+    """
+    Content-addressed, compressed store of the raw HTML of scraped pages.
+
+    Args:
+        directorio (str): Root directory of the store (shared by all students).
+        rut (str): RUT of the student; selects the index file.
+    """
+
+    def __init__(self, directorio: str, rut: str):
+        self.directorio = directorio
+        self.rut = rut
+        self.corrida = datetime.now().isoformat(timespec="seconds")
+        self._lock = threading.Lock()
+        self._dicts = {}
+        os.makedirs(os.path.join(directorio, "blobs"), exist_ok=True)
+        os.makedirs(os.path.join(directorio, "dicts"), exist_ok=True)
+        self.ruta_indice = os.path.join(directorio, f"index_{rut}.jsonl")
+
+    @staticmethod
+    def _escribir_atomico(ruta: str, datos: bytes) -> None:
+        # Varios procesos (batch) comparten el almacén: se escribe un temporal
+        # en la misma carpeta y se reemplaza, así nadie lee un archivo a medias
+        temporal = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporal, "wb") as f:
+            f.write(datos)
+        os.replace(temporal, ruta)
+
+    # Diccionarios zstd
+    def _ruta_dict(self, dict_id: int) -> str:
+        return(os.path.join(self.directorio, "dicts", f"{dict_id}.zdict"))
+
+    def _cargar_dict(self, dict_id: int):
+        if dict_id not in self._dicts:
+            with open(self._ruta_dict(dict_id), "rb") as f:
+                self._dicts[dict_id] = zstandard.ZstdCompressionDict(f.read())
+        return(self._dicts[dict_id])
+
+    def _dict_actual(self):
+        ruta = os.path.join(self.directorio, "dicts", "actual")
+        if zstandard is None or not os.path.exists(ruta):
+            return(None)
+        with open(ruta, encoding="utf-8") as f:
+            return(self._cargar_dict(int(f.read().strip())))
+
+    # Blobs
+    def _ruta_blob(self, sha: str) -> Optional[str]:
+        carpeta = os.path.join(self.directorio, "blobs", sha[:2])
+        for extension in (".zst", ".zz"):
+            ruta = os.path.join(carpeta, sha + extension)
+            if os.path.exists(ruta):
+                return(ruta)
+        return(None)
+
+    def _escribir_blob(self, sha: str, contenido: bytes) -> None:
+        carpeta = os.path.join(self.directorio, "blobs", sha[:2])
+        os.makedirs(carpeta, exist_ok=True)
+        if zstandard is not None:
+            diccionario = self._dict_actual()
+            compresor = zstandard.ZstdCompressor(level=NIVEL_COMPRESION, dict_data=diccionario)
+            datos, extension = compresor.compress(contenido), ".zst"
+        else:
+            datos, extension = zlib.compress(contenido, 9), ".zz"
+        self._escribir_atomico(os.path.join(carpeta, sha + extension), datos)
+
+    def leer(self, sha: str) -> str:
+        """
+        Return the HTML stored under a content hash.
+
+        Args:
+            sha (str): sha256 of the HTML, as stored in the index.
+
+        Returns:
+            str: The decompressed HTML.
+
+        Raises:
+            FileNotFoundError: If the blob does not exist.
+            RuntimeError: If the blob is zstd-compressed and zstandard is not
+            installed.
+        """
+        ruta = self._ruta_blob(sha)
+        if ruta is None:
+            raise FileNotFoundError(f"Snapshot {sha} no encontrado")
+        with open(ruta, "rb") as f:
+            datos = f.read()
+        if ruta.endswith(".zz"):
+            return(zlib.decompress(datos).decode("utf-8"))
+        if zstandard is None:
+            raise RuntimeError("Se necesita zstandard para leer este snapshot")
+        dict_id = zstandard.get_frame_parameters(datos).dict_id
+        diccionario = self._cargar_dict(dict_id) if dict_id else None
+        return(zstandard.ZstdDecompressor(dict_data=diccionario).decompress(datos).decode("utf-8"))
+
+    def guardar(self, url: str, html: str, tipo: str, **meta: Any) -> str:
+        """
+        Store the HTML of a fetched page and add an entry to the index.
+
+        Args:
+            url (str): URL of the page.
+            html (str): Raw HTML of the page.
+            tipo (str): Page type ("historial", "ub", "recuento", "cursos",
+                "notas", "actas").
+            **meta (Any): Extra data needed to re-parse the page (e.g.
+                `curso_url`, `ano`).
+
+        Returns:
+            str: The sha256 of the HTML (blob key).
+        """
+        contenido = html.encode("utf-8")
+        sha = hashlib.sha256(contenido).hexdigest()
+        with self._lock:
+            if self._ruta_blob(sha) is None:
+                self._escribir_blob(sha, contenido)
+            entrada = {
+                "url": url,
+                "fecha": datetime.now().isoformat(timespec="seconds"),
+                "corrida": self.corrida,
+                "tipo": tipo,
+                "meta": meta,
+                "sha256": sha
+            }
+            with open(self.ruta_indice, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entrada, ensure_ascii=False) + "\n")
+        return(sha)
+
+    def tiene_diccionario(self) -> bool:
+        """Return True if a shared zstd dictionary has already been trained."""
+        return(os.path.exists(os.path.join(self.directorio, "dicts", "actual")))
+
+    def cantidad_blobs(self) -> int:
+        """Return the number of distinct pages stored."""
+        return(sum(
+            len([archivo for archivo in archivos if not archivo.endswith(".tmp")])
+            for _, _, archivos in os.walk(os.path.join(self.directorio, "blobs"))
+        ))
+
+    def entradas(self) -> list[dict[str, Any]]:
+        """
+        Return all the entries of the index of the student, oldest first.
+
+        Returns:
+            list[dict[str, Any]]: Entries with the keys "url", "fecha",
+            "corrida", "tipo", "meta" and "sha256".
+        """
+        if not os.path.exists(self.ruta_indice):
+            return([])
+        with open(self.ruta_indice, encoding="utf-8") as f:
+            return([json.loads(linea) for linea in f if linea.strip()])
+
+    def ultimas(self, tipo: str, clave: Optional[str] = None) -> dict[Any, dict[str, Any]]:
+        """
+        Return the most recent entry of a page type, grouped by a metadata key.
+
+        Args:
+            tipo (str): Page type.
+            clave (str, optional): Metadata key used to group the entries
+                (e.g. "curso_url"). If None, all entries of the type share the
+                same group.
+
+        Returns:
+            dict[Any, dict[str, Any]]: The latest entry for every value of
+            `clave` (or under the key None).
+        """
+        ultimas = {}
+        for entrada in self.entradas():
+            if entrada["tipo"] == tipo:
+                ultimas[entrada["meta"].get(clave) if clave else None] = entrada
+        return(ultimas)
+
+    def entrenar_diccionario(
+        self,
+        tamano: int = TAMANO_DICCIONARIO,
+        recomprimir: bool = True
+    ) -> Optional[int]:
+        """
+        Train a shared zstd dictionary from the stored pages.
+
+        The dictionary captures the markup shared by all pages (layout,
+        menus, scripts), which makes every blob much smaller. New blobs are
+        compressed with it and, if `recomprimir` is True, existing blobs are
+        rewritten with it too. Every file (dictionary, "actual" pointer,
+        recompressed blobs) is replaced atomically, so other processes using
+        the store never read a partial file. Older dictionaries are kept so blobs that still
+        reference them remain readable.
+
+        Args:
+            tamano (int, optional): Dictionary size in bytes. Defaults to
+                112640 (zstd's default).
+            recomprimir (bool, optional): Recompress the existing blobs.
+                Defaults to True.
+
+        Returns:
+            int | None: The id of the new dictionary, or None if zstandard is
+            not installed or there are not enough samples.
+        """
+        if zstandard is None:
+            logger.warning("⚠️ zstandard no está instalado, no se entrena diccionario")
+            return(None)
+        shas = []
+        for raiz, _, archivos in os.walk(os.path.join(self.directorio, "blobs")):
+            shas += [archivo.split(".")[0] for archivo in archivos if not archivo.endswith(".tmp")]
+        muestras = [self.leer(sha).encode("utf-8") for sha in shas]
+        try:
+            diccionario = zstandard.train_dictionary(tamano, muestras)
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudo entrenar diccionario con {len(muestras)} muestras: {e}")
+            return(None)
+        dict_id = diccionario.dict_id()
+        with self._lock:
+            self._escribir_atomico(self._ruta_dict(dict_id), diccionario.as_bytes())
+            self._escribir_atomico(os.path.join(self.directorio, "dicts", "actual"), str(dict_id).encode("utf-8"))
+            self._dicts[dict_id] = diccionario
+            if recomprimir:
+                for sha, muestra in zip(shas, muestras):
+                    ruta_anterior = self._ruta_blob(sha)
+                    self._escribir_blob(sha, muestra)
+                    if ruta_anterior and not ruta_anterior.endswith(".zst"):
+                        os.remove(ruta_anterior)
+        logger.info(f"✅ Diccionario zstd {dict_id} entrenado con {len(muestras)} páginas")
+        return(dict_id)
+
+_almacen_activo: Optional[AlmacenSnapshots] = None
+
+def activar_snapshots(directorio: str, rut: str) -> AlmacenSnapshots:
+    """
+    Enable the snapshot store for the current process.
+
+    While enabled, `guardar_snapshot` and `guardar_pagina` write every page
+    they receive into the store. If the store has enough pages and no
+    dictionary yet, a shared zstd dictionary is trained first.
+
+    Args:
+        directorio (str): Root directory of the store.
+        rut (str): RUT of the student being scraped.
+
+    Returns:
+        AlmacenSnapshots: The active store.
+    """
+    global _almacen_activo
+    _almacen_activo = AlmacenSnapshots(directorio, rut)
+    if (zstandard is not None and not _almacen_activo.tiene_diccionario()
+            and _almacen_activo.cantidad_blobs() >= MIN_MUESTRAS_DICCIONARIO):
+        _almacen_activo.entrenar_diccionario()
+    logger.info(f"📂 Snapshots HTML activos en {directorio}")
+    return(_almacen_activo)
+
+def desactivar_snapshots() -> None:
+    """Disable the snapshot store for the current process."""
+    global _almacen_activo
+    _almacen_activo = None
+
+def guardar_snapshot(url: str, html: str, tipo: str, **meta: Any) -> None:
+    """
+    Store a page in the active snapshot store. Does nothing if the store is
+    not enabled. Errors are logged and never interrupt the scraping.
+
+    Args:
+        url (str): URL of the page.
+        html (str): Raw HTML of the page.
+        tipo (str): Page type.
+        **meta (Any): Extra data needed to re-parse the page.
+    """
+    if _almacen_activo is None:
+        return
+    try:
+        _almacen_activo.guardar(url, html, tipo, **meta)
+    except Exception:
+        logger.exception(f"⚠️ No se pudo guardar snapshot de {url}")
+
+def guardar_pagina(driver: WebDriver, tipo: str, **meta: Any) -> None:
+    """
+    Store the page currently loaded in a WebDriver in the active snapshot
+    store. The page source is only requested if the store is enabled.
+
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance.
+        tipo (str): Page type.
+        **meta (Any): Extra data needed to re-parse the page.
+    """
+    if _almacen_activo is None:
+        return
+    try:
+        guardar_snapshot(driver.current_url, driver.page_source, tipo, **meta)
+    except Exception:
+        logger.exception("⚠️ No se pudo leer la página para el snapshot")
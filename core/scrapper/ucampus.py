@@ -1,5 +1,8 @@
 import pandas as pd
-import time
+from typing import Callable, Optional
+from urllib.parse import urljoin
+from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -7,12 +10,232 @@ from selenium.common.exceptions import ElementClickInterceptedException, Timeout
 from selenium.webdriver.remote.webdriver import WebDriver
 import logging
 from config.logger import setup_logger
+from core.scrapper.esperas import esperar, esperar_recarga, timeout_pagina
+from core.scrapper.parsers import (
+    cargar_html, pares_indicadores, filas_resumen, tabla_siguiente,
+    celdas_tabla, celdas_recuento, valor_seleccionado, url_formulario
+)
+from core.scrapper.snapshots import guardar_pagina, guardar_snapshot
+from core.scrapper.cliente_http import crear_sesion_http, obtener_html
+from core.scrapper.auth import crear_pool_sesiones
+from core.scrapper.navegador import PoolPestanas
+from lxml.html import HtmlElement
 
 setup_logger() 
 logger = logging.getLogger(__name__)
 # Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
 
-def datos_indicadores(driver: WebDriver) -> pd.DataFrame:
+'''
+Backends de extracción:
+
+- "selenium": cada celda se lee con find_elements/.text (una petición
+  WebDriver por llamada).
+- "lxml": se descarga driver.page_source una sola vez por página y las tablas
+  se extraen con core.scrapper.parsers. Ambos backends entregan los mismos
+  textos a la misma lógica de armado, por lo que los DataFrames son iguales.
+'''
+
+def _documento(driver: WebDriver) -> HtmlElement:
+    return(cargar_html(driver.page_source))
+
+XPATH_EXAMENES = '//h2[normalize-space()="Exámenes de Grado y/o Título"]'
+
+def tabla_indicadores(pares: list[tuple[str, str]]) -> pd.DataFrame:
+    """
+    Build the indicators DataFrame from the (label, value) pairs of the
+    "indicadores" section.
+
+    Args:
+        pares (list[tuple[str, str]]): Text of each <dt> with its <dd>.
+
+    Returns:
+        pandas.DataFrame: Columns "Indicador" and "Valor", plus the extra
+        "id_indicador" row.
+    """
+    indicadores = {}
+    for dt, dd in pares:
+        indicadores[dt] = dd
+    indicadores['id_indicador'] = 1
+    return(pd.DataFrame(indicadores.items(), columns=["Indicador", "Valor"]))
+
+def tablas_resumen(filas: list[list[str]]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Build the semester and course DataFrames from the cell texts of the
+    "resumen" table (see `datos_resumen`).
+
+    Args:
+        filas (list[list[str]]): <td> texts of every row of the table.
+
+    Returns:
+        tuple[pandas.DataFrame, pandas.DataFrame]: The semester DataFrame
+        ("Periodo", "CRA", "CAR") and the course DataFrame ("Periodo",
+        "Curso", "Creditos", "Nota").
+    """
+    datos = []
+    cursos = {}
+
+    for columnas in filas:
+        if not columnas:
+            continue  # saltar encabezados
+
+        periodo = columnas[0]
+        cra_car = columnas[1].split("\n")
+        cra = cra_car[0]
+        car = cra_car[1] #columnas[2].text.strip()
+        if car == '0%':
+            continue  # saltar semestres sin ramos terminados
+        semestre =[]
+
+        for texto in columnas[3:]:
+            if texto and texto != '\xa0':
+                cursos_semestre = texto.split(" - ")
+                if len(cursos_semestre) < 2:
+                    continue # saltar entradas sin nota final
+                cursos_semestre = cursos_semestre[0].split()+[cursos_semestre[1]]
+                resumen_semestre = {}
+                resumen_semestre["Curso"] = cursos_semestre[0]
+                resumen_semestre["Créditos"] = float(cursos_semestre[1])
+                resumen_semestre["Nota"] = cursos_semestre[2]
+                semestre.append(resumen_semestre)
+        
+        cursos[periodo] = semestre
+        datos.append({
+            "Periodo": periodo,
+            "CRA": cra,
+            "CAR": car
+        })
+    filas = []
+    for periodo, ramos in cursos.items():
+        for ramo in ramos:
+            filas.append({
+                "Periodo": periodo,
+                "Curso": ramo["Curso"],
+                "Creditos": ramo["Créditos"],
+                "Nota": ramo["Nota"]
+            })
+    logger.info(f"ℹ️️ Extraídas {len(datos)} filas.")
+
+    return(pd.DataFrame(datos), pd.DataFrame(filas))
+
+def tabla_dictados(encabezados: list[str], datos: list[list[str]]) -> pd.DataFrame:
+    """
+    Build the teaching activities DataFrame from the headers and cell texts
+    of the "cursos_dictados" table (see `datos_labores_docentes`).
+
+    Args:
+        encabezados (list[str]): <th> texts of the table.
+        datos (list[list[str]]): <td> texts of every body row.
+
+    Returns:
+        pandas.DataFrame: Columns "Año", "Semestre", "Nombre", "Código" and
+        "Cargo".
+    """
+    # Convertir a DataFrame
+    df_dictados = pd.DataFrame(datos, columns=encabezados)
+
+    # Step 1: Rename first column to 'Nº' if needed
+    if df_dictados.columns[0] != "Nº":
+        df_dictados.columns.values[0] = "Nº"
+
+    # Step 2: Create a new 'Año' column
+    año_col = []
+    current_year = None
+
+    for val in df_dictados["Nº"]:
+        if str(val).isdigit():
+            if len(str(val))==4:
+                current_year = int(val)
+            else:  # Save the year from the separator row
+                año_col.append(current_year)
+
+    # Step 3: Assign 'Año' column and drop rows that are separators
+    df_dictados = df_dictados[df_dictados["Nº"].astype(str).str.len() <= 3].copy()
+    df_dictados["Año"] = año_col
+    df_dictados = df_dictados[df_dictados["Nº"].apply(lambda x: str(x).isdigit())].reset_index(drop=True)
+
+    # Step 4: Drop the "Nº" column
+    df_dictados.drop(columns=["Nº"], inplace=True)
+    # Step 1: Split 'Curso' into two parts using newline character
+    curso_split = df_dictados["Curso"].str.split("\n", expand=True)
+
+    # Step 2: Assign to new columns 'Nombre' and 'Código'
+    df_dictados["Nombre"] = curso_split[0]
+    df_dictados["Código"] = curso_split[1]
+
+    # Step 3: Drop the original 'Curso' column if no longer needed
+    df_dictados.drop(columns=["Curso"], inplace=True)
+
+    # Optional: Reorder columns for better readability
+    df_dictados = df_dictados[["Año", "Semestre", "Nombre", "Código", "Cargo"]]
+    df_dictados.dropna(inplace=True)
+    return(df_dictados)
+
+def tabla_examenes(filas: list[list[str]]) -> pd.DataFrame:
+    """
+    Build the degree/title exams DataFrame from the cell texts of the
+    "Exámenes de Grado y/o Título" table.
+
+    Args:
+        filas (list[list[str]]): <td> texts of every body row.
+
+    Returns:
+        pandas.DataFrame: Columns "Examen / Título", "Fecha", "Nota" and
+        "Profesor Guía".
+    """
+    # Procesar datos en una lista de diccionarios
+    datos = []
+    for columnas in filas:
+        datos.append({
+            "Examen / Título": columnas[0].replace("\n", " "),
+            "Fecha": columnas[1],
+            "Nota": columnas[2],
+            "Profesor Guía": columnas[3]
+        })
+
+    # Convertir a DataFrame
+    df_examenes = pd.DataFrame(datos)
+    return(df_examenes)
+
+def tabla_ub(headers: list[str], rows: list[list[str]], year_value: str) -> pd.DataFrame:
+    """
+    Build the DataFrame of one year of a UB table ("UBs Asignadas" or "UBs
+    Eliminadas"). Rows with fewer cells than headers are skipped.
+
+    Args:
+        headers (list[str]): <th> texts of the table.
+        rows (list[list[str]]): <td> texts of every body row.
+        year_value (str): Year shown in the page, stored in the "Año" column.
+
+    Returns:
+        pandas.DataFrame: The table columns plus "Año".
+    """
+    data = []
+    for cols in rows:
+        if len(cols) < len(headers):
+            continue
+        data.append(cols)
+
+    df = pd.DataFrame(data, columns=headers)
+    df["Año"] = year_value
+    return(df)
+
+def tabla_recuento(encabezados: list[str], datos: list[list[str]]) -> pd.DataFrame:
+    """
+    Build the "Recuento de UDs" DataFrame from the table headers and the
+    rows prefixed with their plan (see `datos_recuento`).
+
+    Args:
+        encabezados (list[str]): <th> texts of the table.
+        datos (list[list[str]]): Plan followed by the <td> texts of each row.
+
+    Returns:
+        pandas.DataFrame: Column "Plan" plus the table headers.
+    """
+    # Añadir columna 'Plan' al inicio
+    encabezados = ["Plan"] + encabezados
+    return(pd.DataFrame(datos, columns=encabezados))
+
+def datos_indicadores(driver: WebDriver, backend: str = "selenium") -> pd.DataFrame:
     """
     Extract student indicators from the web page and return them as a DataFrame. 
     
@@ -26,6 +249,9 @@ def datos_indicadores(driver: WebDriver) -> pd.DataFrame:
     Args:
         driver (WebDriver): A Selenium WebDriver instance pointing to the page
             that contains the student's indicators.
+        backend (str, optional): "selenium" to read the page element by
+            element or "lxml" to parse a single `driver.page_source`
+            snapshot. Defaults to "selenium".
 
     Returns:
         pandas.DataFrame: A DataFrame with two columns:
@@ -38,24 +264,24 @@ def datos_indicadores(driver: WebDriver) -> pd.DataFrame:
         The exception is logged and an empty DataFrame is returned.
         """
     logger.info("📦 Recuperando indicadores")
-    indicadores= {}
     df_indicadores = pd.DataFrame()
     # Indicadores del estudiante
     try:
-        indicadores_dl = driver.find_element(By.ID, "indicadores")
-        dt_tags = indicadores_dl.find_elements(By.TAG_NAME, "dt")
-        dd_tags = indicadores_dl.find_elements(By.TAG_NAME, "dd")
-        for dt, dd in zip(dt_tags, dd_tags):
-            indicadores[dt.text.strip()] = dd.text.strip()
-        indicadores['id_indicador'] = 1
+        if backend == "lxml":
+            pares = pares_indicadores(_documento(driver))
+        else:
+            indicadores_dl = driver.find_element(By.ID, "indicadores")
+            dt_tags = indicadores_dl.find_elements(By.TAG_NAME, "dt")
+            dd_tags = indicadores_dl.find_elements(By.TAG_NAME, "dd")
+            pares = [(dt.text.strip(), dd.text.strip()) for dt, dd in zip(dt_tags, dd_tags)]
+        df_indicadores = tabla_indicadores(pares)
         logger.info("✅ Carga Exitosa: Indicadores")
-        df_indicadores = pd.DataFrame(indicadores.items(), columns=["Indicador", "Valor"])
         return(df_indicadores)
     except Exception:
         logger.exception("⚠️ Error al cargar Indicadores del Estudiante")
         return(df_indicadores)
 
-def datos_resumen(driver: WebDriver) -> tuple[pd.DataFrame, pd.DataFrame]:
+def datos_resumen(driver: WebDriver, backend: str = "selenium") -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Extract the academic summary from the web page and return it as two DataFrames.
 
@@ -68,6 +294,9 @@ def datos_resumen(driver: WebDriver) -> tuple[pd.DataFrame, pd.DataFrame]:
     Args:
         driver (WebDriver): A Selenium WebDriver instance pointing to the page
             containing the academic summary table.
+        backend (str, optional): "selenium" to read the page element by
+            element or "lxml" to parse a single `driver.page_source`
+            snapshot. Defaults to "selenium".
 
     Returns:
         tuple[pandas.DataFrame, pandas.DataFrame]:
@@ -89,68 +318,27 @@ def datos_resumen(driver: WebDriver) -> tuple[pd.DataFrame, pd.DataFrame]:
     df_semestre = pd.DataFrame()
     df_cursos = pd.DataFrame()
     try:
-        # Forzar visibilidad si está oculto por CSS
-        driver.execute_script("document.getElementById('resumen').style.display = 'block';")
-        logger.info("ℹ️️ Div 'resumen' visible. Extrayendo tabla...")
-        resumen = driver.find_element(By.ID,"resumen")
-        tabla = resumen.find_element(By.TAG_NAME, "table")
-        filas = tabla.find_elements(By.TAG_NAME, "tr")
-        datos = []
-        cursos = {}
-
-        for fila in filas:
-            columnas = fila.find_elements(By.TAG_NAME, "td")
-            if not columnas:
-                continue  # saltar encabezados
-
-            periodo = columnas[0].text.strip()
-            cra_car = columnas[1].text.strip().split("\n")
-            cra = cra_car[0]
-            car = cra_car[1] #columnas[2].text.strip()
-            if car == '0%':
-                continue  # saltar semestres sin ramos terminados
-            semestre =[]
-
-            for col in columnas[3:]:
-                texto = col.text.strip()
-                if texto and texto != '\xa0':
-                    cursos_semestre = texto.split(" - ")
-                    if len(cursos_semestre) < 2:
-                        continue # saltar entradas sin nota final
-                    cursos_semestre = cursos_semestre[0].split()+[cursos_semestre[1]]
-                    resumen_semestre = {}
-                    resumen_semestre["Curso"] = cursos_semestre[0]
-                    resumen_semestre["Créditos"] = float(cursos_semestre[1])
-                    resumen_semestre["Nota"] = cursos_semestre[2]
-                    semestre.append(resumen_semestre)
-            
-            cursos[periodo] = semestre
-            datos.append({
-                "Periodo": periodo,
-                "CRA": cra,
-                "CAR": car
-            })
-        filas = []
-        print(datos)
-        for periodo, ramos in cursos.items():
-            for ramo in ramos:
-                filas.append({
-                    "Periodo": periodo,
-                    "Curso": ramo["Curso"],
-                    "Creditos": ramo["Créditos"],
-                    "Nota": ramo["Nota"]
-                })
-        logger.info(f"ℹ️️ Extraídas {len(datos)} filas.")
-
-        df_cursos = pd.DataFrame(filas)
-        df_semestre = pd.DataFrame(datos)
+        if backend == "lxml":
+            # El parser lee la tabla aunque esté oculta por CSS
+            filas = filas_resumen(_documento(driver))
+        else:
+            # Forzar visibilidad si está oculto por CSS
+            driver.execute_script("document.getElementById('resumen').style.display = 'block';")
+            logger.info("ℹ️️ Div 'resumen' visible. Extrayendo tabla...")
+            resumen = driver.find_element(By.ID,"resumen")
+            tabla = resumen.find_element(By.TAG_NAME, "table")
+            filas = [
+                [td.text.strip() for td in fila.find_elements(By.TAG_NAME, "td")]
+                for fila in tabla.find_elements(By.TAG_NAME, "tr")
+            ]
+        df_semestre, df_cursos = tablas_resumen(filas)
         logger.info("✅ Carga Exitosa: Resumen notas")
         return(df_semestre,df_cursos)
     except Exception:
         logger.exception("⚠️ Error al cargar resumen")
         return(df_semestre,df_cursos)
 
-def datos_labores_docentes(driver: WebDriver) -> pd.DataFrame:
+def datos_labores_docentes(driver: WebDriver, backend: str = "selenium") -> pd.DataFrame:
     """
     Extract the table of teaching activities (courses taught by the instructor)
     from the web page and return it as a structured DataFrame.
@@ -165,6 +353,9 @@ def datos_labores_docentes(driver: WebDriver) -> pd.DataFrame:
     Args:
         driver (WebDriver): A Selenium WebDriver instance pointing to the page
             containing the instructor's teaching activities.
+        backend (str, optional): "selenium" to read the page element by
+            element or "lxml" to parse a single `driver.page_source`
+            snapshot. Defaults to "selenium".
 
     Returns:
         pandas.DataFrame: A DataFrame with the following columns:
@@ -184,63 +375,30 @@ def datos_labores_docentes(driver: WebDriver) -> pd.DataFrame:
     df_dictados = pd.DataFrame()
     try:
         # Esperar a que el h2 con id "cursos_dictados" esté presente
-        wait = WebDriverWait(driver, 15)
-        header = wait.until(EC.presence_of_element_located((By.ID, "cursos_dictados")))
-        
-        # Obtener la tabla que viene justo después
-        tabla = header.find_element(By.XPATH, 'following-sibling::table[1]')
-
-        # Obtener los encabezados de la tabla
-        encabezados = [th.text.strip() for th in tabla.find_elements(By.TAG_NAME, "th")]
-
-        # Obtener filas del cuerpo de la tabla
-        filas = tabla.find_elements(By.XPATH, ".//tbody/tr[td]")  # Evita los separadores
-
-        datos = []
-        for fila in filas:
-            celdas = fila.find_elements(By.TAG_NAME, "td")
-            fila_datos = [celda.text.strip() for celda in celdas]
-            datos.append(fila_datos)
-
-        # Convertir a DataFrame
-        df_dictados = pd.DataFrame(datos, columns=encabezados)
-        print(df_dictados.columns)
-
-        # Step 1: Rename first column to 'Nº' if needed
-        if df_dictados.columns[0] != "Nº":
-            df_dictados.columns.values[0] = "Nº"
-
-        # Step 2: Create a new 'Año' column
-        año_col = []
-        current_year = None
-
-        for val in df_dictados["Nº"]:
-            if str(val).isdigit():
-                if len(str(val))==4:
-                    current_year = int(val)
-                else:  # Save the year from the separator row
-                    año_col.append(current_year)
-
-        # Step 3: Assign 'Año' column and drop rows that are separators
-        df_dictados = df_dictados[df_dictados["Nº"].astype(str).str.len() <= 3].copy()
-        df_dictados["Año"] = año_col
-        df_dictados = df_dictados[df_dictados["Nº"].apply(lambda x: str(x).isdigit())].reset_index(drop=True)
-
-        # Step 4: Drop the "Nº" column
-        df_dictados.drop(columns=["Nº"], inplace=True)
-        # Step 1: Split 'Curso' into two parts using newline character
-        curso_split = df_dictados["Curso"].str.split("\n", expand=True)
-
-        # Step 2: Assign to new columns 'Nombre' and 'Código'
-        df_dictados["Nombre"] = curso_split[0]
-        df_dictados["Código"] = curso_split[1]
-
-        # Step 3: Drop the original 'Curso' column if no longer needed
-        df_dictados.drop(columns=["Curso"], inplace=True)
-
-        # Optional: Reorder columns for better readability
-        df_dictados = df_dictados[["Año", "Semestre", "Nombre", "Código", "Cargo"]]
-        df_dictados.dropna(inplace=True)
+        header = esperar(driver, "historial", [(By.ID, "cursos_dictados")])
+
+        if backend == "lxml":
+            tabla = tabla_siguiente(_documento(driver), "//*[@id='cursos_dictados']")
+            if tabla is None:
+                raise NoSuchElementException("Tabla de cursos dictados no encontrada")
+            encabezados, datos = celdas_tabla(tabla, ".//tbody/tr[td]")  # Evita los separadores
+        else:
+            # Obtener la tabla que viene justo después
+            tabla = header.find_element(By.XPATH, 'following-sibling::table[1]')
+
+            # Obtener los encabezados de la tabla
+            encabezados = [th.text.strip() for th in tabla.find_elements(By.TAG_NAME, "th")]
+
+            # Obtener filas del cuerpo de la tabla
+            filas = tabla.find_elements(By.XPATH, ".//tbody/tr[td]")  # Evita los separadores
+
+            datos = []
+            for fila in filas:
+                celdas = fila.find_elements(By.TAG_NAME, "td")
+                fila_datos = [celda.text.strip() for celda in celdas]
+                datos.append(fila_datos)
+
+        df_dictados = tabla_dictados(encabezados, datos)
         logger.info(f"ℹ️️ Total de Labores docentes registradas: {len(df_dictados)}")
         logger.info("✅ Carga Exitosa: Labores docentes")
         return(df_dictados)
@@ -248,7 +406,7 @@ def datos_labores_docentes(driver: WebDriver) -> pd.DataFrame:
         logger.exception("⚠️ Error al cargar labores docentes")
         return(df_dictados)
 
-def datos_examenes_y_titulo(driver: WebDriver) -> pd.DataFrame:
+def datos_examenes_y_titulo(driver: WebDriver, backend: str = "selenium") -> pd.DataFrame:
     """
     Extract information about degree and/or title exams from the web page and
     return it as a DataFrame.
@@ -262,6 +420,9 @@ def datos_examenes_y_titulo(driver: WebDriver) -> pd.DataFrame:
     Args:
         driver (WebDriver): A Selenium WebDriver instance pointing to the page
             containing the "Exámenes de Grado y/o Título" section.
+        backend (str, optional): "selenium" to read the page element by
+            element or "lxml" to parse a single `driver.page_source`
+            snapshot. Defaults to "selenium".
 
     Returns:
         pandas.DataFrame: A DataFrame with the following columns:
@@ -280,238 +441,328 @@ def datos_examenes_y_titulo(driver: WebDriver) -> pd.DataFrame:
     df_examenes = pd.DataFrame()
     try:
         # Esperar hasta que aparezca el <h2> con el texto exacto
-        titulo_h2 = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, '//h2[normalize-space()="Exámenes de Grado y/o Título"]'))
-        )
-
-        # Obtener la siguiente tabla
-        tabla_examenes = titulo_h2.find_element(By.XPATH, 'following-sibling::table[1]')
-
-        # Obtener las filas del cuerpo de la tabla
-        filas = tabla_examenes.find_elements(By.XPATH, './/tbody/tr')
-
-        # Procesar datos en una lista de diccionarios
-        datos = []
-        for fila in filas:
-            columnas = fila.find_elements(By.TAG_NAME, 'td')
-            datos.append({
-                "Examen / Título": columnas[0].text.strip().replace("\n", " "),
-                "Fecha": columnas[1].text.strip(),
-                "Nota": columnas[2].text.strip(),
-                "Profesor Guía": columnas[3].text.strip()
-            })
-
-        # Convertir a DataFrame
-        df_examenes = pd.DataFrame(datos)
+        titulo_h2 = esperar(driver, "historial", [(By.XPATH, XPATH_EXAMENES)])
+
+        if backend == "lxml":
+            tabla = tabla_siguiente(_documento(driver), XPATH_EXAMENES)
+            if tabla is None:
+                raise NoSuchElementException("Tabla de exámenes no encontrada")
+            _, filas = celdas_tabla(tabla)
+        else:
+            # Obtener la siguiente tabla
+            tabla = titulo_h2.find_element(By.XPATH, 'following-sibling::table[1]')
+
+            # Obtener las filas del cuerpo de la tabla
+            filas = [
+                [td.text.strip() for td in fila.find_elements(By.TAG_NAME, 'td')]
+                for fila in tabla.find_elements(By.XPATH, './/tbody/tr')
+            ]
+
+        df_examenes = tabla_examenes(filas)
         logger.info("✅ Carga Exitosa: Exámenes de Grado y/o Título")
         return(df_examenes)
     except Exception:
         logger.exception("⚠️ Error al cargar Exámenes de Grado y/o Título")
         return(df_examenes)
 
-def datos_UB(driver: WebDriver) -> pd.DataFrame:
+H2_UB_ASIGNADAS = (By.XPATH, "//h2[contains(text(), 'UBs Asignadas')]")
+H2_UB_ELIMINADAS = (By.XPATH, "//h2[contains(text(), 'UBs Eliminadas')]")
+
+def _celdas_tabla_ub(
+    driver: WebDriver,
+    locator_h2: tuple[str, str],
+    backend: str
+) -> tuple[list[str], list[list[str]]]:
+    if backend == "lxml":
+        tabla = tabla_siguiente(_documento(driver), locator_h2[1])
+        if tabla is None:
+            raise NoSuchElementException("Tabla de UBs no encontrada")
+        return(celdas_tabla(tabla))
+    table = driver.find_element(*locator_h2).find_element(By.XPATH, "following-sibling::table[1]")
+    headers = [th.text.strip() for th in table.find_elements(By.TAG_NAME, "th")]
+    rows = [
+        [col.text.strip() for col in row.find_elements(By.TAG_NAME, "td")]
+        for row in table.find_elements(By.XPATH, ".//tbody/tr")
+    ]
+    return(headers, rows)
+
+def _seleccionar_year_ub(
+    driver: WebDriver,
+    wait: WebDriverWait,
+    year_value: str
+) -> bool:
     """
-    Extract scholarship unit (UB) assignment data from U-Campus and return it
-    as a consolidated DataFrame.
+    Select a year in the chosen.js dropdown of the "Unidades Becarias" page
+    and wait for the page to show it.
 
-    The function navigates to the "Unidades Becarias" page, iterates over all
-    available years in the year dropdown menu, and extracts the corresponding
-    tables of UB assignments. For each year, the data is collected, stored in
-    a DataFrame, and combined into a single result with an additional "Año"
-    column indicating the academic year. If an error occurs, an empty or
-    partially filled DataFrame is returned.
+    If the year is already selected nothing is clicked. Otherwise the
+    dropdown is opened, the option is clicked and the function waits until
+    the previous UB table is replaced (`esperas.esperar_recarga`) instead of
+    sleeping a fixed time.
 
     Args:
-        driver (WebDriver): A Selenium WebDriver instance pointing to the
-            U-Campus page for "Unidades Becarias".
+        driver (WebDriver): A Selenium WebDriver instance on the UB page.
+        wait (WebDriverWait): Wait used for the clickable elements.
+        year_value (str): Value of the year option to select.
 
     Returns:
-        pandas.DataFrame: A DataFrame containing the extracted UB assignment
-        data with the following columns:
-            - All original columns from the UB assignment tables (varies by system).
-            - "Año" (str): The academic year associated with the assignment.
-
-        Returns an empty or partially filled DataFrame if extraction fails.
-
-    Raises:
-        Exception: If navigation, dropdown interaction, or table parsing fails.
-        The exception is logged and a DataFrame with available data (possibly
-        empty) is returned.
+        bool: False if the option for the year does not exist or the page was
+        not reloaded within the "ub" timeout (the previous year's table is
+        still shown), True otherwise.
     """
-    logger.info("📦 Recuperando historial de pagos de UB")
-    url = "https://ucampus.uchile.cl/m/fcfm_unidades_becarias/becas_alumno"
-    
-    if "medicina" in driver.current_url:
-        url = "https://ucampus.uchile.cl/m/medicina_bia/recuento_uds"
-        return(pd.DataFrame())  # Medicina no tiene historial de UB's asignadas 
-    
-    df_final = pd.DataFrame()
-    try:
-        logger.info("🔁 Navegando a página de Unidades Becarias...")
-        wait = WebDriverWait(driver, 10)
-        driver.get(url)
-
-        wait.until(EC.presence_of_element_located((By.ID, "ano_chosen")))
-
-        year_select = driver.find_element(By.ID, "ano")
-        year_values = [opt.get_attribute("value") for opt in year_select.find_elements(By.TAG_NAME, "option")]
+    if driver.find_element(By.ID, "ano").get_attribute("value") == year_value:
+        return(True)
 
-        for year_value in year_values:
-            logger.info(f"📆 Extrayendo datos del año {year_value}...")
-
-            try:
-                dropdown = wait.until(EC.element_to_be_clickable((By.ID, "ano_chosen")))
-                dropdown.click()
-            except ElementClickInterceptedException:
-                logger.warning("⚠️ Dropdown interceptado, usando JavaScript click.")
-                dropdown = driver.find_element(By.ID, "ano_chosen")
-                driver.execute_script("arguments[0].click();", dropdown)
-
-            time.sleep(0.5)
-
-            year_options = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "ul.chosen-results li")))
-            year_option = next((li for li in year_options if li.text.strip() == year_value), None)
+    anteriores = driver.find_elements(*H2_UB_ASIGNADAS) or driver.find_elements(By.TAG_NAME, "body")
 
-            if not year_option:
-                logger.warning(f"⚠️ No se encontró la opción para el año {year_value}.")
-                continue
-
-            try:
-                year_option.click()
-            except ElementClickInterceptedException:
-                logger.warning("⚠️ Año interceptado, usando JavaScript click.")
-                driver.execute_script("arguments[0].click();", year_option)
-
-            time.sleep(1.5)
+    try:
+        dropdown = wait.until(EC.element_to_be_clickable((By.ID, "ano_chosen")))
+        dropdown.click()
+    except ElementClickInterceptedException:
+        logger.warning("⚠️ Dropdown interceptado, usando JavaScript click.")
+        dropdown = driver.find_element(By.ID, "ano_chosen")
+        driver.execute_script("arguments[0].click();", dropdown)
 
-            h2 = wait.until(EC.presence_of_element_located((By.XPATH, "//h2[contains(text(), 'UBs Asignadas')]")))
-            table = h2.find_element(By.XPATH, "following-sibling::table[1]")
+    year_options = wait.until(EC.visibility_of_all_elements_located((By.CSS_SELECTOR, "ul.chosen-results li")))
+    year_option = next((li for li in year_options if li.text.strip() == year_value), None)
 
-            headers = [th.text.strip() for th in table.find_elements(By.TAG_NAME, "th")]
-            rows = table.find_elements(By.XPATH, ".//tbody/tr")
+    if not year_option:
+        logger.warning(f"⚠️ No se encontró la opción para el año {year_value}.")
+        return(False)
 
-            data = []
-            for row in rows:
-                cols = row.find_elements(By.TAG_NAME, "td")
-                if len(cols) < len(headers):
-                    continue
-                data.append([col.text.strip() for col in cols])
+    try:
+        year_option.click()
+    except ElementClickInterceptedException:
+        logger.warning("⚠️ Año interceptado, usando JavaScript click.")
+        driver.execute_script("arguments[0].click();", year_option)
+
+    if not esperar_recarga(driver, "ub", anteriores[0]):
+        # La tabla del año anterior sigue en la página: leerla la anotaría
+        # con el año nuevo
+        logger.warning(f"⚠️ La página no se recargó con el año {year_value}.")
+        return(False)
+    return(True)
+
+# Rutas relativas al sitio en que está el driver (ver "url_ucampus" en settings)
+RUTA_UB = "/m/fcfm_unidades_becarias/becas_alumno"
+RUTA_RECUENTO = "/m/{facultad}_bia/recuento_uds"
+
+CeldasUB = Optional[tuple[list[str], list[list[str]]]]
+
+def _tablas_ub_documento(doc: HtmlElement) -> tuple[CeldasUB, CeldasUB]:
+    asignadas, eliminadas = (tabla_siguiente(doc, locator[1]) for locator in (H2_UB_ASIGNADAS, H2_UB_ELIMINADAS))
+    return(
+        None if asignadas is None else celdas_tabla(asignadas),
+        None if eliminadas is None else celdas_tabla(eliminadas)
+    )
+
+def _tablas_ub_driver(driver: WebDriver, backend: str) -> tuple[CeldasUB, CeldasUB]:
+    if backend == "lxml":
+        return(_tablas_ub_documento(_documento(driver)))
+    return(tuple(
+        _celdas_tabla_ub(driver, locator, backend) if driver.find_elements(*locator) else None
+        for locator in (H2_UB_ASIGNADAS, H2_UB_ELIMINADAS)
+    ))
+
+def _cargar_year_ub(
+    driver: WebDriver,
+    wait: WebDriverWait,
+    year_value: str,
+    url_year: Optional[str]
+) -> bool:
+    """
+    Show the UB tables of a year in the driver, by URL when the year can be
+    addressed directly or through the dropdown otherwise.
 
-            df = pd.DataFrame(data, columns=headers)
-            df["Año"] = year_value
-            df_final = pd.concat([df_final, df], ignore_index=True)
-        logger.info("✅ Carga Exitosa: Historial de pagos de UB")
-        return(df_final)
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance on the UB page.
+        wait (WebDriverWait): Wait used for the clickable elements.
+        year_value (str): Value of the year option.
+        url_year (str, optional): URL of the page of the year (see
+            `parsers.url_formulario`), or None.
 
-    except Exception as e:
-        logger.exception(f"⚠️ Error general al navegar en Unidades Becarias: {e}")
-        return(df_final)
+    Returns:
+        bool: False if the year cannot be shown, True otherwise.
 
-def datos_UB_eliminados(driver: WebDriver) -> pd.DataFrame:
+    Raises:
+        TimeoutException: If neither UB table appears.
     """
-    Extract data about eliminated scholarship units (UBs) from U-Campus and
-    return it as a consolidated DataFrame.
+    seleccionado = driver.find_element(By.ID, "ano").get_attribute("value") == year_value
+    if url_year and not seleccionado:
+        driver.get(url_year)
+        esperar(driver, "ub", [(By.ID, "ano")])
+        seleccionado = driver.find_element(By.ID, "ano").get_attribute("value") == year_value
+    if not seleccionado and not _seleccionar_year_ub(driver, wait, year_value):
+        return(False)
+    esperar(driver, "ub", [H2_UB_ASIGNADAS, H2_UB_ELIMINADAS])
+    return(True)
+
+def _years_ub_http(
+    driver: WebDriver,
+    urls_year: dict[str, str],
+    workers: int
+) -> dict[str, tuple[CeldasUB, CeldasUB]]:
+    """
+    Download the UB page of several years concurrently, without the browser.
 
-    The function navigates to the "Unidades Becarias" page, iterates over all
-    available years in the year dropdown, and searches for the section titled
-    "UBs Eliminadas". If the section is present, it extracts the table rows and
-    builds a DataFrame for that year. All yearly results are combined into a
-    single DataFrame with an additional "Año" column. If no eliminated UBs are
-    found for a given year, that year is skipped. If an error occurs, an empty
-    or partially filled DataFrame is returned.
+    The session cookies of `driver` are copied into a pooled HTTP session and
+    every year is fetched by URL and parsed with lxml. A year is only
+    accepted if the page really shows it (the year is selected in the
+    dropdown); otherwise, or on any error, it is left out so the caller can
+    load it with the driver.
 
     Args:
-        driver (WebDriver): A Selenium WebDriver instance pointing to the
-            U-Campus "Unidades Becarias" page.
+        driver (WebDriver): Authenticated WebDriver on U-Campus.
+        urls_year (dict[str, str]): URL of the page of every year.
+        workers (int): Number of concurrent downloads.
 
     Returns:
-        pandas.DataFrame: A DataFrame containing eliminated UB data with the
-        following columns:
-            - All original columns extracted from the "UBs Eliminadas" tables.
-            - "Año" (str): The academic year associated with the record.
+        dict[str, tuple]: For every year downloaded, the cells of the
+        assigned and eliminated tables (None if the table is not present).
+    """
+    sesion = crear_sesion_http(driver, pool_size=workers)
+
+    def _descargar(year_value: str, url: str) -> tuple[CeldasUB, CeldasUB]:
+        html = obtener_html(sesion, url, timeout=timeout_pagina("ub"))
+        doc = cargar_html(html)
+        if valor_seleccionado(doc, "ano") != year_value:
+            raise ValueError(f"La página no muestra el año {year_value}")
+        guardar_snapshot(url, html, "ub", ano=year_value)
+        return(_tablas_ub_documento(doc))
+
+    resultados = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futuros = {executor.submit(_descargar, year, url): year for year, url in urls_year.items()}
+        for futuro, year_value in futuros.items():
+            try:
+                resultados[year_value] = futuro.result()
+            except Exception as e:
+                logger.warning(f"⚠️ No se pudo descargar el año {year_value} por HTTP, se usará el navegador: {e}")
+    return(resultados)
+
+def datos_UB_completo(
+    driver: WebDriver,
+    backend: str = "selenium",
+    workers: int = 1
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Extract the assigned and the eliminated scholarship units (UB) of every
+    year from U-Campus in a single pass.
+
+    The function navigates to the "Unidades Becarias" page and reads the
+    available years from the year dropdown. Each year is visited once and
+    both tables ("UBs Asignadas" and "UBs Eliminadas") are read from the same
+    page. When the dropdown belongs to a GET form, each year is loaded
+    directly by URL instead of clicking through chosen.js, and with
+    `workers` greater than one the years are downloaded concurrently over
+    HTTP (`_years_ub_http`); years that cannot be fetched that way fall back
+    to the driver. The per-year tables are combined with a single
+    `pd.concat` at the end.
 
-        Returns an empty or partially filled DataFrame if extraction fails.
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance authenticated on
+            U-Campus.
+        backend (str, optional): "selenium" to read the page element by
+            element or "lxml" to parse a single `driver.page_source`
+            snapshot. Defaults to "selenium".
+        workers (int, optional): Number of years downloaded concurrently.
+            Defaults to 1 (every year is loaded in the driver).
 
-    Raises:
-        Exception: If navigation, dropdown interaction, or table parsing fails.
-        The exception is logged and a DataFrame with available data (possibly
-        empty) is returned.
+    Returns:
+        tuple[pandas.DataFrame, pandas.DataFrame]: The assigned UBs and the
+        eliminated UBs, each with the original table columns plus "Año".
+        Years that fail are logged and skipped, so the DataFrames may be
+        partial or empty.
     """
-    logger.info("📦 Recuperando historial de UB eliminadas")
-    df_final = pd.DataFrame()
-    url = "https://ucampus.uchile.cl/m/fcfm_unidades_becarias/becas_alumno"
-    
+    logger.info("📦 Recuperando historial de UB (asignadas y eliminadas)")
     if "medicina" in driver.current_url:
-        url = "https://ucampus.uchile.cl/m/medicina_bia/recuento_uds"
-        return(pd.DataFrame())  # Medicina no tiene historial de UB's asignadas 
-    
+        return(pd.DataFrame(), pd.DataFrame())  # Medicina no tiene historial de UB's asignadas
+
+    asignadas, eliminadas = [], []
     try:
         logger.info("🔁 Navegando a página de Unidades Becarias...")
-        wait = WebDriverWait(driver, 10)
-        driver.get(url)
-        wait.until(EC.presence_of_element_located((By.ID, "ano_chosen")))
-    
+        wait = WebDriverWait(driver, timeout_pagina("ub"))
+        driver.get(urljoin(driver.current_url, RUTA_UB))
+        esperar(driver, "ub", [(By.ID, "ano_chosen")])
+
         year_select = driver.find_element(By.ID, "ano")
         year_values = [opt.get_attribute("value") for opt in year_select.find_elements(By.TAG_NAME, "option")]
+        doc = _documento(driver)
+        urls_year = {year: url_formulario(doc, "ano", year, driver.current_url) for year in year_values}
 
-        for year_value in year_values:
-            logger.info(f"📆 Extrayendo datos del año {year_value}...")
+        por_year = {}
+        if workers > 1 and all(urls_year.values()):
+            por_year = _years_ub_http(driver, urls_year, workers)
 
-            try:
-                dropdown = wait.until(EC.element_to_be_clickable((By.ID, "ano_chosen")))
-                dropdown.click()
-            except ElementClickInterceptedException:
-                logger.warning("⚠️ Dropdown interceptado, usando JavaScript click.")
-                dropdown = driver.find_element(By.ID, "ano_chosen")
-                driver.execute_script("arguments[0].click();", dropdown)
-
-            time.sleep(0.5)
+        for year_value in year_values:
+            if year_value not in por_year:
+                logger.info(f"📆 Extrayendo datos del año {year_value}...")
+                try:
+                    if not _cargar_year_ub(driver, wait, year_value, urls_year[year_value]):
+                        continue
+                except TimeoutException:
+                    logger.warning(f"⚠️ No hay tablas de UBs para el año {year_value}.")
+                    continue
+                guardar_pagina(driver, "ub", ano=year_value)
+                por_year[year_value] = _tablas_ub_driver(driver, backend)
+
+            celdas_asignadas, celdas_eliminadas = por_year[year_value]
+            if celdas_asignadas is not None:
+                asignadas.append(tabla_ub(*celdas_asignadas, year_value))
+            if celdas_eliminadas is not None:
+                eliminadas.append(tabla_ub(*celdas_eliminadas, year_value))
+            else:
+                logger.warning(f"⚠️ No hay tabla de UBs Eliminadas para el año {year_value}.")
+        logger.info("✅ Carga Exitosa: Historial de pagos de UB y UB's eliminadas")
+    except Exception as e:
+        logger.exception(f"⚠️ Error general al navegar en Unidades Becarias: {e}")
 
-            year_options = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "ul.chosen-results li")))
-            year_option = next((li for li in year_options if li.text.strip() == year_value), None)
+    df_UB = pd.concat(asignadas, ignore_index=True) if asignadas else pd.DataFrame()
+    df_UB_eliminados = pd.concat(eliminadas, ignore_index=True) if eliminadas else pd.DataFrame()
+    return(df_UB, df_UB_eliminados)
 
-            if not year_option:
-                logger.warning(f"⚠️ No se encontró la opción para el año {year_value}.")
-                continue
+def datos_UB(driver: WebDriver, backend: str = "selenium") -> pd.DataFrame:
+    """
+    Extract scholarship unit (UB) assignment data from U-Campus and return it
+    as a consolidated DataFrame.
 
-            try:
-                year_option.click()
-            except ElementClickInterceptedException:
-                logger.warning("⚠️ Año interceptado, usando JavaScript click.")
-                driver.execute_script("arguments[0].click();", year_option)
+    Thin wrapper over `datos_UB_completo` kept for callers that only need the
+    assigned UBs; `extraer_datos_ucampus` uses `datos_UB_completo` directly
+    so the years are visited only once.
 
-            time.sleep(1.5)
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance authenticated on
+            U-Campus.
+        backend (str, optional): "selenium" or "lxml". Defaults to "selenium".
 
-            try:
-                h2 = wait.until(EC.presence_of_element_located(
-                    (By.XPATH, "//h2[contains(text(), 'UBs Eliminadas')]")
-                ))
-                table = h2.find_element(By.XPATH, "following-sibling::table[1]")
-            except (TimeoutException, NoSuchElementException):
-                logger.warning(f"⚠️ No hay tabla de UBs Eliminadas para el año {year_value}.")
-                continue
+    Returns:
+        pandas.DataFrame: The UB assignment tables of every year with an
+        additional "Año" column. Possibly partial or empty if extraction
+        fails.
+    """
+    return(datos_UB_completo(driver, backend)[0])
 
-            headers = [th.text.strip() for th in table.find_elements(By.TAG_NAME, "th")]
-            rows = table.find_elements(By.XPATH, ".//tbody/tr")
+def datos_UB_eliminados(driver: WebDriver, backend: str = "selenium") -> pd.DataFrame:
+    """
+    Extract data about eliminated scholarship units (UBs) from U-Campus and
+    return it as a consolidated DataFrame.
 
-            data = []
-            for row in rows:
-                cols = row.find_elements(By.TAG_NAME, "td")
-                if len(cols) < len(headers):
-                    continue
-                data.append([col.text.strip() for col in cols])
+    Thin wrapper over `datos_UB_completo` kept for callers that only need the
+    eliminated UBs. Years without a "UBs Eliminadas" section are skipped.
 
-            df = pd.DataFrame(data, columns=headers)
-            df["Año"] = year_value
-            df_final = pd.concat([df_final, df], ignore_index=True)
-        logger.info("✅ Carga Exitosa: UB's eliminadas") 
-        return(df_final)
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance authenticated on
+            U-Campus.
+        backend (str, optional): "selenium" or "lxml". Defaults to "selenium".
 
-    except Exception as e:
-        logger.exception(f"❌ Error general al navegar en Unidades Becarias: {e}")
-        return(df_final)
+    Returns:
+        pandas.DataFrame: The eliminated UB tables of every year with an
+        additional "Año" column. Possibly partial or empty if extraction
+        fails.
+    """
+    return(datos_UB_completo(driver, backend)[1])
 
-def datos_recuento(driver: WebDriver) -> pd.DataFrame:
+def datos_recuento(driver: WebDriver, backend: str = "selenium") -> pd.DataFrame:
     """
     Extract the "Recuento de UDs" (unit/credit count) table from U-Campus and
     return it as a pandas DataFrame.
@@ -526,6 +777,9 @@ def datos_recuento(driver: WebDriver) -> pd.DataFrame:
     Args:
         driver (WebDriver): A Selenium WebDriver instance pointing to the page
             containing the recuento de UDs.
+        backend (str, optional): "selenium" to read the page element by
+            element or "lxml" to parse a single `driver.page_source`
+            snapshot. Defaults to "selenium".
 
     Returns:
         pandas.DataFrame: A DataFrame containing the recuento de UDs data with
@@ -541,40 +795,38 @@ def datos_recuento(driver: WebDriver) -> pd.DataFrame:
     """
     logger.info("📦 Recuperando Recuento de UDs")
     
-    url = "https://ucampus.uchile.cl/m/fcfm_bia/recuento_uds"
-    
-    if "medicina" in driver.current_url:
-        url = "https://ucampus.uchile.cl/m/medicina_bia/recuento_uds"
-    
+    facultad = "medicina" if "medicina" in driver.current_url else "fcfm"
+    url = urljoin(driver.current_url, RUTA_RECUENTO.format(facultad=facultad))
+
     try:
         driver.get(url)
-        wait = WebDriverWait(driver, 10)
 
         # Esperar tabla principal con clase "excel"
-        tabla = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "excel")))
-
-        # Obtener encabezados
-        encabezados = [th.text.strip() for th in tabla.find_elements(By.TAG_NAME, "th")]
-
-        # Añadir columna 'Plan' al inicio
-        encabezados = ["Plan"] + encabezados
-
-        datos = []
-        # Iterar sobre los <tbody> de la tabla (uno por plan)
-        tbodies = tabla.find_elements(By.TAG_NAME, "tbody")
-        for tbody in tbodies:
-            plan = tbody.get_attribute("id")  # Usamos el id del tbody como nombre del plan
-            filas = tbody.find_elements(By.TAG_NAME, "tr")
-            for fila in filas:
-                columnas = [td.text.strip() for td in fila.find_elements(By.TAG_NAME, "td")]
-                if columnas:  # Evitar filas vacías
-                    datos.append([plan] + columnas)
+        tabla = esperar(driver, "recuento", [(By.CLASS_NAME, "excel")])
+        guardar_pagina(driver, "recuento")
+
+        if backend == "lxml":
+            encabezados, datos = celdas_recuento(_documento(driver))
+        else:
+            # Obtener encabezados
+            encabezados = [th.text.strip() for th in tabla.find_elements(By.TAG_NAME, "th")]
+
+            datos = []
+            # Iterar sobre los <tbody> de la tabla (uno por plan)
+            tbodies = tabla.find_elements(By.TAG_NAME, "tbody")
+            for tbody in tbodies:
+                plan = tbody.get_attribute("id")  # Usamos el id del tbody como nombre del plan
+                filas = tbody.find_elements(By.TAG_NAME, "tr")
+                for fila in filas:
+                    columnas = [td.text.strip() for td in fila.find_elements(By.TAG_NAME, "td")]
+                    if columnas:  # Evitar filas vacías
+                        datos.append([plan] + columnas)
 
         if not datos:
             logger.info("⚠️ No se encontraron datos en la tabla.")
             return(pd.DataFrame())
 
-        df = pd.DataFrame(datos, columns=encabezados)
+        df = tabla_recuento(encabezados, datos)
         logger.info("✅ Datos de recuento extraídos correctamente.")
         return(df)
 
@@ -582,7 +834,14 @@ def datos_recuento(driver: WebDriver) -> pd.DataFrame:
         logger.exception(f"❌ Error al obtener el recuento de UDs: {e}")
         return(pd.DataFrame())
 
-def extraer_datos_ucampus(driver: WebDriver) -> dict[str, pd.DataFrame]:
+def extraer_datos_ucampus(
+    driver: WebDriver,
+    backend: str = "selenium",
+    ub_workers: int = 1,
+    workers: int = 1,
+    crear_driver: Optional[Callable[[], WebDriver]] = None,
+    pestanas: bool = False
+) -> dict[str, pd.DataFrame]:
     """
     Extract all available academic data from U-Campus and return it as a
     dictionary of DataFrames.
@@ -594,9 +853,32 @@ def extraer_datos_ucampus(driver: WebDriver) -> dict[str, pd.DataFrame]:
     source is parsed into a pandas DataFrame, and all results are grouped into
     a single dictionary with descriptive keys.
 
+    The extractors are grouped in three independent sections: the historial
+    page (indicadores, resumen, docencia, titulo), the UB pages and the
+    recuento page. When `workers` is greater than one and a `crear_driver`
+    factory is given, up to two additional browsers receive the session of
+    `driver` (`crear_pool_sesiones`) and the sections run concurrently, so
+    the total time is close to the one of the slowest section. With
+    `pestanas`, the sections run on tabs of `driver` instead
+    (`navegador.PoolPestanas`), without starting other browsers. The
+    additional browsers or tabs are always closed before returning.
+
     Args:
         driver (WebDriver): A Selenium WebDriver instance authenticated and
             pointing to U-Campus.
+        backend (str, optional): Extraction backend passed to every
+            extractor: "selenium" (one WebDriver call per element) or "lxml"
+            (one `driver.page_source` per page, parsed locally). Both produce
+            the same DataFrames. Defaults to "selenium".
+        ub_workers (int, optional): Number of UB years downloaded
+            concurrently (see `datos_UB_completo`). Defaults to 1.
+        workers (int, optional): Number of browsers used for the sections.
+            Defaults to 1 (sequential extraction).
+        crear_driver (Callable[[], WebDriver], optional): Factory used to
+            create the additional browsers. Required when `workers > 1`
+            unless `pestanas` is set.
+        pestanas (bool, optional): Run the sections on tabs of `driver`
+            instead of additional browsers. Defaults to False.
 
     Returns:
         dict[str, pandas.DataFrame]: A dictionary where each key maps to a
@@ -618,27 +900,76 @@ def extraer_datos_ucampus(driver: WebDriver) -> dict[str, pd.DataFrame]:
     """
     logger.info("🚀 Inicio webscrapping de ucampus")
 
-    df_dict = {}
-    try:
-        dict_indicadores = datos_indicadores(driver)
-        df_cursos, df_semestre = datos_resumen(driver) # type: ignore
-        df_dictados = datos_labores_docentes(driver)
-        df_examenes = datos_examenes_y_titulo(driver)
-        df_UB = datos_UB(driver)
-        df_UB_eliminados = datos_UB_eliminados(driver)
-        df_recuento = datos_recuento(driver)
-        df_dict={
+    def _historial(d: WebDriver) -> dict[str, pd.DataFrame]:
+        guardar_pagina(d, "historial")
+        dict_indicadores = datos_indicadores(d, backend)
+        df_cursos, df_semestre = datos_resumen(d, backend) # type: ignore
+        df_dictados = datos_labores_docentes(d, backend)
+        df_examenes = datos_examenes_y_titulo(d, backend)
+        return({
             "indicadores": dict_indicadores,
             "notas": df_cursos,
             "semestre": df_semestre,
             "docencia": df_dictados,
-            "titulo": df_examenes,
-            "UB": df_UB,
-            "UB_eliminadas": df_UB_eliminados,
-            "recuento": df_recuento
-        }
+            "titulo": df_examenes
+        })
+
+    def _ub(d: WebDriver) -> dict[str, pd.DataFrame]:
+        df_UB, df_UB_eliminados = datos_UB_completo(d, backend, ub_workers)
+        return({"UB": df_UB, "UB_eliminadas": df_UB_eliminados})
+
+    def _recuento(d: WebDriver) -> dict[str, pd.DataFrame]:
+        return({"recuento": datos_recuento(d, backend)})
+
+    # Las secciones se reparten entre los drivers; todos parten en el historial
+    secciones = Queue()
+    for seccion in (_historial, _ub, _recuento):
+        secciones.put(seccion)
+    resultados = {}
+
+    def _trabajador(d: WebDriver) -> None:
+        while True:
+            try:
+                seccion = secciones.get_nowait()
+            except Empty:
+                return
+            try:
+                resultados.update(seccion(d))
+            except Exception as e:
+                logger.exception(f"❌ Error al extraer datos de ucampus: {e}")
+
+    drivers_extra = []
+    pool = None
+    n = min(workers, secciones.qsize())
+    if n > 1 and pestanas:
+        try:
+            pool = PoolPestanas(driver, n)
+        except Exception:
+            logger.warning("⚠️ No se pudo crear el pool de pestañas, se continúa con un solo driver")
+    elif n > 1 and crear_driver is not None:
+        try:
+            drivers_extra = crear_pool_sesiones(driver, n - 1, crear_driver)
+        except Exception:
+            logger.warning("⚠️ No se pudieron crear sesiones adicionales, se continúa con un solo driver")
+    try:
+        if pool is not None:
+            with ThreadPoolExecutor(max_workers=n) as executor:
+                for futuro in [executor.submit(_trabajador, pool.arrendar()) for _ in range(n)]:
+                    futuro.result()
+        elif drivers_extra:
+            with ThreadPoolExecutor(max_workers=len(drivers_extra) + 1) as executor:
+                for futuro in [executor.submit(_trabajador, d) for d in [driver] + drivers_extra]:
+                    futuro.result()
+        else:
+            _trabajador(driver)
+    finally:
+        for driver_extra in drivers_extra:
+            driver_extra.quit()
+        if pool is not None:
+            pool.cerrar()
+
+    claves = ["indicadores", "notas", "semestre", "docencia", "titulo", "UB", "UB_eliminadas", "recuento"]
+    df_dict = {clave: resultados[clave] for clave in claves if clave in resultados}
+    if len(df_dict) == len(claves):
         logger.info("✅ Extracción de datos de ucampus completada")
-        return(df_dict)
-    except Exception as e:
-        logger.exception(f"❌ Error al extraer datos de ucampus: {e}")
-        return(df_dict)
+    return(df_dict)
@@ -1,14 +1,35 @@
 import pandas as pd
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+from selenium.common.exceptions import TimeoutException
 import logging
 from config.logger import setup_logger
+from core.scrapper.esperas import esperar, timeout_completo
+from core.scrapper.planificador import PlanificadorRecorrido, REINTENTOS_POR_DEFECTO
+from core.scrapper.snapshots import guardar_pagina, guardar_snapshot
+from core.scrapper.auth import crear_pool_sesiones
+from core.scrapper.cliente_http import crear_sesion_http, obtener_html
+from core.scrapper.parsers import parsear_notas, parsear_acta, sesion_activa
+from core.scrapper.incremental import separar_cursos, combinar_datos
+from core.scrapper.diario import diario_activo
+from core.scrapper.errores import PaginaSinContenido, SesionExpirada
+from core.scrapper.cache_negativo import cache_negativo_activo
+from core.scrapper.cache_actas import cache_actas_activo
+from core.scrapper.prefetch import PestanasPrefetch
+from core.scrapper.navegador import PoolPestanas
+import requests
 
 setup_logger() 
 logger = logging.getLogger(__name__)
 # Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏📋
 
+TABLA_NOTAS = (By.XPATH, "//table[.//th[normalize-space()='Evaluación']]")
+TABLA_ACTA = (By.CSS_SELECTOR, "table.detalle")
+# Ruta de cada tipo de página, relativa a la URL del curso
+RUTAS_PAGINAS = {"notas": "notas/alumno", "actas": "actas/"}
+
 def urls_cursos(driver: WebDriver) -> list[str]:
     """
     Extract the list of course URLs for a student from a web page using Selenium.
@@ -30,6 +51,7 @@ def urls_cursos(driver: WebDriver) -> list[str]:
         search or attribute extraction.
     """
     logger.info("📋 Iniciando extracción de urls de u-cursos")
+    guardar_pagina(driver, "cursos")
     urls_cursos_alumno = []
 
     # Encuentra todos los td que contienen los cursos
@@ -52,9 +74,384 @@ def urls_cursos(driver: WebDriver) -> list[str]:
     logger.info(f"✅ {len(urls_cursos_alumno)} urls de u-cursos obtenidos")
     return(urls_cursos_alumno)
 
+# Layout de usuario conectado: sin él la página es el login o un paso del SSO
+SCRIPT_SESION_ACTIVA = (
+    "return document.getElementById('navigation-wrapper') !== null"
+    " && document.querySelector('input[type=password]') === null;"
+)
+
+def _pagina_completa(driver: WebDriver) -> bool:
+    try:
+        return(driver.execute_script("return document.readyState;") == "complete")
+    except Exception:
+        return(False)
+
+def _sesion_activa(driver: WebDriver) -> bool:
+    try:
+        return(bool(driver.execute_script(SCRIPT_SESION_ACTIVA)))
+    except Exception:
+        return(False)
+
+def _sin_contenido(mensaje: str, activa: bool) -> Exception:
+    # Una página sin tabla solo cuenta como vacía si sigue mostrando la sesión
+    if activa:
+        return(PaginaSinContenido(mensaje))
+    return(SesionExpirada(f"{mensaje}: la página no muestra la sesión iniciada"))
+
+def notas_curso(
+    driver: WebDriver,
+    curso_url: str
+) -> list[dict[str, str]]:
+    """
+    Extract evaluation names and grades from the grades page of one course.
+
+    The function navigates to the grades page of the course (appending
+    'notas/alumno' to the URL), locates the table that contains evaluations
+    and their averages, and extracts the relevant rows. If the table is not
+    present, a warning is logged and an empty list is returned.
+
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance used to navigate the
+            course page.
+        curso_url (str): URL of the course.
+
+    Returns:
+        list[dict[str, str]]: One record per evaluation with the keys
+        "Curso URL", "Evaluación" and "Promedio".
+
+    Raises:
+        PaginaSinContenido: If the page loaded, shows the logged-in layout
+            and has no grades table.
+        SesionExpirada: If the page loaded without the logged-in layout
+            (e.g. a login redirect).
+        Exception: If the page cannot be loaded or the table cannot be read.
+    """
+    link_notas = curso_url + RUTAS_PAGINAS["notas"]
+    notas = []
+    driver.get(link_notas)
+    try:
+        esperar(driver, "notas", [TABLA_NOTAS])
+    except TimeoutException:
+        pass  # Si no aparece, la búsqueda de abajo lo reporta
+    guardar_pagina(driver, "notas", curso_url=curso_url)
+
+
+    # Encuentra la tabla correcta
+    tables = driver.find_elements(By.TAG_NAME, "table")
+    target_table = next(
+        (table for table in tables
+        if "Evaluación" in [th.text.strip() for th in table.find_elements(By.TAG_NAME, "th")]
+        and any("Prom" in th.text.strip() for th in table.find_elements(By.TAG_NAME, "th"))),
+        None
+    )
+
+    if target_table:
+        rows = target_table.find_elements(By.XPATH, ".//tbody/tr[not(contains(@class, 'separador'))]")
+        for row in rows:
+            try:
+                cols = row.find_elements(By.TAG_NAME, "td")
+                evaluacion = cols[0].find_element(By.TAG_NAME, "h1").text.strip()
+                promedio = cols[-1].find_element(By.TAG_NAME, "span").text.strip()
+                notas.append({
+                    "Curso URL": curso_url,
+                    "Evaluación": evaluacion,
+                    "Promedio": promedio
+                })
+                
+            except Exception as e:
+                logger.warning(f"⚠️ Could not extract row: {e}")
+    elif _pagina_completa(driver):
+        raise _sin_contenido(f"Tabla de notas no encontrada en {link_notas}", _sesion_activa(driver))
+    else:
+        raise TimeoutException(f"La página {link_notas} no terminó de cargar")
+    return(notas)
+
+def acta_curso(
+    driver: WebDriver,
+    curso_url: str
+) -> list[dict[str, str]]:
+    """
+    Extract the acta (record) statistics from the acta page of one course.
+
+    The function navigates to the acta page of the course (appending 'actas/'
+    to the URL), locates the detail table, and extracts one record per row.
+    Each row typically contains an indicator (label) and its associated
+    value. If a row has only one cell, the value is recorded as an empty
+    string.
+
+    Args:
+        driver (WebDriver): A Selenium WebDriver instance used to navigate the
+            course page.
+        curso_url (str): URL of the course.
+
+    Returns:
+        list[dict[str, str]]: One record per indicator with the keys
+        "Curso URL", "Indicador" and "Valor".
+
+    Raises:
+        PaginaSinContenido: If the page loaded, shows the logged-in layout
+            and has no acta table.
+        SesionExpirada: If the page loaded without the logged-in layout
+            (e.g. a login redirect).
+        Exception: If the page cannot be loaded.
+    """
+    link_acta = curso_url + RUTAS_PAGINAS["actas"]
+    acta = []
+    driver.get(link_acta)
+
+    try:
+        table = esperar(driver, "actas", [TABLA_ACTA])
+    except TimeoutException:
+        if _pagina_completa(driver):
+            raise _sin_contenido(f"Tabla de acta no encontrada en {link_acta}", _sesion_activa(driver))
+        raise
+    finally:
+        guardar_pagina(driver, "actas", curso_url=curso_url)
+    rows = table.find_elements(By.TAG_NAME, "tr")
+
+    for row in rows:
+        try:
+            cols = row.find_elements(By.TAG_NAME, "th") + row.find_elements(By.TAG_NAME, "td")
+            if len(cols) == 1:
+                label = cols[0].text.strip()
+                value = ""
+            elif len(cols) >= 2:
+                label = cols[0].text.strip()
+                value = cols[1].text.strip()
+            else:
+                continue
+            acta.append({
+                "Curso URL": curso_url,
+                "Indicador": label,
+                "Valor": value
+            })
+        except Exception as e:
+            logger.warning(f"⚠️ Error parsing row in acta")
+    return(acta)
+
+def notas_curso_http(
+    sesion: requests.Session,
+    curso_url: str
+) -> list[dict[str, str]]:
+    """
+    Extract evaluation names and grades of one course without a browser.
+
+    Downloads '<curso>/notas/alumno' with an authenticated HTTP session and
+    parses it with `parsers.parsear_notas`. The records are identical to the
+    ones returned by `notas_curso`.
+
+    Args:
+        sesion (requests.Session): Session created with `crear_sesion_http`.
+        curso_url (str): URL of the course.
+
+    Returns:
+        list[dict[str, str]]: One record per evaluation with the keys
+        "Curso URL", "Evaluación" and "Promedio".
+
+    Raises:
+        PaginaSinContenido: If the page shows the logged-in layout and has
+            no grades table.
+        SesionExpirada: If the page has no logged-in layout (e.g. a login
+            redirect).
+        Exception: If the page cannot be downloaded.
+    """
+    link_notas = curso_url + RUTAS_PAGINAS["notas"]
+    html = obtener_html(sesion, link_notas)
+    guardar_snapshot(link_notas, html, "notas", curso_url=curso_url)
+    notas = parsear_notas(html, curso_url)
+    if notas is None:
+        raise _sin_contenido(f"Tabla de notas no encontrada en {link_notas}", sesion_activa(html))
+    return(notas)
+
+def acta_curso_http(
+    sesion: requests.Session,
+    curso_url: str
+) -> list[dict[str, str]]:
+    """
+    Extract the acta statistics of one course without a browser.
+
+    Downloads '<curso>/actas/' with an authenticated HTTP session and parses
+    it with `parsers.parsear_acta`. The records are identical to the ones
+    returned by `acta_curso`.
+
+    Args:
+        sesion (requests.Session): Session created with `crear_sesion_http`.
+        curso_url (str): URL of the course.
+
+    Returns:
+        list[dict[str, str]]: One record per indicator with the keys
+        "Curso URL", "Indicador" and "Valor".
+
+    Raises:
+        PaginaSinContenido: If the page shows the logged-in layout and has
+            no acta table.
+        SesionExpirada: If the page has no logged-in layout (e.g. a login
+            redirect).
+        Exception: If the page cannot be downloaded.
+    """
+    link_acta = curso_url + RUTAS_PAGINAS["actas"]
+    html = obtener_html(sesion, link_acta)
+    guardar_snapshot(link_acta, html, "actas", curso_url=curso_url)
+    acta = parsear_acta(html, curso_url)
+    if acta is None:
+        raise _sin_contenido(f"Tabla de acta no encontrada en {link_acta}", sesion_activa(html))
+    return(acta)
+
+EXTRACTORES_SELENIUM = {"notas": notas_curso, "actas": acta_curso}
+EXTRACTORES_HTTP = {"notas": notas_curso_http, "actas": acta_curso_http}
+
+def recorrer_cursos(
+    drivers: list,
+    trabajos: list[tuple[str, str]],
+    extractores: dict[str, Callable] = EXTRACTORES_SELENIUM,
+    reintentos: Optional[dict] = None,
+    prefetch: bool = False
+) -> dict[str, list[dict[str, str]]]:
+    """
+    Visit a list of course pages spreading them across several WebDrivers.
+
+    Each job is a tuple ("notas" | "actas", course URL). Jobs are handed out
+    by a `PlanificadorRecorrido` and every driver runs in its own thread
+    taking the next pending job as soon as it finishes the previous one, so
+    slow pages do not block the other drivers. A page that fails is not
+    dropped: it goes to a deferred retry queue with exponential backoff and
+    is retried (with the full configured timeout, see
+    `esperas.timeout_completo`) only after the fresh pages, and repeated
+    failures open a circuit breaker that pauses the crawl. Pages that fail
+    every attempt are logged and skipped. Results are returned in the same
+    order as the jobs, regardless of which driver processed them.
+
+    A page that loads, still shows the logged-in layout and has no table
+    (`PaginaSinContenido`) counts as done with no rows and is not retried.
+    A page without the logged-in layout (`SesionExpirada`, e.g. a login
+    redirect) is a regular failure: it is retried and nothing is written to
+    the journal or the negative cache. If the negative cache is active (see
+    `core.scrapper.cache_negativo`), such pages are recorded there and pages
+    with a valid entry are not visited.
+
+    If the shared acta cache is active (see `core.scrapper.cache_actas`),
+    actas cached by any student's run are taken from it instead of visiting
+    their pages, and every acta downloaded here is stored in it.
+
+    If a crawl journal is active (see `core.scrapper.diario`), jobs already
+    journaled by an interrupted run are not visited again and their rows are
+    taken from the journal, and every job that succeeds is journaled as soon
+    as it finishes.
+
+    With `prefetch` (Selenium extractors only), every driver gets a second
+    tab (`PestanasPrefetch`): before processing a page, the worker takes the
+    next ready job and starts loading it in the idle tab, so it loads while
+    the current table is being read.
+
+    Args:
+        drivers (list): Authenticated clients, one per thread. WebDriver
+            instances for the Selenium extractors, or HTTP sessions (the same
+            session may be repeated) for `EXTRACTORES_HTTP`.
+        trabajos (list[tuple[str, str]]): Jobs to process, as (page type,
+            course URL) tuples.
+        extractores (dict[str, Callable], optional): Function used for each
+            page type. Defaults to `EXTRACTORES_SELENIUM`.
+        reintentos (dict, optional): Options of the `PlanificadorRecorrido`
+            (settings "reintentos"). Defaults to `REINTENTOS_POR_DEFECTO`.
+        prefetch (bool, optional): Preload the next page in a second tab of
+            each WebDriver. Defaults to False.
+
+    Returns:
+        dict[str, list[dict[str, str]]]: A dictionary with the keys "notas"
+        and "actas" containing the extracted records in job order.
+    """
+    diario = diario_activo()
+    cache = cache_negativo_activo()
+    actas = cache_actas_activo()
+    pendientes = []
+    resultados = {}
+    omitidas = 0
+    compartidas = 0
+    for i, (tipo, curso_url) in enumerate(trabajos):
+        filas = diario.completado(tipo, curso_url) if diario else None
+        if filas is not None:
+            resultados[i] = filas
+        elif cache and cache.vigente(tipo, curso_url):
+            resultados[i] = []
+            omitidas += 1
+        elif tipo == "actas" and actas and (filas := actas.obtener(curso_url)) is not None:
+            resultados[i] = filas
+            compartidas += 1
+        else:
+            pendientes.append(i)
+    if diario and len(resultados) > omitidas + compartidas:
+        logger.info(f"ℹ️️ {len(resultados) - omitidas - compartidas} páginas recuperadas del diario, {len(pendientes)} pendientes")
+    if omitidas:
+        logger.info(f"ℹ️️ {omitidas} páginas sin notas o acta omitidas por el caché negativo")
+    if compartidas:
+        logger.info(f"ℹ️️ {compartidas} actas tomadas del caché compartido")
+    planificador = PlanificadorRecorrido(pendientes, **(REINTENTOS_POR_DEFECTO | (reintentos or {})))
+
+    def _procesar(driver, j: int, i: int, intento: int) -> None:
+        tipo, curso_url = trabajos[i]
+        try:
+            try:
+                with timeout_completo(intento > 0):
+                    resultados[i] = extractores[tipo](driver, curso_url)
+                if cache:
+                    cache.olvidar(tipo, curso_url)
+                if tipo == "actas" and actas:
+                    actas.guardar(curso_url, resultados[i])
+            except PaginaSinContenido as e:
+                # La página cargó pero no tiene la tabla: no se reintenta
+                logger.warning(f"⚠️ {e}")
+                resultados[i] = []
+                if cache:
+                    cache.registrar(tipo, curso_url)
+            if diario:
+                diario.registrar(tipo, curso_url, resultados[i])
+            planificador.exito(j)
+        except Exception as e:
+            espera = planificador.fallo(j, i, intento, e)
+            pagina = "notas" if tipo == "notas" else "acta"
+            if espera is None:
+                logger.warning(f"⚠️ Error cargando página de {pagina} ({curso_url}), se descarta: {e}")
+            else:
+                logger.warning(f"⚠️ Error cargando página de {pagina} ({curso_url}), reintento en {espera:.1f}s")
+
+    def _trabajador(driver) -> None:
+        if not prefetch:
+            while (siguiente := planificador.siguiente()) is not None:
+                _procesar(driver, *siguiente)
+            return
+        pestanas = PestanasPrefetch(driver)
+        try:
+            siguiente = planificador.siguiente()
+            while siguiente is not None:
+                # El trabajo que viene se carga en la otra pestaña mientras se procesa este
+                anticipado = planificador.siguiente(bloquear=False)
+                if anticipado is not None:
+                    tipo, curso_url = trabajos[anticipado[1]]
+                    pestanas.anticipar(curso_url + RUTAS_PAGINAS[tipo])
+                _procesar(pestanas, *siguiente)
+                siguiente = anticipado or planificador.siguiente()
+        finally:
+            pestanas.cerrar()
+
+    if len(drivers) == 1:
+        _trabajador(drivers[0])
+    else:
+        with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+            for futuro in [executor.submit(_trabajador, driver) for driver in drivers]:
+                futuro.result()
+    if planificador.fallidos:
+        logger.warning(f"⚠️ {len(planificador.fallidos)} páginas de cursos no se pudieron cargar")
+
+    datos = {"notas": [], "actas": []}
+    for i, (tipo, _) in enumerate(trabajos):
+        datos[tipo].extend(resultados.get(i, []))
+    return(datos)
+
 def data_notas(
     driver: WebDriver,
-    urls_cursos_alumno: list[str]
+    urls_cursos_alumno: list[str],
+    reintentos: Optional[dict] = None,
+    prefetch: bool = False
 ) -> pd.DataFrame:
     """
     Extract evaluation names and grades from each course page and return them
@@ -70,6 +467,9 @@ def data_notas(
         driver (WebDriver): A Selenium WebDriver instance used to navigate the
             course pages.
         urls_cursos_alumno (list[str]): List of URLs for the student's courses.
+        reintentos (dict, optional): Retry options (see `recorrer_cursos`).
+        prefetch (bool, optional): Preload the next page in a second tab
+            (see `recorrer_cursos`). Defaults to False.
 
     Returns:
         pandas.DataFrame: A DataFrame containing the extracted data with the
@@ -78,54 +478,22 @@ def data_notas(
             - "Evaluación" (str): The name of the evaluation.
             - "Promedio" (str): The grade or score of the evaluation.
 
-    Raises:
-        Exception: If a page cannot be loaded, if the grades table cannot be
-        found, or if row extraction fails. Exceptions are logged and re-raised.
+    Note:
+        Page failures do not raise: `recorrer_cursos` retries them with
+        backoff, and the pages that fail every attempt are logged, recorded
+        in `planificador.fallidos` and left out of the result.
     """
     logger.info("📦Recuperando notas obtenidas por ramo")
-    notas_data = []
-    for curso_url in urls_cursos_alumno:
-        link_notas = curso_url + 'notas/alumno'
-        try:
-            driver.get(link_notas)
-            time.sleep(2)
-
-            # Encuentra la tabla correcta
-            tables = driver.find_elements(By.TAG_NAME, "table")
-            target_table = next(
-                (table for table in tables
-                if "Evaluación" in [th.text.strip() for th in table.find_elements(By.TAG_NAME, "th")]
-                and any("Prom" in th.text.strip() for th in table.find_elements(By.TAG_NAME, "th"))),
-                None
-            )
-
-            if target_table:
-                rows = target_table.find_elements(By.XPATH, ".//tbody/tr[not(contains(@class, 'separador'))]")
-                for row in rows:
-                    try:
-                        cols = row.find_elements(By.TAG_NAME, "td")
-                        evaluacion = cols[0].find_element(By.TAG_NAME, "h1").text.strip()
-                        promedio = cols[-1].find_element(By.TAG_NAME, "span").text.strip()
-                        notas_data.append({
-                            "Curso URL": curso_url,
-                            "Evaluación": evaluacion,
-                            "Promedio": promedio
-                        })
-                        
-                    except Exception as e:
-                        logger.warning(f"⚠️ Could not extract row: {e}")
-            else:
-                logger.warning(f"⚠️ Tabla de notas no encontrada en {link_notas}")
-        
-        except Exception as e:
-            logger.warning(f"⚠️ Error cargando página de notas")
+    notas_data = recorrer_cursos([driver], [("notas", url) for url in urls_cursos_alumno], reintentos=reintentos, prefetch=prefetch)["notas"]
     logger.info(f"ℹ️️ Total de notas registradas: {len(notas_data)}")
     logger.info(f"✅ Recuperación de notas finalizada")
     return(pd.DataFrame(notas_data))
 
 def data_actas(
     driver: WebDriver,
-    urls_cursos_alumno: list[str]
+    urls_cursos_alumno: list[str],
+    reintentos: Optional[dict] = None,
+    prefetch: bool = False
 ) -> pd.DataFrame:
     """
     Extract acta (record) information from each course page and return it as a
@@ -143,6 +511,9 @@ def data_actas(
             course pages.
         urls_cursos_alumno (list[str]): List of course URLs belonging to the
             student.
+        reintentos (dict, optional): Retry options (see `recorrer_cursos`).
+        prefetch (bool, optional): Preload the next page in a second tab
+            (see `recorrer_cursos`). Defaults to False.
 
     Returns:
         pandas.DataFrame: A DataFrame with one row per indicator containing the
@@ -151,48 +522,85 @@ def data_actas(
             - "Indicador" (str): The label or indicator extracted from the table row.
             - "Valor" (str): The value associated with the indicator.
 
-    Raises:
-        Exception: If a page cannot be loaded, the acta table is not found,
-        or row extraction fails. Exceptions are logged before being raised.
+    Note:
+        Page failures do not raise: `recorrer_cursos` retries them with
+        backoff, and the pages that fail every attempt are logged, recorded
+        in `planificador.fallidos` and left out of the result.
     """
     logger.info("📦 Recuperando estadísticas de las actas")
-    acta_data = []
-    for curso_url in urls_cursos_alumno:
-        link_acta = curso_url + 'actas/'
-        try:
-            driver.get(link_acta)
-            time.sleep(2)
-
-            table = driver.find_element(By.CSS_SELECTOR, "table.detalle")
-            rows = table.find_elements(By.TAG_NAME, "tr")
-
-            for row in rows:
-                try:
-                    cols = row.find_elements(By.TAG_NAME, "th") + row.find_elements(By.TAG_NAME, "td")
-                    if len(cols) == 1:
-                        label = cols[0].text.strip()
-                        value = ""
-                    elif len(cols) >= 2:
-                        label = cols[0].text.strip()
-                        value = cols[1].text.strip()
-                    else:
-                        continue
-                    acta_data.append({
-                        "Curso URL": curso_url,
-                        "Indicador": label,
-                        "Valor": value
-                    })
-                except Exception as e:
-                    logger.warning(f"⚠️ Error parsing row in acta")
-        except Exception as e:
-            logger.warning(f"⚠️ Error cargando página de acta")
+    acta_data = recorrer_cursos([driver], [("actas", url) for url in urls_cursos_alumno], reintentos=reintentos, prefetch=prefetch)["actas"]
     logger.info(f"ℹ️️ Total de actas registradas: {len(acta_data)}")
     logger.info(f"✅ Recuperación de estadísticas de actas finalizada")
     return(pd.DataFrame(acta_data))        
+
+def _urls_con_pagina(
+    urls_cursos_alumno: list[str],
+    tipo: str,
+    paginas_por_curso: Optional[dict[str, list[str]]]
+) -> list[str]:
+    if paginas_por_curso is None:
+        return(urls_cursos_alumno)
+    return([url for url in urls_cursos_alumno if tipo in paginas_por_curso.get(url, ("notas", "actas"))])
+
+def data_ucursos_paralelo(
+    drivers: list,
+    urls_cursos_alumno: list[str],
+    extractores: dict[str, Callable] = EXTRACTORES_SELENIUM,
+    reintentos: Optional[dict] = None,
+    paginas_por_curso: Optional[dict[str, list[str]]] = None,
+    prefetch: bool = False
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Extract grades and acta data spreading the course pages across several
+    authenticated WebDrivers.
+
+    Both the notas and the actas pages of every course are queued together
+    and processed by `recorrer_cursos`, so all drivers stay busy until the
+    last page is visited. The resulting DataFrames are identical to the ones
+    returned by `data_notas` and `data_actas`.
+
+    Args:
+        drivers (list): Authenticated clients, one per thread (see
+            `recorrer_cursos`).
+        urls_cursos_alumno (list[str]): List of URLs for the student's courses.
+        extractores (dict[str, Callable], optional): Function used for each
+            page type. Defaults to `EXTRACTORES_SELENIUM`.
+        reintentos (dict, optional): Retry options (see `recorrer_cursos`).
+        paginas_por_curso (dict[str, list[str]], optional): Page types to
+            visit for each URL (see `clasificacion.clasificar_cursos`). URLs
+            missing from the dictionary get both pages. Defaults to None
+            (notas and actas for every course).
+        prefetch (bool, optional): Preload the next page in a second tab of
+            each WebDriver (see `recorrer_cursos`). Defaults to False.
+
+    Returns:
+        tuple[pandas.DataFrame, pandas.DataFrame]: The notas DataFrame and the
+        actas DataFrame, with the same columns as `data_notas` and
+        `data_actas`.
+    """
+    logger.info(f"📦 Recuperando notas y actas con {len(drivers)} sesiones en paralelo")
+    trabajos = (
+        [("notas", url) for url in _urls_con_pagina(urls_cursos_alumno, "notas", paginas_por_curso)]
+        + [("actas", url) for url in _urls_con_pagina(urls_cursos_alumno, "actas", paginas_por_curso)]
+    )
+    datos = recorrer_cursos(drivers, trabajos, extractores, reintentos, prefetch)
+    logger.info(f"ℹ️️ Total de notas registradas: {len(datos['notas'])}")
+    logger.info(f"ℹ️️ Total de actas registradas: {len(datos['actas'])}")
+    return(pd.DataFrame(datos["notas"]), pd.DataFrame(datos["actas"]))
     
 def extraer_datos_ucursos(
     driver: WebDriver,
-    urls_cursos_alumno: list[str]
+    urls_cursos_alumno: list[str],
+    workers: int = 1,
+    crear_driver: Optional[Callable[[], WebDriver]] = None,
+    backend: str = "selenium",
+    datos_previos: Optional[dict[str, pd.DataFrame]] = None,
+    ventana_periodos: int = 1,
+    sesion_http: Optional[requests.Session] = None,
+    reintentos: Optional[dict] = None,
+    paginas_por_curso: Optional[dict[str, list[str]]] = None,
+    prefetch: bool = False,
+    pestanas: bool = False
 ) -> dict[str, pd.DataFrame]:
     """
     Extract grades and acta data from U-Cursos and return them in a dictionary
@@ -205,9 +613,66 @@ def extraer_datos_ucursos(
     extraction process fails, an empty or partially filled dictionary is
     returned.
 
+    When `workers` is greater than one and a `crear_driver` factory is
+    given, `workers - 1` additional browsers are started, they receive the
+    session cookies of `driver` (no extra logins), and the course pages are
+    spread across all of them with `data_ucursos_paralelo`. The additional
+    browsers are always closed before returning. If they cannot be created,
+    the crawl falls back to the single `driver`. With `pestanas`, the
+    workers use tabs of `driver` instead (`navegador.PoolPestanas`): one
+    browser, no extra logins and much less memory.
+
+    With `backend="http"` no page is rendered: the cookies of `driver` are
+    exported into a pooled HTTP session (`crear_sesion_http`), the notas and
+    actas pages are downloaded as raw HTML by `workers` threads and parsed
+    with lxml. The resulting DataFrames are the same as with Selenium. If
+    `sesion_http` is given (e.g. from `cliente_http.login_http`), it is used
+    instead and `driver` may be None, so no browser is needed at all.
+
+    When `datos_previos` is given (incremental mode, see
+    `core.scrapper.incremental`), courses from closed periods that already
+    have rows in the previous run are not visited again: only the courses of
+    the current period and of the last `ventana_periodos` periods are
+    downloaded, and their rows are merged with the cached ones.
+
+    When `paginas_por_curso` is given (see `clasificacion.clasificar_cursos`),
+    each course is only asked for the page types listed for it.
+
+    With `prefetch` and the "selenium" backend, every browser preloads the
+    next course page in a second tab while the current one is read (see
+    `recorrer_cursos`). With a single browser the notas and actas pages are
+    then crawled as one queue so the preloading never stops in between.
+
     Args:
         driver (WebDriver): A Selenium WebDriver instance pointing to U-Cursos.
         urls_cursos_alumno (list[str]): List of URLs for the student's courses.
+        workers (int, optional): Number of browsers used to visit the course
+            pages. Defaults to 1 (sequential crawl).
+        crear_driver (Callable[[], WebDriver], optional): Factory used to
+            create the additional browsers. Required when `workers > 1`.
+        backend (str, optional): "selenium" to render every page in Chrome
+            or "http" to download and parse the pages without a browser.
+            Defaults to "selenium".
+        datos_previos (dict[str, pandas.DataFrame], optional): Sheets of the
+            previous run (see `cargar_datos_previos`). Defaults to None (full
+            crawl).
+        ventana_periodos (int, optional): Number of past periods that are
+            always downloaded again in incremental mode. Defaults to 1.
+        sesion_http (requests.Session, optional): Authenticated HTTP session
+            for the "http" backend. Defaults to None (the session is created
+            from the cookies of `driver`).
+        reintentos (dict, optional): Options of the retry scheduler (settings
+            "reintentos", see `recorrer_cursos`). Defaults to None (default
+            options).
+        paginas_por_curso (dict[str, list[str]], optional): Page types to
+            visit for each URL. Defaults to None (notas and actas for every
+            course).
+        prefetch (bool, optional): Preload the next page in a second tab
+            ("selenium" backend only, ignored with `pestanas`). Defaults to
+            False.
+        pestanas (bool, optional): Spread the course pages across `workers`
+            tabs of `driver` instead of additional browsers. Defaults to
+            False.
 
     Returns:
         dict[str, pandas.DataFrame]: A dictionary containing:
@@ -222,16 +687,68 @@ def extraer_datos_ucursos(
     """
     logger.info("🚀 Inicio webscrapping de u-cursos")
     df_dict = {}
+    drivers_extra = []
+    pool = None
+    urls_reutilizadas = []
+    if datos_previos:
+        urls_cursos_alumno_todas = urls_cursos_alumno
+        urls_cursos_alumno, urls_reutilizadas = separar_cursos(
+            urls_cursos_alumno, datos_previos, ventana_periodos, paginas_por_curso=paginas_por_curso
+        )
+        logger.info(
+            f"ℹ️️ Modo incremental: {len(urls_reutilizadas)} cursos cerrados desde la corrida anterior, "
+            f"{len(urls_cursos_alumno)} por descargar"
+        )
     try:
-        df_notas = data_notas(driver,urls_cursos_alumno)
-        df_actas = data_actas(driver,urls_cursos_alumno)
+        if not urls_cursos_alumno:
+            df_notas, df_actas = pd.DataFrame(), pd.DataFrame()
+        elif backend == "http":
+            sesion = sesion_http or crear_sesion_http(driver, pool_size=max(workers, 1))
+            df_notas, df_actas = data_ucursos_paralelo(
+                [sesion] * max(workers, 1),
+                urls_cursos_alumno,
+                EXTRACTORES_HTTP,
+                reintentos,
+                paginas_por_curso
+            )
+        else:
+            if workers > 1 and pestanas:
+                try:
+                    pool = PoolPestanas(driver, workers)
+                except Exception:
+                    logger.warning("⚠️ No se pudo crear el pool de pestañas, se continúa con un solo driver")
+            elif workers > 1 and crear_driver is not None:
+                try:
+                    drivers_extra = crear_pool_sesiones(driver, workers - 1, crear_driver)
+                except Exception:
+                    logger.warning("⚠️ No se pudieron crear sesiones adicionales, se continúa con un solo driver")
+            if pool is not None:
+                df_notas, df_actas = data_ucursos_paralelo(
+                    [pool.arrendar() for _ in range(workers)], urls_cursos_alumno, reintentos=reintentos,
+                    paginas_por_curso=paginas_por_curso
+                )
+            elif drivers_extra or prefetch:
+                df_notas, df_actas = data_ucursos_paralelo(
+                    [driver] + drivers_extra, urls_cursos_alumno, reintentos=reintentos,
+                    paginas_por_curso=paginas_por_curso, prefetch=prefetch
+                )
+            else:
+                df_notas = data_notas(driver,_urls_con_pagina(urls_cursos_alumno, "notas", paginas_por_curso),reintentos)
+                df_actas = data_actas(driver,_urls_con_pagina(urls_cursos_alumno, "actas", paginas_por_curso),reintentos)
 
         df_dict = {
             "Notas_ucursos": df_notas,
             "Actas_ucursos": df_actas
         }
+        if datos_previos:
+            df_dict = combinar_datos(df_dict, datos_previos, urls_reutilizadas, urls_cursos_alumno_todas)
         logger.info("✅ Extracción de datos de u-cursos completada")
         return(df_dict)
     except Exception as e:
         logger.exception(f"❌ Error al extraer datos de u-cursos: {e}")
-        return(df_dict)
\ No newline at end of file
+        return(df_dict)
+    finally:
+        for driver_extra in drivers_extra:
+            driver_extra.quit()
+        if pool is not None:
+            pool.cerrar()
\ No newline at end of file
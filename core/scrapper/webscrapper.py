@@ -1,10 +1,24 @@
 from pathlib import Path
+from functools import partial
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+import time
 import getpass
-from core.scrapper.navegador import get_chrome_driver
-from core.scrapper.auth import login_generic
+from core.scrapper.navegador import get_chrome_driver, DriverGestionado, driver_gestionado, pool_grid
+from core.scrapper.auth import login_con_sesion
+from core.scrapper.sesiones import crear_almacen_sesiones
+from core.scrapper.cliente_http import login_http, obtener_html
+from core.scrapper.parsers import parsear_id_usuario, parsear_urls_cursos, parsear_cursos
 from core.scrapper.ucampus import extraer_datos_ucampus
 from core.scrapper.ucursos import urls_cursos,extraer_datos_ucursos
 from core.scrapper.excel_exporter import excel_exporter
+from core.scrapper.esperas import configurar as configurar_esperas, reiniciar_registro, resumen_esperas
+from core.scrapper.snapshots import activar_snapshots, desactivar_snapshots, guardar_snapshot
+from core.scrapper.incremental import cargar_datos_previos
+from core.scrapper.diario import activar_diario, desactivar_diario
+from core.scrapper.cache_negativo import activar_cache_negativo, desactivar_cache_negativo
+from core.scrapper.cache_actas import activar_cache_actas, desactivar_cache_actas
+from core.scrapper.clasificacion import clasificar_cursos
 import os
 import logging
 from config.logger import setup_logger
@@ -16,77 +30,301 @@ setup_logger()
 logger = logging.getLogger(__name__)
 # Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
 
-def scrapper(settings,base_path):        
-    # Usar valores
-    headless = settings["headless"]
-    salida = Path(settings["output_dir"])
-    path = os.path.join(base_path,salida)
+def pipeline_ucampus(settings, path, rut, url_ucampus, USERNAME, PASSWORD, almacen, crear_driver, driver):
+    """
+    Log in to U-Campus, extract all its data and export "data_UCAMPUS_<rut>".
 
-    #Crear driver
-    driver = get_chrome_driver(
-        headless=headless,
-        disable_gpu=settings.get("disable_gpu", False),
-        colab_mode=settings.get("colab_mode", False)
-    )
+    Errors are logged and reported through the return value, so this
+    pipeline never interrupts the U-Cursos one running next to it.
+
+    Args:
+        settings (dict): Configuration dictionary.
+        path (str): Output directory.
+        rut (str): RUT of the student.
+        url_ucampus (str): URL of the historial page of the student.
+        USERNAME (str): User name for the login.
+        PASSWORD (str): Password for the login.
+        almacen (AlmacenSesiones | None): Encrypted session store used to
+            skip the login when the saved cookies are still valid.
+        crear_driver (Callable[[], WebDriver]): Factory for extra browsers.
+        driver (WebDriver): Browser dedicated to this pipeline.
 
-    #Input usuario
-    USERNAME = input("Usuario: ")
-    PASSWORD = getpass.getpass("Clave: ")
-    rut = input("Rut: ")
-    facultad = input("Facultad (fcfm o medicina): ")
-
-    ## UCAMPUS
-    
-    url_ucampus = f"https://ucampus.uchile.cl/m/fcfm_bia/historial?rut={rut}" # Ruta del historial académico
-    if facultad == "medicina":
-        url_ucampus = f"https://ucampus.uchile.cl/m/medicina_bia/historial?rut={rut}" # Ruta del historial académico
-    
+    Returns:
+        bool: True if the data was exported.
+    """
     ucampus_selectors = {
         "username": ("name", "username"),
         "password": ("name", "password"),
         "submit": ("css selector", "input[type='submit']")
     }
     success_check = ("id", "navigation-wrapper")
+    try:
+        inicio = time.perf_counter()
+        login_con_sesion(driver, url_ucampus, USERNAME, PASSWORD, ucampus_selectors, success_check, almacen)
+
+        df_dict_ucampus = extraer_datos_ucampus(
+            driver,
+            backend=settings.get("ucampus_backend", "selenium"),
+            ub_workers=settings.get("ub_workers", 1),
+            workers=settings.get("ucampus_workers", 1),
+            crear_driver=crear_driver,
+            pestanas=settings.get("pool_pestanas", False)
+        )
+        file_name = f"data_UCAMPUS_{rut}" 
+        excel_exporter(file_name, path, df_dict_ucampus)
+        logger.info(f"⏱️ Pipeline ucampus terminado en {time.perf_counter() - inicio:.1f}s")
+        return(True)
+    except Exception as e:
+        logger.exception(f"❌ Error en pipeline de ucampus: {e}")
+        return(False)
+
+def pipeline_ucursos(settings, path, rut, USERNAME, PASSWORD, almacen, crear_driver, driver):
+    """
+    Log in to U-Cursos, crawl the notas and actas of every course and export
+    "data_UCURSOS_<rut>".
 
-    login_generic(driver, url_ucampus, USERNAME, PASSWORD, ucampus_selectors, success_check)
+    With "login_http" enabled and the "http" backend, the login, the course
+    list and the course pages are all fetched with plain HTTP requests
+    (`login_http`), without using a browser. If the HTTP login fails, the
+    pipeline falls back to Selenium.
 
-    
-    df_dict_ucampus = extraer_datos_ucampus(driver)
-    file_name = f"data_UCAMPUS_{rut}" 
-    excel_exporter(file_name, path, df_dict_ucampus)
+    With "clasificar_cursos" enabled, every entry of the course list is
+    classified first (`clasificar_cursos`) and only the page types that make
+    sense for it are crawled.
 
-    ## UCURSOS
-    url_ucursos = 'https://www.u-cursos.cl/'
+    Errors are logged and reported through the return value, so this
+    pipeline never interrupts the U-Campus one running next to it.
+
+    Args:
+        settings (dict): Configuration dictionary.
+        path (str): Output directory.
+        rut (str): RUT of the student.
+        USERNAME (str): User name for the login.
+        PASSWORD (str): Password for the login.
+        almacen (AlmacenSesiones | None): Encrypted session store used to
+            skip the login when the saved cookies are still valid.
+        crear_driver (Callable[[], WebDriver]): Factory for extra browsers.
+        driver (WebDriver | None): Browser dedicated to this pipeline. If
+            None, a browser is only created when it is needed.
+
+    Returns:
+        bool: True if the data was exported.
+    """
+    base_ucursos = settings.get("url_ucursos", "https://www.u-cursos.cl").rstrip("/")
+    url_ucursos = f"{base_ucursos}/"
     ucursos_selectors = {
         "username": ("name", "username"),
         "password": ("name", "password"),
         "submit": ("css selector", "input[type='submit']")
     }
     success_check = ("id", "navigation-wrapper")
+    driver_propio = None
+    try:
+        inicio = time.perf_counter()
+        sesion_http = None
+        if settings.get("login_http", False) and settings.get("ucursos_backend", "selenium") == "http":
+            try:
+                sesion_http = login_http(
+                    url_ucursos, USERNAME, PASSWORD, ucursos_selectors, success_check,
+                    pool_size=max(settings.get("ucursos_workers", 1), 1)
+                )
+                # Sin navegador: id de usuario y lista de cursos desde el HTML
+                user_id = parsear_id_usuario(obtener_html(sesion_http, url_ucursos))
+                if user_id is None:
+                    raise ValueError("no se encontró el id de usuario")
+            except Exception as e:
+                logger.warning(f"⚠️ Login HTTP fallido, se usa el navegador: {e}")
+                sesion_http = None
+
+        clasificar = settings.get("clasificar_cursos", False)
+        paginas_por_curso = None
+        if sesion_http is not None:
+            url = f"{base_ucursos}/usuario/{user_id}/todos_cursos/"
+            html = obtener_html(sesion_http, url)
+            guardar_snapshot(url, html, "cursos")
+            if not clasificar:
+                urls_cursos_alumno = parsear_urls_cursos(html, url)
+        else:
+            if driver is None:
+                driver = driver_propio = crear_driver()
+            login_con_sesion(driver, url_ucursos, USERNAME, PASSWORD, ucursos_selectors, success_check, almacen)
+
+            # find all elements with a class attribute
+            elements = driver.find_elements(By.XPATH, "//*[@class]")
+
+            usuario_classes = set()
+            for el in elements:
+                for c in el.get_attribute("class").split(): #type: ignore
+                    if c.startswith("usuario"):
+                        usuario_classes.add(c)
+            usuario_classes = list(usuario_classes)
+            user_id = usuario_classes[0].split(".")[1]
+            
+            #user_id = [id.split("/") for id in driver.current_url.split("usuario/")][1][0]
+            url = f"{base_ucursos}/usuario/{user_id}/todos_cursos/"
+            driver.get(url)
+
+            if clasificar:
+                html = driver.page_source
+                guardar_snapshot(driver.current_url, html, "cursos")
+            else:
+                urls_cursos_alumno = urls_cursos(driver)
+
+        if clasificar:
+            cursos = clasificar_cursos(parsear_cursos(html, url))
+            urls_cursos_alumno = [curso["url"] for curso in cursos if curso["paginas"]]
+            paginas_por_curso = {curso["url"]: curso["paginas"] for curso in cursos}
+
+        file_name = f"data_UCURSOS_{rut}" 
+        datos_previos = None
+        if settings.get("ucursos_incremental", False):
+            datos_previos = cargar_datos_previos(os.path.join(path, f"{file_name}.xlsx"))
+        df_dict_ucursos = extraer_datos_ucursos(
+            driver,
+            urls_cursos_alumno,
+            workers=settings.get("ucursos_workers", 1),
+            crear_driver=crear_driver,
+            backend=settings.get("ucursos_backend", "selenium"),
+            datos_previos=datos_previos,
+            ventana_periodos=settings.get("ucursos_ventana_periodos", 1),
+            sesion_http=sesion_http,
+            reintentos=settings.get("reintentos"),
+            paginas_por_curso=paginas_por_curso,
+            prefetch=settings.get("ucursos_prefetch", False),
+            pestanas=settings.get("pool_pestanas", False)
+        )
+
+        excel_exporter(file_name,path,df_dict_ucursos)
+        logger.info(f"⏱️ Pipeline ucursos terminado en {time.perf_counter() - inicio:.1f}s")
+        return(True)
+    except Exception as e:
+        logger.exception(f"❌ Error en pipeline de ucursos: {e}")
+        return(False)
+    finally:
+        if driver_propio is not None:
+            driver_propio.quit()
+
+def scrapper(settings,base_path,reanudar=False,credenciales=None):        
+    # Usar valores
+    headless = settings["headless"]
+    salida = Path(settings["output_dir"])
+    path = os.path.join(base_path,salida)
+    # Timeouts de esta corrida (el benchmark y el batch los pueden cambiar) y
+    # registro de esperas propio, sin las de estudiantes o backends anteriores
+    configurar_esperas(settings)
+    reiniciar_registro()
+
+    #Input usuario (o credenciales entregadas por el batch)
+    if credenciales is None:
+        USERNAME = input("Usuario: ")
+        PASSWORD = getpass.getpass("Clave: ")
+        rut = input("Rut: ")
+        facultad = input("Facultad (fcfm o medicina): ")
+    else:
+        USERNAME = credenciales["usuario"]
+        PASSWORD = credenciales["clave"]
+        rut = credenciales["rut"]
+        facultad = credenciales.get("facultad", "fcfm")
+
+    #Crear driver: local o de un grid remoto (con afinidad por rut), y se
+    # reemplaza según "reciclaje_navegador"
+    grid = None
+    if settings.get("grid", {}).get("urls"):
+        grid = pool_grid(
+            settings["grid"]["urls"],
+            settings["grid"].get("max_sesiones", 4),
+            settings["grid"].get("timeout", 300.0)
+        )
+    reciclaje = settings.get("reciclaje_navegador", {})
+    fabrica = partial(
+        get_chrome_driver,
+        headless=headless,
+        disable_gpu=settings.get("disable_gpu", False),
+        colab_mode=settings.get("colab_mode", False),
+        lean=settings.get("lean_browser", False),
+        perfil=os.path.join(base_path, settings["perfil_chrome_dir"]) if settings.get("perfil_chrome_dir") else None,
+        grid=grid,
+        afinidad=str(rut)
+    )
+    limites = {"max_paginas": reciclaje.get("max_paginas"), "max_rss_mb": reciclaje.get("max_rss_mb")}
+    crear_driver = partial(DriverGestionado, fabrica, **limites)
+
+    # Todo lo abierto aquí (navegadores, snapshots, diario, caché) se cierra
+    # al salir, también si hay una excepción
+    with ExitStack() as recursos:
+        recursos.callback(resumen_esperas)
+        driver = recursos.enter_context(driver_gestionado(fabrica, **limites))
+
+        if settings.get("snapshots", False):
+            activar_snapshots(os.path.join(path, "snapshots"), rut)
+            recursos.callback(desactivar_snapshots)
+
+        # Sesiones guardadas (cifradas) para no repetir el login en cada corrida
+        almacen = None
+        if settings.get("sesiones_persistentes", False):
+            almacen = crear_almacen_sesiones(
+                os.path.join(base_path, settings.get("sesiones_dir", ".sesiones")), USERNAME, PASSWORD
+            )
+
+        # Diario de avance (permite reanudar con --resume)
+        activar_diario(os.path.join(path, f"journal_{rut}.jsonl"), reanudar)
+        recursos.callback(desactivar_diario)
+
+        # Páginas de cursos que se sabe que están vacías
+        if settings.get("cache_negativo", False):
+            activar_cache_negativo(os.path.join(path, f"cache_negativo_{rut}.json"), settings.get("cache_negativo_dias"))
+            recursos.callback(desactivar_cache_negativo)
+
+        # Actas de cursos compartidas entre estudiantes (el acta es de la sección)
+        if settings.get("cache_actas", False):
+            activar_cache_actas(os.path.join(path, settings.get("cache_actas_dir", "cache_actas")), settings.get("cache_actas_dias"))
+            recursos.callback(desactivar_cache_actas)
+
+        # Los sitios se pueden redirigir (ej. al servidor de fixtures del benchmark)
+        base_ucampus = settings.get("url_ucampus", "https://ucampus.uchile.cl").rstrip("/")
+        url_ucampus = f"{base_ucampus}/m/fcfm_bia/historial?rut={rut}" # Ruta del historial académico
+        if facultad == "medicina":
+            url_ucampus = f"{base_ucampus}/m/medicina_bia/historial?rut={rut}" # Ruta del historial académico
+
+        file_name = f"data_UCAMPUS_{rut}" 
+        omitir_ucampus = reanudar and os.path.exists(os.path.join(path, f"{file_name}.xlsx"))
+        if omitir_ucampus:
+            logger.info(f"ℹ️️ Reanudando: se reutiliza {file_name}.xlsx de la corrida interrumpida")
+
+        # Ambos sitios son independientes: con "pipelines_concurrentes" cada uno
+        # corre en su propio driver al mismo tiempo
+        concurrente = settings.get("pipelines_concurrentes", False) and not omitir_ucampus
+        sin_navegador_ucursos = settings.get("login_http", False) and settings.get("ucursos_backend", "selenium") == "http"
+        driver_ucursos = driver
+        if concurrente and sin_navegador_ucursos:
+            driver_ucursos = None
+        elif concurrente:
+            try:
+                driver_ucursos = recursos.enter_context(driver_gestionado(fabrica, **limites))
+            except Exception:
+                logger.warning("⚠️ No se pudo crear un segundo driver, los sitios se procesan en secuencia")
+                concurrente = False
+
+        pipelines = []
+        if not omitir_ucampus:
+            pipelines.append(("ucampus", driver, partial(
+                pipeline_ucampus, settings, path, rut, url_ucampus, USERNAME, PASSWORD, almacen, crear_driver
+            )))
+        pipelines.append(("ucursos", driver_ucursos, partial(
+            pipeline_ucursos, settings, path, rut, USERNAME, PASSWORD, almacen, crear_driver
+        )))
+
+        if concurrente:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futuros = [
+                    (nombre, executor.submit(pipeline, driver_pipeline))
+                    for nombre, driver_pipeline, pipeline in pipelines
+                ]
+                resultados = [(nombre, futuro.result()) for nombre, futuro in futuros]
+        else:
+            resultados = [(nombre, pipeline(driver_pipeline)) for nombre, driver_pipeline, pipeline in pipelines]
 
-    login_generic(driver, url_ucursos, USERNAME, PASSWORD, ucursos_selectors, success_check)
-
-    # find all elements with a class attribute
-    elements = driver.find_elements(By.XPATH, "//*[@class]")
-
-    usuario_classes = set()
-    for el in elements:
-        for c in el.get_attribute("class").split(): #type: ignore
-            if c.startswith("usuario"):
-                usuario_classes.add(c)
-    usuario_classes = list(usuario_classes)
-    user_id = usuario_classes[0].split(".")[1]
-    
-    #user_id = [id.split("/") for id in driver.current_url.split("usuario/")][1][0]
-    url = f"https://www.u-cursos.cl/usuario/{user_id}/todos_cursos/"
-    driver.get(url)
-
-    urls_cursos_alumno = urls_cursos(driver)
-    df_dict_ucursos = extraer_datos_ucursos(driver,urls_cursos_alumno)
-
-    file_name = f"data_UCURSOS_{rut}" 
-    excel_exporter(file_name,path,df_dict_ucursos)
-    
-    # Cerrar el driver
-    driver.quit()
-    return(str(rut))
\ No newline at end of file
+    fallidos = [nombre for nombre, ok in resultados if not ok]
+    if fallidos:
+        raise RuntimeError(f"Falló la extracción de: {', '.join(fallidos)}")
+    return(str(rut))
@@ -3,6 +3,7 @@ check_project_schema()
 
 import logging
 from config.logger import setup_logger
+import sys
 import json
 from pathlib import Path
 from core.cleaner.limpieza_datos import limpiar_datos
@@ -22,8 +23,8 @@ with open(Path("config/settings.json"), encoding="utf-8") as f:
 base_path = os.path.dirname(os.path.abspath(__file__))
 
 
-# Extracción de datos
-rut = scrapper(settings,base_path)
+# Extracción de datos (--resume continúa una corrida interrumpida)
+rut = scrapper(settings,base_path,reanudar="--resume" in sys.argv)
 
 #Limpieza de datos
 limpiar_datos(settings,base_path,rut)
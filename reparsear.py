@@ -0,0 +1,28 @@
+from config.integrity_checks import check_project_schema
+check_project_schema()
+
+import sys
+import logging
+from config.logger import setup_logger
+import json
+from pathlib import Path
+from core.cleaner.limpieza_datos import limpiar_datos
+import os
+from core.scrapper.reparseo import reparsear_snapshots
+
+#Setup de los logs
+setup_logger()
+logger = logging.getLogger(__name__)
+# Emojis: ✅ ❌ ⚠️ 📂 💾 ℹ️️ 🚀 📦 📊 🎨 🖊️ 📌 ➡️ 🎯 🏷️ 📏
+
+# Cargar configuración
+with open(Path("config/settings.json"), encoding="utf-8") as f:
+    settings = json.load(f)
+base_path = os.path.dirname(os.path.abspath(__file__))
+
+# Reparseo de los snapshots guardados (sin navegador)
+rut = sys.argv[1] if len(sys.argv) > 1 else input("Ingrese su RUT: ")
+reparsear_snapshots(settings,base_path,rut)
+
+#Limpieza de datos
+limpiar_datos(settings,base_path,rut)